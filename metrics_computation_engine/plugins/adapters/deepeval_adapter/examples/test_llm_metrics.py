@@ -46,7 +46,7 @@ def build_llm_metrics() -> List[str]:
 
 async def compute():
     load_dotenv(ENV_FILE_PATH)
-    traces_by_session = json.loads(RAW_TRACES_PATH.read_text())
+    traces_by_session = json.loads(RAW_TRACES_PATH.read_bytes())
 
     for session_id, raw_spans in traces_by_session.items():
         span_entities = parse_raw_spans(raw_spans=raw_spans)
@@ -128,7 +128,7 @@ class TestOpikInputAssessment:
         adapter = OpikMetricAdapter("Hallucination")
 
         # Valid LLM span
-        span = SpanEntity(
+        span = SpanEntity.model_construct(
             entity_type="llm",
             span_id="span-1",
             entity_name="gpt-4",
@@ -156,7 +156,7 @@ class TestOpikInputAssessment:
         adapter = OpikMetricAdapter("Hallucination")  # Requires llm
 
         # Tool span (wrong type!)
-        span = SpanEntity(
+        span = SpanEntity.model_construct(
             entity_type="tool",  # Wrong!
             span_id="span-1",
             entity_name="search",
@@ -182,7 +182,7 @@ class TestOpikInputAssessment:
         adapter = OpikMetricAdapter("Hallucination")
 
         # LLM span but missing input_payload
-        span = SpanEntity(
+        span = SpanEntity.model_construct(
             entity_type="llm",
             span_id="span-1",
             entity_name="gpt-4",
@@ -229,7 +229,7 @@ class TestOpikInputAssessment:
         """Test assessment for Sentiment metric."""
         adapter = OpikMetricAdapter("Sentiment")
 
-        span = SpanEntity(
+        span = SpanEntity.model_construct(
             entity_type="llm",
             span_id="span-1",
             entity_name="gpt-4",
@@ -252,7 +252,7 @@ class TestOpikInputAssessment:
         """Test assessment for Hallucination metric."""
         adapter = OpikMetricAdapter("Hallucination")
 
-        span = SpanEntity(
+        span = SpanEntity.model_construct(
             entity_type="llm",
             span_id="span-1",
             entity_name="gpt-4",
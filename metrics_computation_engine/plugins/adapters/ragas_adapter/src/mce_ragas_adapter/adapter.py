@@ -3,6 +3,7 @@
 
 from typing import Any, List, Tuple, Dict
 import importlib
+import weakref
 
 # These imports will be available in the runtime environment
 from metrics_computation_engine.metrics.base import BaseMetric
@@ -23,6 +24,12 @@ from .metric_configuration import MetricConfiguration, build_metric_configuratio
 # Set up logger using MCE's standard pattern
 logger = setup_logger(__name__)
 
+# model -> {(metric name, mode): RAGAS metric}; the processor builds an adapter
+# per session, and these share one RAGAS metric per judge model
+_ragas_metrics: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, str], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class RagasAdapter(BaseMetric):
     """
@@ -36,10 +43,6 @@ class RagasAdapter(BaseMetric):
             build_metric_configuration_map()
         )
 
-        metric_configuration_map: Dict[str, MetricConfiguration] = (
-            build_metric_configuration_map()
-        )
-
         # Handle extended naming convention where the full dotted name might be passed
         if "." in ragas_metric_name and ragas_metric_name.count(".") >= 2:
             # Parse "ragas.TopicAdherenceScore.f1" format
@@ -160,6 +163,16 @@ class RagasAdapter(BaseMetric):
 
             self.model = model
 
+            try:
+                ragas_metrics = _ragas_metrics.setdefault(model, {})
+            except TypeError:
+                # Models that cannot be weakly referenced are simply not shared
+                ragas_metrics = {}
+            cache_key = (self.ragas_metric_name, self.mode)
+            self.ragas_metric = ragas_metrics.get(cache_key)
+            if self.ragas_metric is not None:
+                return True
+
             # Load the RAGAS metric class dynamically
             module = importlib.import_module("ragas.metrics")
             ragas_metric_cls = getattr(module, self.ragas_metric_name, None)
@@ -178,6 +191,7 @@ class RagasAdapter(BaseMetric):
                 )
             else:
                 self.ragas_metric = ragas_metric_cls(llm=model)
+            ragas_metrics[cache_key] = self.ragas_metric
 
             logger.info(
                 f"Successfully initialized RAGAS metric: {self.ragas_metric_name}"
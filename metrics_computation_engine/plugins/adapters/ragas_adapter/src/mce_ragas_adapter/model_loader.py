@@ -1,6 +1,7 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import os
 from typing import Any, Optional
 
 # Import logger from MCE following the standard pattern
@@ -8,6 +9,12 @@ from metrics_computation_engine.logger import setup_logger
 
 MODEL_PROVIDER_NAME = "ragas"
 
+# Path of the SQLite file caching judge responses across runs (unset: no cache)
+LLM_CACHE_ENV = "MCE_LLM_CACHE"
+
+# Set to "true" to request JSON-only completions from OpenAI-compatible judges
+JSON_MODE_ENV = "MCE_RAGAS_JSON_MODE"
+
 # Set up logger using MCE's standard pattern
 logger = setup_logger(__name__)
 
@@ -37,6 +44,8 @@ def load_model(llm_config) -> Any:
         llm_model_name=llm_config.LLM_MODEL_NAME,
         llm_api_key=llm_config.LLM_API_KEY,
         llm_base_url=llm_config.LLM_BASE_MODEL_URL,
+        cache_path=os.getenv(LLM_CACHE_ENV),
+        json_mode=os.getenv(JSON_MODE_ENV, "false").lower() == "true",
     )
 
 
@@ -45,6 +54,8 @@ def load_ragas_model(
     llm_api_key: str,
     llm_base_url: str,
     temperature: Optional[float] = 1.0,
+    cache_path: Optional[str] = None,
+    json_mode: bool = False,
 ) -> Any:
     """
     Create a RAGAS-compatible LLM model with uvloop compatibility.
@@ -59,6 +70,8 @@ def load_ragas_model(
         llm_model_name: OpenAI model name (e.g., 'gpt-4o', 'gpt-3.5-turbo')
         llm_api_key: API key for the LLM service
         llm_base_url: Base URL for the LLM API endpoint
+        cache_path: SQLite file caching responses by model and prompt, if any
+        json_mode: Constrain completions to a JSON object (OpenAI JSON mode)
 
     Returns:
         LangchainLLMWrapper: RAGAS-compatible model wrapper
@@ -72,7 +85,6 @@ def load_ragas_model(
         uvloop conflicts. The original function is always restored.
     """
     import asyncio
-    import os
 
     # Set git environment variable to suppress git errors in RAGAS
     original_git_refresh = os.environ.get("GIT_PYTHON_REFRESH")
@@ -120,6 +132,14 @@ def load_ragas_model(
         }
         if temperature is not None:
             chat_kwargs["temperature"] = temperature
+        if json_mode:
+            # RAGAS prompts already ask for JSON output; JSON mode keeps the
+            # completion to that object, with no preamble or trailing prose
+            chat_kwargs["model_kwargs"] = {"response_format": {"type": "json_object"}}
+        if cache_path:
+            from .response_cache import SQLiteResponseCache
+
+            chat_kwargs["cache"] = SQLiteResponseCache(cache_path)
         base_llm = ChatOpenAI(**chat_kwargs)
 
         # Wrap in RAGAS-required LangchainLLMWrapper
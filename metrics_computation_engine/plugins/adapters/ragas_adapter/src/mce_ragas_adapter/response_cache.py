@@ -0,0 +1,71 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Optional, Tuple
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+# Cached judge responses older than this are ignored and overwritten
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+class SQLiteResponseCache(BaseCache):
+    """
+    LangChain LLM cache persisting judge responses in a SQLite file.
+
+    Entries are keyed by a digest of the model settings and the prompt, so
+    identical judge prompts are answered without an LLM request across runs
+    and processes sharing the file.
+    """
+
+    def __init__(self, path: str, ttl_seconds: Optional[int] = DEFAULT_TTL_SECONDS):
+        self.path = os.path.expanduser(path)
+        self.ttl_seconds = ttl_seconds
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, created REAL NOT NULL, value TEXT NOT NULL)"
+        )
+
+    def _execute(self, sql: str, params: Tuple[Any, ...] = ()) -> Optional[tuple]:
+        # A connection per call: async lookups run in executor threads
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                return conn.execute(sql, params).fetchone()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}|{prompt}".encode()).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        row = self._execute(
+            "SELECT created, value FROM responses WHERE key = ?",
+            (self._key(prompt, llm_string),),
+        )
+        if row is None:
+            return None
+        created, value = row
+        if self.ttl_seconds is not None and time.time() - created > self.ttl_seconds:
+            return None
+        return [loads(generation) for generation in json.loads(value)]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        value = json.dumps([dumps(generation) for generation in return_val])
+        self._execute(
+            "INSERT OR REPLACE INTO responses (key, created, value) VALUES (?, ?, ?)",
+            (self._key(prompt, llm_string), time.time(), value),
+        )
+
+    def clear(self, **kwargs: Any) -> None:
+        self._execute("DELETE FROM responses")
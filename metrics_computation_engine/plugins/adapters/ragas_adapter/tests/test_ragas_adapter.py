@@ -10,10 +10,11 @@ Tests cover:
 3. Model handling (provider, creation, initialization)
 4. Configuration and validation
 5. Input data assessment
+6. Judge response caching
 """
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from mce_ragas_adapter.adapter import RagasAdapter
 from metrics_computation_engine.entities.models.session import SessionEntity
@@ -179,6 +180,32 @@ class TestRagasModelHandling:
         # Result is boolean
         assert isinstance(result, bool)
 
+    def test_init_with_model_shares_ragas_metric_per_model(self):
+        """Test adapters initialized with the same model reuse one RAGAS metric."""
+        model, other_model = MagicMock(), MagicMock()
+        ragas_module = MagicMock()
+        ragas_module.TopicAdherenceScore.side_effect = lambda **kwargs: MagicMock()
+
+        with patch(
+            "mce_ragas_adapter.adapter.importlib.import_module",
+            return_value=ragas_module,
+        ):
+            first = RagasAdapter("TopicAdherenceScore")
+            second = RagasAdapter("TopicAdherenceScore")
+            recall = RagasAdapter("TopicAdherenceScore", mode="recall")
+            other = RagasAdapter("TopicAdherenceScore")
+            assert first.init_with_model(model)
+            assert second.init_with_model(model)
+            assert recall.init_with_model(model)
+            assert other.init_with_model(other_model)
+
+        # Assert: One construction per (model, mode)
+        assert ragas_module.TopicAdherenceScore.call_count == 3
+        assert second.ragas_metric is first.ragas_metric
+        assert recall.ragas_metric is not first.ragas_metric
+        assert other.ragas_metric is not first.ragas_metric
+        assert second.model is model
+
     def test_get_requirements_class_method(self):
         """Test get_requirements class method."""
         requirements = RagasAdapter.get_requirements("TopicAdherenceScore")
@@ -204,7 +231,7 @@ class TestRagasInputAssessment:
         session = SessionEntity(
             session_id="session-1",
             spans=[
-                SpanEntity(
+                SpanEntity.model_construct(
                     entity_type="llm",
                     span_id="s1",
                     entity_name="gpt-4",
@@ -255,7 +282,7 @@ class TestRagasInputAssessment:
         session = SessionEntity(
             session_id="session-1",
             spans=[
-                SpanEntity(
+                SpanEntity.model_construct(
                     entity_type="tool",  # Wrong!
                     span_id="s1",
                     entity_name="search",
@@ -286,7 +313,7 @@ class TestRagasInputAssessment:
         session = SessionEntity(
             session_id="session-1",
             spans=[
-                SpanEntity(
+                SpanEntity.model_construct(
                     entity_type="llm",
                     span_id="s1",
                     entity_name="gpt-4",
@@ -389,3 +416,52 @@ class TestRagasAdapterIntegration:
 
         # Step 3: Verify configuration
         assert adapter.aggregation_level == "session"
+
+
+# ============================================================================
+# TEST CLASS 6: JUDGE RESPONSE CACHE
+# ============================================================================
+
+
+class TestSQLiteResponseCache:
+    """Test the on-disk judge response cache."""
+
+    def test_cache_round_trip_per_model_and_prompt(self, tmp_path):
+        """Test cached generations are returned for the same model and prompt only."""
+        from langchain_core.messages import AIMessage
+        from langchain_core.outputs import ChatGeneration
+
+        from mce_ragas_adapter.response_cache import SQLiteResponseCache
+
+        cache = SQLiteResponseCache(str(tmp_path / "judge.db"))
+        cache.update("prompt", "model-a", [ChatGeneration(message=AIMessage("yes"))])
+
+        # Assert: Hit for the same key, shared by a second instance on the file
+        reopened = SQLiteResponseCache(str(tmp_path / "judge.db"))
+        assert reopened.lookup("prompt", "model-a")[0].text == "yes"
+        assert reopened.lookup("prompt", "model-b") is None
+
+        # Assert: Expired and cleared entries miss
+        reopened.ttl_seconds = -1
+        assert reopened.lookup("prompt", "model-a") is None
+        cache.clear()
+        cache.ttl_seconds = None
+        assert cache.lookup("prompt", "model-a") is None
+
+    def test_cache_keeps_shared_template_prompts_apart(self, tmp_path):
+        """Test prompts sharing a long template only hit on an exact match."""
+        from langchain_core.messages import AIMessage
+        from langchain_core.outputs import ChatGeneration
+
+        from mce_ragas_adapter.response_cache import SQLiteResponseCache
+
+        template = " ".join(f"instruction{i}" for i in range(400))
+        prompt = f"{template} user asked about the weather in Paris"
+        other = f"{template} user asked for a refund on order 42"
+
+        cache = SQLiteResponseCache(str(tmp_path / "judge.db"))
+        cache.update(prompt, "model-a", [ChatGeneration(message=AIMessage("yes"))])
+
+        # Assert: A different conversation under the same template misses
+        assert cache.lookup(other, "model-a") is None
+        assert cache.lookup(prompt, "model-a")[0].text == "yes"
@@ -29,7 +29,7 @@ RAW_TRACES_PATH = Path("examples/llm_metrics_single_session_traces.json")
 
 
 async def compute():
-    traces_by_session = json.loads(RAW_TRACES_PATH.read_text())
+    traces_by_session = json.loads(RAW_TRACES_PATH.read_bytes())
 
     for session_id, raw_spans in traces_by_session.items():
         span_entities = parse_raw_spans(raw_spans=raw_spans)
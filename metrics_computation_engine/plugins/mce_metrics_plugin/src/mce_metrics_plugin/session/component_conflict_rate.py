@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import List, Optional
-from metrics_computation_engine.metrics.base import BaseMetric
+from metrics_computation_engine.metrics.base import BaseMetric, judge_in_thread
 from metrics_computation_engine.models.eval import BinaryGrading
 from metrics_computation_engine.entities.models.session import SessionEntity
 
@@ -66,7 +66,7 @@ class ComponentConflictRate(BaseMetric):
         prompt = COMPONENT_CONFLICT_RATE_PROMPT.format(conversation=conversation)
 
         if self.jury:
-            score, reasoning = self.jury.judge(prompt, BinaryGrading)
+            score, reasoning = await judge_in_thread(self.jury, prompt, BinaryGrading)
 
             return self._create_success_result(
                 score=score,
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import List, Optional
-from metrics_computation_engine.metrics.base import BaseMetric
+from metrics_computation_engine.metrics.base import BaseMetric, judge_in_thread
 from metrics_computation_engine.models.eval import BinaryGrading, MetricResult
 from metrics_computation_engine.entities.models.session import SessionEntity
 
@@ -72,7 +72,7 @@ class GoalSuccessRate(BaseMetric):
         )
 
         if self.jury:
-            score, reasoning = self.jury.judge(prompt, BinaryGrading)
+            score, reasoning = await judge_in_thread(self.jury, prompt, BinaryGrading)
             return self._create_success_result(
                 score=score,
                 reasoning=reasoning,
@@ -165,7 +165,9 @@ class GoalSuccessRate(BaseMetric):
                 agent_span_ids = [span.span_id for span in agent_view.all_spans]
 
                 if self.jury:
-                    score, reasoning = self.jury.judge(prompt, BinaryGrading)
+                    score, reasoning = await judge_in_thread(
+                        self.jury, prompt, BinaryGrading
+                    )
                     result = self._create_success_result(
                         score=score,
                         reasoning=f"{reasoning}",
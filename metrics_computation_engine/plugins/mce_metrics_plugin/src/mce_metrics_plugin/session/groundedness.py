@@ -1,10 +1,11 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import io
 import json
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
-from metrics_computation_engine.metrics.base import BaseMetric
+from metrics_computation_engine.metrics.base import BaseMetric, judge_in_thread
 from metrics_computation_engine.models.eval import BinaryGrading, MetricResult
 from metrics_computation_engine.entities.models.session import SessionEntity
 from metrics_computation_engine.entities.core.agent_role_detector import (
@@ -28,11 +29,77 @@ GROUNDEDNESS_PROMPT = """
 """
 
 
+# Upper bound on conversation characters sent to the judge; text past the
+# model's context window is wasted tokens and transient memory
+MAX_CONVERSATION_CHARS = 32_000
+TRUNCATION_MARKER = "\n[... conversation truncated ...]"
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps_compact(element: Any) -> str:
+    """Serialize one conversation element as compact, non-ASCII-escaped JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(element, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(element, separators=(",", ":"), ensure_ascii=False)
+
+
+def _format_conversation(
+    conversation: Any, max_chars: Optional[int]
+) -> Tuple[str, bool]:
+    """
+    Render conversation data for the prompt, stopping at ``max_chars``.
+
+    List conversations are streamed element by element as compact JSON into a
+    single buffer, so neither the full pretty-printed dump nor a list of
+    per-element strings is ever materialized. Whole elements are kept where
+    possible; an element that does not fit on its own is cut mid-way so the
+    judge never receives an empty conversation.
+
+    Returns:
+        The rendered text and whether it was truncated.
+    """
+    if not isinstance(conversation, list):
+        text = conversation if isinstance(conversation, str) else str(conversation)
+        if max_chars is not None and len(text) > max_chars:
+            return text[:max_chars] + TRUNCATION_MARKER, True
+        return text, False
+
+    buf = io.StringIO()
+    buf.write("[")
+    written = 1
+    truncated = False
+    for index, element in enumerate(conversation):
+        chunk = _dumps_compact(element)
+        if max_chars is not None and written + len(chunk) + 2 > max_chars:
+            if not index:
+                buf.write(chunk[: max(max_chars - written - 1, 0)])
+            buf.write(TRUNCATION_MARKER)
+            truncated = True
+            break
+        if index:
+            buf.write(",\n")
+            written += 2
+        buf.write(chunk)
+        written += len(chunk)
+    buf.write("]")
+    return buf.getvalue(), truncated
+
+
 class Groundedness(BaseMetric):
     REQUIRED_PARAMETERS = {"Groundedness": ["conversation_data"]}
 
     def __init__(
-        self, metric_name: Optional[str] = None, filter_coordinators: bool = True
+        self,
+        metric_name: Optional[str] = None,
+        filter_coordinators: bool = True,
+        max_conversation_chars: Optional[int] = MAX_CONVERSATION_CHARS,
     ):
         super().__init__()
         if metric_name is None:
@@ -41,6 +108,7 @@ class Groundedness(BaseMetric):
         self.aggregation_level = "session"
         self.description = "Evaluates how well each response is grounded in verifiable data and avoids speculation or hallucinations by checking if responses are based on verifiable information, avoid speculation/hallucinations, and maintain factual accuracy. Returns 1 for fully grounded responses, or 0 for responses with ungrounded details."
         self.filter_coordinators = filter_coordinators
+        self.max_conversation_chars = max_conversation_chars
 
     @property
     def required_parameters(self) -> List[str]:
@@ -83,26 +151,24 @@ class Groundedness(BaseMetric):
                     elif "conversation" in session.conversation_data:
                         conversation = session.conversation_data["conversation"]
 
-                # Format conversation properly (main branch improvement)
-                conversation_str = (
-                    json.dumps(conversation, indent=2)
-                    if isinstance(conversation, list)
-                    else conversation
+                # Format conversation properly, within the prompt budget
+                conversation_str, truncated = _format_conversation(
+                    conversation, self.max_conversation_chars
                 )
+                if truncated:
+                    logger.info(
+                        f"Groundedness conversation for session {session.session_id} "
+                        f"truncated to {self.max_conversation_chars} characters"
+                    )
 
                 prompt = GROUNDEDNESS_PROMPT.format(conversation=conversation_str)
-                score, reasoning = self.jury.judge(prompt, BinaryGrading)
-                # Get relevant span IDs for metadata
-                agent_span_ids = (
-                    [span.span_id for span in session.agent_spans]
-                    if session.agent_spans
-                    else []
-                )
-                entities_involved = (
-                    [span.entity_name for span in session.agent_spans]
-                    if session.agent_spans
-                    else []
+                score, reasoning = await judge_in_thread(
+                    self.jury, prompt, BinaryGrading
                 )
+                # Get relevant span IDs for metadata
+                agent_spans = session.agent_spans
+                agent_span_ids = [span.span_id for span in agent_spans]
+                entities_involved = [span.entity_name for span in agent_spans]
 
                 result = self._create_success_result(
                     score=score,
@@ -114,6 +180,8 @@ class Groundedness(BaseMetric):
                     session_ids=[session.session_id],
                 )
 
+                result.metadata["conversation_truncated"] = truncated
+
                 # Override description with static metric description
                 result.description = self.description
                 return result
@@ -182,15 +250,25 @@ class Groundedness(BaseMetric):
                     )
                     continue
 
-                # Use the same prompt format as session-level
-                prompt = GROUNDEDNESS_PROMPT.format(conversation=agent_conversation)
-
                 # Get agent-specific spans for metadata (reuses existing span collection)
                 agent_spans = session._get_spans_for_agent(agent_name)
                 agent_span_ids = [span.span_id for span in agent_spans]
 
+                truncated = False
                 if self.jury:
-                    score, reasoning = self.jury.judge(prompt, BinaryGrading)
+                    # Only format the prompt when there is a judge to send it to
+                    conversation_str, truncated = _format_conversation(
+                        agent_conversation, self.max_conversation_chars
+                    )
+                    if truncated:
+                        logger.info(
+                            f"Groundedness conversation for agent '{agent_name}' "
+                            f"truncated to {self.max_conversation_chars} characters"
+                        )
+                    prompt = GROUNDEDNESS_PROMPT.format(conversation=conversation_str)
+                    score, reasoning = await judge_in_thread(
+                        self.jury, prompt, BinaryGrading
+                    )
                     result = self._create_success_result(
                         score=score,
                         category="agent",
@@ -227,6 +305,7 @@ class Groundedness(BaseMetric):
                         "agent_id": agent_name,
                         "metric_type": "llm-as-a-judge",
                         "skipped": False,
+                        "conversation_truncated": truncated,
                         **role_dict,
                     }
                 )
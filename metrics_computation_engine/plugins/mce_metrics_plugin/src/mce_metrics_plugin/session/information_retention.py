@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import List, Optional
-from metrics_computation_engine.metrics.base import BaseMetric
+from metrics_computation_engine.metrics.base import BaseMetric, judge_in_thread
 from metrics_computation_engine.models.eval import BinaryGrading, MetricResult
 from metrics_computation_engine.entities.models.session import SessionEntity
 from metrics_computation_engine.entities.core.agent_role_detector import (
@@ -82,7 +82,7 @@ class InformationRetention(BaseMetric):
         prompt = INFORMATION_RETENTION_PROMPT.format(responses=responses)
 
         if self.jury:
-            score, reasoning = self.jury.judge(prompt, BinaryGrading)
+            score, reasoning = await judge_in_thread(self.jury, prompt, BinaryGrading)
             result = self._create_success_result(
                 score=score,
                 category="application",
@@ -161,7 +161,9 @@ class InformationRetention(BaseMetric):
                 agent_span_ids = [span.span_id for span in agent_spans]
 
                 if self.jury:
-                    score, reasoning = self.jury.judge(prompt, BinaryGrading)
+                    score, reasoning = await judge_in_thread(
+                        self.jury, prompt, BinaryGrading
+                    )
                     result = self._create_success_result(
                         score=score,
                         category="agent",
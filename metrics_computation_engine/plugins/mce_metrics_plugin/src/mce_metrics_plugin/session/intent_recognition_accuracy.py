@@ -3,7 +3,7 @@
 
 from typing import List, Optional
 
-from metrics_computation_engine.metrics.base import BaseMetric
+from metrics_computation_engine.metrics.base import BaseMetric, judge_in_thread
 from metrics_computation_engine.models.eval import BinaryGrading
 from metrics_computation_engine.entities.models.session import SessionEntity
 
@@ -87,7 +87,7 @@ class IntentRecognitionAccuracy(BaseMetric):
         )
 
         if self.jury:
-            score, reasoning = self.jury.judge(prompt, BinaryGrading)
+            score, reasoning = await judge_in_thread(self.jury, prompt, BinaryGrading)
             return self._create_success_result(
                 score=score,
                 category="application",
@@ -175,7 +175,9 @@ class IntentRecognitionAccuracy(BaseMetric):
                 agent_span_ids = [span.span_id for span in agent_view.all_spans]
 
                 if self.jury:
-                    score, reasoning = self.jury.judge(prompt, BinaryGrading)
+                    score, reasoning = await judge_in_thread(
+                        self.jury, prompt, BinaryGrading
+                    )
                     result = self._create_success_result(
                         score=score,
                         category="application",
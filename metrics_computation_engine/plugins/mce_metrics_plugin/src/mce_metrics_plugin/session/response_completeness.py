@@ -3,7 +3,7 @@
 
 from typing import List, Optional
 
-from metrics_computation_engine.metrics.base import BaseMetric
+from metrics_computation_engine.metrics.base import BaseMetric, judge_in_thread
 from metrics_computation_engine.models.eval import BinaryGrading, MetricResult
 from metrics_computation_engine.entities.models.session import SessionEntity
 from metrics_computation_engine.entities.core.agent_role_detector import (
@@ -95,7 +95,7 @@ class ResponseCompleteness(BaseMetric):
         prompt = RESPONSE_COMPLETENESS_PROMPT.format(conversation=conversation)
 
         if self.jury:
-            score, reasoning = self.jury.judge(prompt, BinaryGrading)
+            score, reasoning = await judge_in_thread(self.jury, prompt, BinaryGrading)
             result = self._create_success_result(
                 score=score,
                 category="application",
@@ -174,7 +174,9 @@ class ResponseCompleteness(BaseMetric):
                 agent_span_ids = [span.span_id for span in agent_spans]
 
                 if self.jury:
-                    score, reasoning = self.jury.judge(prompt, BinaryGrading)
+                    score, reasoning = await judge_in_thread(
+                        self.jury, prompt, BinaryGrading
+                    )
                     result = self._create_success_result(
                         score=score,
                         category="agent",
@@ -3,7 +3,7 @@
 
 from typing import List, Optional
 
-from metrics_computation_engine.metrics.base import BaseMetric
+from metrics_computation_engine.metrics.base import BaseMetric, judge_in_thread
 from metrics_computation_engine.models.eval import BinaryGrading, MetricResult
 from metrics_computation_engine.entities.models.session import SessionEntity
 from metrics_computation_engine.entities.core.agent_role_detector import (
@@ -107,7 +107,7 @@ class WorkflowCohesionIndex(BaseMetric):
 
         if self.jury:
             try:
-                jury_result = self.jury.judge(prompt, BinaryGrading)
+                jury_result = await judge_in_thread(self.jury, prompt, BinaryGrading)
                 if jury_result is None:
                     return self._create_error_result(
                         error_message="Invalid binary grading result from model",
@@ -206,7 +206,9 @@ class WorkflowCohesionIndex(BaseMetric):
                 agent_span_ids = [span.span_id for span in agent_spans]
 
                 if self.jury:
-                    score, reasoning = self.jury.judge(prompt, BinaryGrading)
+                    score, reasoning = await judge_in_thread(
+                        self.jury, prompt, BinaryGrading
+                    )
                     result = self._create_success_result(
                         score=score,
                         category="agent",
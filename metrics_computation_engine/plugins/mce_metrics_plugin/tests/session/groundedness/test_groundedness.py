@@ -411,6 +411,66 @@ class TestGroundedness:
         assert "You are an evaluator of Groundedness" in prompt
         assert "CONVERSATION:" in prompt
 
+    @pytest.mark.asyncio
+    async def test_groundedness_prompt_caps_conversation_size(self):
+        """Test that list conversations are compacted and capped in the prompt."""
+        metric = Groundedness(max_conversation_chars=200)
+        mock_jury = Mock()
+        mock_jury.judge = Mock(return_value=(1, "Grounded"))
+        metric.jury = mock_jury
+
+        session = create_session_with_conversation(agent_names=[])
+        session.conversation_data = {
+            "elements": [{"role": "user", "content": f"message {i}"} for i in range(50)]
+        }
+
+        # Execute computation
+        result = await metric.compute(session)
+
+        # Verify: compact JSON, earliest turns kept, tail truncated
+        prompt = mock_jury.judge.call_args[0][0]
+        conversation = prompt.split("CONVERSATION: ", 1)[1]
+        assert '{"role":"user","content":"message 0"}' in conversation
+        assert "message 49" not in conversation
+        assert "conversation truncated" in conversation
+        assert len(conversation.strip()) <= 200 + 64
+        assert result.metadata["conversation_truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_groundedness_cuts_oversized_first_element(self):
+        """Test that a first turn longer than the cap is cut, not dropped."""
+        metric = Groundedness(max_conversation_chars=100)
+        mock_jury = Mock()
+        mock_jury.judge = Mock(return_value=(1, "Grounded"))
+        metric.jury = mock_jury
+
+        session = create_session_with_conversation(agent_names=[])
+        session.conversation_data = {
+            "elements": [{"role": "user", "content": "x" * 500}]
+        }
+
+        # Execute computation
+        result = await metric.compute(session)
+
+        # Verify: the judge still sees the start of the first turn
+        prompt = mock_jury.judge.call_args[0][0]
+        conversation = prompt.split("CONVERSATION: ", 1)[1]
+        assert '[{"role":"user","content":"xxx' in conversation
+        assert "conversation truncated" in conversation
+        assert len(conversation.strip()) <= 100 + 64
+        assert result.metadata["conversation_truncated"] is True
+
+    def test_groundedness_conversation_serialization_matches_json(self):
+        """Test that compact serialization keeps unicode and stringifies keys."""
+        import json
+
+        from mce_metrics_plugin.session.groundedness import _dumps_compact
+
+        element = {"role": "user", "content": "¿Qué tal? 日本", 1: [1.5, None]}
+        assert _dumps_compact(element) == json.dumps(
+            element, separators=(",", ":"), ensure_ascii=False
+        )
+
     @pytest.mark.asyncio
     async def test_groundedness_binary_grading(self):
         """Test that BinaryGrading is passed to judge method."""
@@ -25,6 +25,11 @@ from metrics_computation_engine.entities.core.trace_processor import (
 from metrics_computation_engine.models.eval import MetricResult
 from .utils import format_metric_payload
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the requests encoder
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -194,10 +199,19 @@ class ApiClient:
             except json.JSONDecodeError:
                 self.logger.warning("Invalid JSON in API headers environment variable")
 
+        # Pre-encode the body with orjson when available; payloads it cannot
+        # handle are left to the stdlib encoder used by requests
+        body = {"json": data}
+        if orjson is not None:
+            try:
+                body = {"data": orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)}
+            except TypeError:
+                pass
+
         try:
             response = requests.post(
                 url,
-                json=data,
+                **body,
                 headers=headers,
                 verify=self._api_config.verify_ssl,
                 timeout=30,
@@ -226,22 +240,22 @@ class ApiClient:
         if not file_path_obj.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        with open(file_path_obj, "r") as f:
-            try:
-                # Try to load as JSON array first
-                data = json.load(f)
-                if isinstance(data, list):
-                    traces = data
-                else:
-                    traces = [data]
-            except json.JSONDecodeError:
-                # Try as JSON Lines format
-                f.seek(0)
-                traces = []
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        traces.append(json.loads(line))
+        # json accepts bytes directly, so skip the separate text decode pass
+        raw = file_path_obj.read_bytes()
+        try:
+            # Try to load as JSON array first
+            data = json.loads(raw)
+            if isinstance(data, list):
+                traces = data
+            else:
+                traces = [data]
+        except json.JSONDecodeError:
+            # Try as JSON Lines format
+            traces = []
+            for line in raw.splitlines():
+                line = line.strip()
+                if line:
+                    traces.append(json.loads(line))
 
         self.logger.info(f"Loaded {len(traces)} trace records from file")
         return traces
@@ -2,10 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+import sys
 import pandas as pd
 from typing import Any, Dict, List
 
-from ..models.span import SpanEntity
+from ..models.span import EMPTY_RAW, SpanEntity
 
 
 def safe_parse_json(value: str | None) -> dict | None:
@@ -57,7 +58,7 @@ def app_name(span: Dict) -> str:
                 return service_name
 
     # Check span attributes for app name patterns
-    attrs = span.get("SpanAttributes", {})
+    attrs = span.get("SpanAttributes", EMPTY_RAW)
     if attrs:
         # Common patterns for app names
         for attr_key in [
@@ -296,6 +297,23 @@ def parse_raw_spans(raw_spans: List[Dict[str, Any]]) -> List[SpanEntity]:
                     "error_trace": error_messages[0][1],
                 }
 
+        # Names and ids recur across every span of a session; interning them
+        # lets the metrics' equality checks and dict lookups short-circuit on
+        # identity and shares one string object between the spans
+        span_app_name = app_name(row)
+        session_id = attrs.get("session.id") or attrs.get("execution.id")
+        trace_id = row.get("TraceId")
+        if isinstance(entity_name, str):
+            entity_name = sys.intern(entity_name)
+        if isinstance(agent_id, str):
+            agent_id = sys.intern(agent_id)
+        if isinstance(span_app_name, str):
+            span_app_name = sys.intern(span_app_name)
+        if isinstance(session_id, str):
+            session_id = sys.intern(session_id)
+        if isinstance(trace_id, str):
+            trace_id = sys.intern(trace_id)
+
         # Ensure payloads are dictionaries
         input_payload = _ensure_dict_payload(input_payload)
         output_payload = _ensure_dict_payload(output_payload)
@@ -304,7 +322,7 @@ def parse_raw_spans(raw_spans: List[Dict[str, Any]]) -> List[SpanEntity]:
             entity_type=entity_type,
             span_id=row.get("SpanId", ""),
             entity_name=entity_name,
-            app_name=app_name(row),
+            app_name=span_app_name,
             agent_id=agent_id,
             input_payload=input_payload,
             output_payload=output_payload,
@@ -316,8 +334,8 @@ def parse_raw_spans(raw_spans: List[Dict[str, Any]]) -> List[SpanEntity]:
             parent_span_id=row.get("ParentSpanId")
             if pd.notna(row.get("ParentSpanId"))
             else None,
-            trace_id=row.get("TraceId"),
-            session_id=attrs.get("session.id") or attrs.get("execution.id"),
+            trace_id=trace_id,
+            session_id=session_id,
             start_time=start_time_str,
             end_time=end_time_str,
             duration=duration_ms,
@@ -9,8 +9,9 @@ This module contains the core business logic for transforming trace data.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
+from ..models.session import SessionEntity
 from ..models.session_set import SessionSet
 from .data_parser import parse_raw_spans
 from .session_aggregator import SessionAggregator
@@ -109,9 +110,37 @@ class TraceProcessor:
 
         self.logger.info(f"Processing {len(grouped_sessions)} pre-grouped sessions")
 
-        sessions = []
-        total_spans = 0
+        # Build the set once from the enriched sessions as they are produced
+        sessions = list(self.iter_grouped_sessions(grouped_sessions, session_id_filter))
 
+        self.logger.info(
+            f"Processed {sum(len(s.spans) for s in sessions)} spans "
+            f"across {len(sessions)} sessions"
+        )
+
+        if not sessions:
+            raise ValueError("No valid sessions found in grouped data")
+
+        return SessionSet(sessions=sessions)
+
+    def iter_grouped_sessions(
+        self,
+        grouped_sessions: Dict[str, List[Dict]],
+        session_id_filter: Optional[str] = None,
+    ) -> Iterator[SessionEntity]:
+        """
+        Lazily parse, aggregate and enrich pre-grouped sessions one at a time.
+
+        Each session is fully enriched before the next one is parsed, so callers
+        can start consuming sessions without waiting for the whole batch.
+
+        Args:
+            grouped_sessions: Dictionary with session_id as key and list of span dicts as value
+            session_id_filter: Optional session ID to filter for
+
+        Yields:
+            Enriched SessionEntity objects, in input order
+        """
         for session_id, session_spans in grouped_sessions.items():
             if not session_spans:
                 self.logger.warning(f"Session {session_id} has no spans, skipping")
@@ -129,31 +158,11 @@ class TraceProcessor:
                 )
                 continue
 
-            total_spans += len(span_entities)
-
-            # Create session directly from parsed spans
+            # Create session directly from parsed spans, then enrich it
             session_entity = self.aggregator.create_session_from_spans(
                 session_id, span_entities
             )
-            sessions.append(session_entity)
-
-        self.logger.info(
-            f"Processed {total_spans} spans across {len(sessions)} sessions"
-        )
-
-        if not sessions:
-            raise ValueError("No valid sessions found in grouped data")
-
-        # Create session set
-        session_set = SessionSet(sessions=sessions)
-
-        # Step 4: Enrich sessions with additional analysis
-        enriched_sessions = self.enrichment_pipeline.enrich_sessions(
-            session_set.sessions
-        )
-        enriched_session_set = SessionSet(sessions=enriched_sessions)
-
-        return enriched_session_set
+            yield self.enrichment_pipeline.enrich_session(session_entity)
 
     def _filter_by_session_id(
         self, session_set: SessionSet, target_session_id: str
@@ -139,8 +139,14 @@ def build_execution_tree(spans: List[SpanEntity]) -> ExecutionTree:
 
     # Build parent-child relationships
     roots_by_trace: Dict[str, List[SpanNode]] = {}
+    parents: Dict[str, SpanNode] = {}
+    linked = set()
 
     for span in spans:
+        if span.span_id in linked:
+            # Duplicate span id: its node is already linked once
+            continue
+        linked.add(span.span_id)
         node = nodes[span.span_id]
         trace_id = span.trace_id or "unknown"
 
@@ -148,6 +154,7 @@ def build_execution_tree(spans: List[SpanEntity]) -> ExecutionTree:
             # This span has a parent
             parent_node = nodes[span.parent_span_id]
             parent_node.children.append(node)
+            parents[span.span_id] = parent_node
             node.depth = parent_node.depth + 1
         else:
             # This is a root node (no parent or parent not found)
@@ -155,6 +162,35 @@ def build_execution_tree(spans: List[SpanEntity]) -> ExecutionTree:
                 roots_by_trace[trace_id] = []
             roots_by_trace[trace_id].append(node)
 
+    # Spans whose parent links loop back on themselves (malformed traces) are
+    # unreachable from every root; promote one span per loop to a root so each
+    # span is still reached exactly once by tree walks
+    reachable = set()
+
+    def mark_reachable(start: SpanNode):
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node.span.span_id in reachable:
+                continue
+            reachable.add(node.span.span_id)
+            stack.extend(node.children)
+
+    for trace_roots in roots_by_trace.values():
+        for root in trace_roots:
+            mark_reachable(root)
+
+    if len(reachable) < len(nodes):
+        for span_id, node in nodes.items():
+            if span_id in reachable:
+                continue
+            parent_node = parents.pop(span_id)
+            # Identity, not model equality, which would recurse around the loop
+            parent_node.children = [c for c in parent_node.children if c is not node]
+            node.depth = 0
+            roots_by_trace.setdefault(node.trace_id, []).append(node)
+            mark_reachable(node)
+
     # Sort children by timestamp for consistent ordering
     def sort_children_by_timestamp(node: SpanNode):
         node.children.sort(key=lambda child: child.span.timestamp or "")
@@ -1,11 +1,13 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from collections import Counter, defaultdict
 from pydantic import BaseModel, Field, PrivateAttr
 
-from .span import SpanEntity
+from .span import EMPTY_RAW, SpanEntity
 
 
 class AgentStats(BaseModel):
@@ -65,6 +67,74 @@ class ToolCall(BaseModel):
     output: Dict[str, Any]
 
 
+def _intern_name(value: Any) -> Any:
+    """Intern entity names so repeated ones share a single string object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass
+class SpanColumns:
+    """
+    Column-wise projection of a session's spans: entry ``i`` of every list
+    describes ``spans[i]``. Built once per session so metrics can loop over
+    flat lists instead of re-walking span attributes and raw span payloads.
+    """
+
+    span_ids: List[str]
+    entity_types: List[str]
+    entity_names: List[str]
+    contains_error: List[bool]
+    # Events.Attributes[0]["agent_name"] when present
+    agent_names: List[Optional[str]]
+    # Whether Events.Attributes[0] has an "agent_name" key at all (its value
+    # may be an explicit None, which still counts as an agent event)
+    has_agent_name: List[bool]
+    # SpanAttributes["ioa_observe.workflow.name"] when present
+    workflow_names: List[Optional[str]]
+    # SpanAttributes["traceloop.entity.name"], falling back to entity_name
+    tool_names: List[str]
+    # entity type -> positions, grouped in one pass on first lookup
+    _type_indices: Optional[Dict[str, List[int]]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_spans(cls, spans: List[SpanEntity]) -> "SpanColumns":
+        columns = cls([], [], [], [], [], [], [], [])
+        for span in spans:
+            raw = span.raw_span_data or EMPTY_RAW
+            span_attrs = raw.get("SpanAttributes") or EMPTY_RAW
+            events = raw.get("Events.Attributes") or raw.get("EventsAttributes")
+            agent_name = None
+            has_agent_name = False
+            if events and isinstance(events[0], dict):
+                has_agent_name = "agent_name" in events[0]
+                agent_name = events[0].get("agent_name")
+
+            columns.span_ids.append(span.span_id)
+            columns.entity_types.append(span.entity_type)
+            columns.entity_names.append(span.entity_name)
+            columns.contains_error.append(span.contains_error)
+            columns.agent_names.append(_intern_name(agent_name))
+            columns.has_agent_name.append(has_agent_name)
+            columns.workflow_names.append(
+                _intern_name(span_attrs.get("ioa_observe.workflow.name"))
+            )
+            columns.tool_names.append(
+                _intern_name(span_attrs.get("traceloop.entity.name", span.entity_name))
+            )
+        return columns
+
+    def indices_of(self, entity_type: str) -> List[int]:
+        """Positions of the spans with the given entity type (shared, do not mutate)."""
+        if self._type_indices is None:
+            type_indices = defaultdict(list)
+            for i, t in enumerate(self.entity_types):
+                type_indices[t].append(i)
+            self._type_indices = type_indices
+        return self._type_indices.get(entity_type, [])
+
+
 class SessionEntity(BaseModel):
     """
     Pure data model for session-level entity.
@@ -83,8 +153,10 @@ class SessionEntity(BaseModel):
 
     # Private field for optimized entity access (built lazily)
     # Previously: duplication of spans filtered by entity type and one field per type
-    # Now: single source of truth (spans) + indices for fast filtering
-    _entity_indices: Optional[Dict[str, List[int]]] = PrivateAttr(default=None)
+    # Now: single source of truth (spans) + a per-type grouping built in one pass
+    _spans_by_type: Optional[Dict[str, List[SpanEntity]]] = PrivateAttr(default=None)
+    # Column-wise span projection shared by all metrics (built lazily)
+    _span_columns: Optional[SpanColumns] = PrivateAttr(default=None)
 
     # Data extracted by transformers (used by metrics)
     conversation_data: Optional[Dict[str, Any]] = None
@@ -117,56 +189,63 @@ class SessionEntity(BaseModel):
     final_response: Optional[str] = None
 
     def _build_entity_indices(self) -> None:
-        """Build indices for efficient entity type filtering."""
-        # Only build indices if they haven't been built yet
-        if self._entity_indices is not None:
+        """Group spans by entity type in a single pass over the spans."""
+        # Only build the grouping if it hasn't been built yet
+        if self._spans_by_type is not None:
             return
 
-        self._entity_indices = defaultdict(list)
-        for i, span in enumerate(self.spans):
-            self._entity_indices[span.entity_type].append(i)
+        spans_by_type = defaultdict(list)
+        for span in self.spans:
+            spans_by_type[span.entity_type].append(span)
+        self._spans_by_type = spans_by_type
+
+    def _get_spans_by_type(self, entity_type: str) -> List[SpanEntity]:
+        """Get the memoized spans of one entity type (shared, do not mutate)."""
+        if self._spans_by_type is None:
+            self._build_entity_indices()
+        return self._spans_by_type.get(entity_type, [])
+
+    @property
+    def span_columns(self) -> SpanColumns:
+        """Get the memoized column-wise view of the spans (shared, do not mutate)."""
+        if self._span_columns is None:
+            self._span_columns = SpanColumns.from_spans(self.spans)
+        return self._span_columns
 
     @property
     def agent_spans(self) -> List[SpanEntity]:
-        """Get agent spans efficiently using indices."""
-        if self._entity_indices is None:
-            self._build_entity_indices()
-        return [self.spans[i] for i in self._entity_indices.get("agent", [])]
+        """Get agent spans efficiently using the per-type grouping."""
+        return self._get_spans_by_type("agent")
 
     @property
     def workflow_spans(self) -> List[SpanEntity]:
-        """Get workflow spans efficiently using indices."""
-        if self._entity_indices is None:
-            self._build_entity_indices()
-        return [self.spans[i] for i in self._entity_indices.get("workflow", [])]
+        """Get workflow spans efficiently using the per-type grouping."""
+        return self._get_spans_by_type("workflow")
 
     @property
     def tool_spans(self) -> List[SpanEntity]:
-        """Get tool spans efficiently using indices."""
-        if self._entity_indices is None:
-            self._build_entity_indices()
-        return [self.spans[i] for i in self._entity_indices.get("tool", [])]
+        """Get tool spans efficiently using the per-type grouping."""
+        return self._get_spans_by_type("tool")
+
+    @property
+    def tool_span_count(self) -> int:
+        """Get the number of tool spans from the per-type grouping."""
+        return len(self._get_spans_by_type("tool"))
 
     @property
     def llm_spans(self) -> List[SpanEntity]:
-        """Get LLM spans efficiently using indices."""
-        if self._entity_indices is None:
-            self._build_entity_indices()
-        return [self.spans[i] for i in self._entity_indices.get("llm", [])]
+        """Get LLM spans efficiently using the per-type grouping."""
+        return self._get_spans_by_type("llm")
 
     @property
     def graph_spans(self) -> List[SpanEntity]:
-        """Get graph spans efficiently using indices."""
-        if self._entity_indices is None:
-            self._build_entity_indices()
-        return [self.spans[i] for i in self._entity_indices.get("graph", [])]
+        """Get graph spans efficiently using the per-type grouping."""
+        return self._get_spans_by_type("graph")
 
     @property
     def task_spans(self) -> List[SpanEntity]:
-        """Get task spans efficiently using indices."""
-        if self._entity_indices is None:
-            self._build_entity_indices()
-        return [self.spans[i] for i in self._entity_indices.get("task", [])]
+        """Get task spans efficiently using the per-type grouping."""
+        return self._get_spans_by_type("task")
 
     @property
     def time_range(self) -> str:
@@ -622,7 +701,7 @@ class SessionEntity(BaseModel):
 
         # Check in raw_span_data as fallback
         if hasattr(span, "raw_span_data") and span.raw_span_data:
-            span_attrs = span.raw_span_data.get("SpanAttributes", {})
+            span_attrs = span.raw_span_data.get("SpanAttributes", EMPTY_RAW)
             agent_id = span_attrs.get("agent_id")
             if agent_id and isinstance(agent_id, str) and agent_id.strip():
                 return agent_id.strip()
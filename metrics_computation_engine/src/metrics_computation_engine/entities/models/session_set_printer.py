@@ -9,8 +9,10 @@ Contains utility functions for displaying SessionSet data in various formats.
 These functions provide detailed views of sessions, execution trees, and statistics.
 """
 
+import io
 import json
-from typing import Optional
+import sys
+from typing import Optional, TextIO
 from .session_set import SessionSet
 
 
@@ -25,19 +27,24 @@ def print_execution_tree(execution_tree, max_depth: int = 3):
     if not execution_tree:
         return
 
-    print("\n" + "=" * 60)
-    print("EXECUTION TREE DETAILS")
-    print("=" * 60)
+    buf = io.StringIO()
+    print("\n" + "=" * 60, file=buf)
+    print("EXECUTION TREE DETAILS", file=buf)
+    print("=" * 60, file=buf)
 
     for trace_id, roots in execution_tree.traces.items():
-        print(f"\nTrace ID: {trace_id}")
-        print("-" * 40)
+        print(f"\nTrace ID: {trace_id}", file=buf)
+        print("-" * 40, file=buf)
 
         for root in roots:
-            _print_tree_node(root, depth=0, max_depth=max_depth)
+            _print_tree_node(root, depth=0, max_depth=max_depth, out=buf)
 
+    sys.stdout.write(buf.getvalue())
 
-def _print_tree_node(node, depth: int = 0, max_depth: int = 3):
+
+def _print_tree_node(
+    node, depth: int = 0, max_depth: int = 3, out: Optional[TextIO] = None
+):
     """
     Recursively print tree nodes with proper indentation.
 
@@ -45,9 +52,10 @@ def _print_tree_node(node, depth: int = 0, max_depth: int = 3):
         node: Tree node to print
         depth: Current depth level
         max_depth: Maximum depth to print
+        out: Stream to write to (default: sys.stdout)
     """
     if depth > max_depth:
-        print("  " * depth + "... (truncated)")
+        print("  " * depth + "... (truncated)", file=out)
         return
 
     indent = "  " * depth
@@ -58,11 +66,11 @@ def _print_tree_node(node, depth: int = 0, max_depth: int = 3):
     if hasattr(span, "duration") and span.duration:
         span_info += f" ({span.duration:.1f}ms)"
 
-    print(f"{indent}├─ {span_info}")
+    print(f"{indent}├─ {span_info}", file=out)
 
     # Print children
     for child in node.children:
-        _print_tree_node(child, depth + 1, max_depth)
+        _print_tree_node(child, depth + 1, max_depth, out)
 
 
 def print_session_summary(session_set: SessionSet):
@@ -72,19 +80,20 @@ def print_session_summary(session_set: SessionSet):
     Args:
         session_set: SessionSet object containing session data
     """
-    print("\n" + "=" * 60)
-    print(f"SESSION SUMMARY - {len(session_set.sessions)} sessions found")
-    print("=" * 60)
+    buf = io.StringIO()
+    print("\n" + "=" * 60, file=buf)
+    print(f"SESSION SUMMARY - {len(session_set.sessions)} sessions found", file=buf)
+    print("=" * 60, file=buf)
 
     for i, session in enumerate(session_set.sessions, 1):
-        print(f"\n[Session {i}] ID: {session.session_id}")
-        print(f"  Time Range: {session.time_range}")
-        print(f"  Total Spans: {session.total_spans}")
+        print(f"\n[Session {i}] ID: {session.session_id}", file=buf)
+        print(f"  Time Range: {session.time_range}", file=buf)
+        print(f"  Total Spans: {session.total_spans}", file=buf)
 
         # Show execution tree info if available
         if session.execution_tree:
             tree_stats = f"{len(session.execution_tree.traces)} traces, {session.execution_tree.total_spans} flows"
-            print(f"  Execution Tree: {tree_stats}")
+            print(f"  Execution Tree: {tree_stats}", file=buf)
 
         # Show entity breakdown
         entity_counts = {}
@@ -92,9 +101,11 @@ def print_session_summary(session_set: SessionSet):
             entity_type = span.entity_type
             entity_counts[entity_type] = entity_counts.get(entity_type, 0) + 1
 
-        print("  Entity Breakdown:")
+        print("  Entity Breakdown:", file=buf)
         for entity_type, count in sorted(entity_counts.items()):
-            print(f"    {entity_type}: {count}")
+            print(f"    {entity_type}: {count}", file=buf)
+
+    sys.stdout.write(buf.getvalue())
 
 
 def print_statistics(session_set: SessionSet):
@@ -104,15 +115,18 @@ def print_statistics(session_set: SessionSet):
     Args:
         session_set: SessionSet object containing session data
     """
-    print("\n" + "=" * 80)
-    print("SESSION SET STATISTICS")
-    print("=" * 80)
+    buf = io.StringIO()
+    print("\n" + "=" * 80, file=buf)
+    print("SESSION SET STATISTICS", file=buf)
+    print("=" * 80, file=buf)
 
     stats = session_set.stats
     stats_json = stats.model_dump()
 
-    print(json.dumps(stats_json, indent=2))
-    print("=" * 80)
+    print(json.dumps(stats_json, indent=2), file=buf)
+    print("=" * 80, file=buf)
+
+    sys.stdout.write(buf.getvalue())
 
 
 def print_detailed_session_info(
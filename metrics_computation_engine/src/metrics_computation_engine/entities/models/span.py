@@ -1,9 +1,13 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Dict, List, Literal, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Union
 from pydantic import BaseModel
 
+# Shared read-only fallback for lookups into missing span attribute mappings.
+EMPTY_RAW: Mapping[str, Any] = MappingProxyType({})
+
 
 class SpanEntity(BaseModel):
     entity_type: Literal["agent", "tool", "llm", "workflow", "graph", "task", "other"]
@@ -27,3 +31,13 @@ class SpanEntity(BaseModel):
     duration: Optional[float] = None  # Duration in milliseconds
     attrs: Optional[Dict[str, Any]] = None
     raw_span_data: Dict[str, Any]
+
+    @classmethod
+    def bulk_construct(cls, rows: Iterable[Mapping[str, Any]]) -> List["SpanEntity"]:
+        """Build spans from trusted, already well-formed field mappings.
+
+        Uses ``model_construct`` so no validation is run; only use it for
+        data that would pass validation anyway (fixtures, re-hydrated spans).
+        """
+        construct = cls.model_construct
+        return [construct(**row) for row in rows]
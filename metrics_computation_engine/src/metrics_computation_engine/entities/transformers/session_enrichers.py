@@ -6,11 +6,52 @@ Session enrichment transformers for extracting and enriching session data
 based on span types and patterns.
 """
 
-from typing import Dict, Any, List
+from collections import Counter
+from typing import Dict, Any, List, Tuple
+
 from .base import DataPreservingTransformer
 from .execution_tree_transformer import ExecutionTreeTransformer
 from ..models.session import SessionEntity
 
+# numpy is optional: without it long sessions use the plain Counter path too
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Below this many agent events the plain Counter path beats numpy's setup cost
+NUMPY_TRANSITION_THRESHOLD = 512
+
+
+def _count_transitions_numpy(agent_names: List[str]) -> Tuple[List[str], Counter]:
+    """
+    Count consecutive agent transitions with a single numpy sort pass.
+
+    Names are interned to ints, each (src, dst) pair is packed into one int64,
+    and np.unique counts the packed keys; labels are only built per distinct pair.
+    """
+    codes: Dict[str, int] = {}
+    ids = np.fromiter(
+        (codes.setdefault(name, len(codes)) for name in agent_names),
+        dtype=np.int64,
+        count=len(agent_names),
+    )
+    width = len(codes)
+    src, dst = ids[:-1], ids[1:]
+    changed = src != dst
+    packed = src[changed] * width + dst[changed]
+    keys, first, inverse, counts = np.unique(
+        packed, return_index=True, return_inverse=True, return_counts=True
+    )
+
+    names = list(codes)
+    labels = [f"{names[k // width]} -> {names[k % width]}" for k in keys.tolist()]
+    transitions = [labels[j] for j in inverse.tolist()]
+    # Keep first-seen order, matching Counter built from the transition list
+    order = np.argsort(first, kind="stable").tolist()
+    counts = counts.tolist()
+    return transitions, Counter({labels[j]: counts[j] for j in order})
+
 
 class ConversationDataTransformer(DataPreservingTransformer):
     """
@@ -387,50 +428,39 @@ class AgentTransitionTransformer(DataPreservingTransformer):
 
     def extract(self, session: SessionEntity) -> Dict[str, Any]:
         """Extract agent transitions from spans with Events.Attributes."""
-        from collections import Counter
-
         if not isinstance(session, SessionEntity):
             return {}
 
-        agent_events = []
+        # Agent names come from Events.Attributes (same logic as dal_legacy),
+        # pre-extracted once per session in the span columns
+        columns = session.span_columns
+        agent_names = [
+            name
+            for name, present in zip(columns.agent_names, columns.has_agent_name)
+            if present
+        ]
 
-        # Extract agent events from spans with Events.Attributes (same logic as dal_legacy)
-        for span in session.spans:
-            if (
-                hasattr(span, "raw_span_data")
-                and span.raw_span_data
-                and (
-                    span.raw_span_data.get("Events.Attributes")
-                    or span.raw_span_data.get("EventsAttributes")
-                )
-            ):
-                events = span.raw_span_data.get(
-                    "Events.Attributes"
-                ) or span.raw_span_data.get("EventsAttributes", [])
-                if (
-                    len(events) > 0
-                    and isinstance(events[0], dict)
-                    and "agent_name" in events[0]
-                ):
-                    agent_name = events[0]["agent_name"]
-                    agent_events.append((span.span_id, agent_name))
-
-        if not agent_events:
+        if not agent_names:
             return {"agent_transitions": [], "agent_transition_counts": Counter()}
 
-        # Extract just the agent names for transition analysis
-        agent_names = [event[1] for event in agent_events]
+        if np is not None and len(agent_names) >= NUMPY_TRANSITION_THRESHOLD:
+            transitions, transition_counts = _count_transitions_numpy(agent_names)
+            return {
+                "agent_transitions": transitions,
+                "agent_transition_counts": transition_counts,
+            }
 
-        # Compute transitions (same logic as dal_legacy)
-        transitions = []
-        for i in range(len(agent_names) - 1):
-            if agent_names[i] != agent_names[i + 1]:
-                transition = f"{agent_names[i]} -> {agent_names[i + 1]}"
-                transitions.append(transition)
+        # Compute transitions (same logic as dal_legacy): pair consecutive names,
+        # count the tuples, and format each distinct pair only once
+        pairs = [(a, b) for a, b in zip(agent_names, agent_names[1:]) if a != b]
+        pair_counts = Counter(pairs)
+        labels = {pair: f"{pair[0]} -> {pair[1]}" for pair in pair_counts}
 
         return {
-            "agent_transitions": transitions,
-            "agent_transition_counts": Counter(transitions),
+            "agent_transitions": [labels[pair] for pair in pairs],
+            "agent_transition_counts": Counter(
+                {labels[pair]: count for pair, count in pair_counts.items()}
+            ),
         }
 
 
@@ -501,8 +531,11 @@ class SessionEnrichmentPipeline:
             if isinstance(transformer_result, dict):
                 enriched_data.update(transformer_result)
 
-        # Create a new session with the enriched data
-        session_dict = session.model_dump()
+        # Create a new session with the enriched data. The fields are copied
+        # shallowly so the new session shares the existing SpanEntity objects
+        # (also referenced by the execution tree) instead of dumping and
+        # re-validating a duplicate of every span.
+        session_dict = dict(session)
         session_dict.update(enriched_data)
 
         return SessionEntity(**session_dict)
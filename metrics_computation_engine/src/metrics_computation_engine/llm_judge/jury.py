@@ -1,7 +1,8 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Sequence, Tuple
 
 from metrics_computation_engine.llm_judge.llm import LLMClient
 from metrics_computation_engine.llm_judge.prompts import judge_system_prompt
@@ -63,3 +64,87 @@ class Jury:
         consensus = self.consensus_score(results)
         score, reasoning = consensus["metric_score"], consensus["score_reasoning"]
         return score, reasoning
+
+    def judge_batch(
+        self, prompt: str, response_format: Any, num_items: int
+    ) -> List[Tuple[Any, Any]]:
+        # Grades num_items numbered items in one request per model; each model must
+        # return a `gradings` list and the per-item scores are averaged across models.
+        query_params = {"response_format": {"type": "json_object"}}
+        judge_prompt = self.augment_prompt_with_schema(prompt, response_format)
+
+        messages = [self.system_message, {"role": "user", "content": judge_prompt}]
+
+        per_model = []
+        for llm in self.llms:
+            res = llm.query(messages, **query_params)
+            res_dict = safe_json_from_llm(res.choices[-1].message.content)
+            gradings = parse_key_from_nested_dict(res_dict, "gradings")
+            if not isinstance(gradings, list) or len(gradings) != num_items:
+                raise ValueError(
+                    f"Expected {num_items} gradings from LLM response, got "
+                    f"{len(gradings) if isinstance(gradings, list) else 'none'}."
+                )
+            per_model.append(gradings)
+
+        verdicts = []
+        for index in range(num_items):
+            items = [gradings[index] for gradings in per_model]
+            score = sum(
+                parse_key_from_nested_dict(item, "metric_score") for item in items
+            ) / len(items)
+            # Distinct reasonings of the models, in model order
+            reasoning = "\n".join(
+                dict.fromkeys(
+                    str(parse_key_from_nested_dict(item, "score_reasoning"))
+                    for item in items
+                )
+            )
+            verdicts.append((score, reasoning))
+        return verdicts
+
+
+def _weighted_median(verdicts: Sequence[Tuple[Any, Any]], weights: Sequence[float]):
+    # Verdict whose score sits at half of the total weight; with equal weights
+    # and binary scores this is the majority verdict.
+    ranked = sorted(zip(verdicts, weights), key=lambda item: item[0][0])
+    half = sum(weights) / 2
+    cumulative = 0.0
+    for verdict, weight in ranked:
+        cumulative += weight
+        if cumulative >= half:
+            return verdict
+    return ranked[-1][0]
+
+
+class JuryEnsemble:
+    """
+    Several jurors (anything exposing ``judge``, e.g. a ``Jury``) queried in
+    parallel, with their verdicts combined by weighted median score. Drop-in
+    replacement for a ``Jury`` wherever a metric takes its judge model.
+    """
+
+    def __init__(self, jurors: Sequence[Tuple[Any, float]]):
+        if not jurors:
+            raise ValueError("JuryEnsemble needs at least one juror.")
+        self.jurors = [juror for juror, _ in jurors]
+        self.weights = [weight for _, weight in jurors]
+
+    def _dispatch(self, call) -> List[Any]:
+        with ThreadPoolExecutor(max_workers=len(self.jurors)) as pool:
+            return list(pool.map(call, self.jurors))
+
+    def judge(self, prompt: str, response_format: Any = None, mode="default"):
+        verdicts = self._dispatch(lambda juror: juror.judge(prompt, response_format))
+        return _weighted_median(verdicts, self.weights)
+
+    def judge_batch(
+        self, prompt: str, response_format: Any, num_items: int
+    ) -> List[Tuple[Any, Any]]:
+        per_juror = self._dispatch(
+            lambda juror: juror.judge_batch(prompt, response_format, num_items)
+        )
+        return [
+            _weighted_median([verdicts[index] for verdicts in per_juror], self.weights)
+            for index in range(num_items)
+        ]
@@ -3,7 +3,7 @@
 
 import os
 import logging
-from typing import Union
+from typing import Dict, Union
 
 
 def _normalize_log_level(level: Union[int, str]) -> int:
@@ -30,13 +30,70 @@ def _normalize_log_level(level: Union[int, str]) -> int:
     return level
 
 
+DEFAULT_FORMAT = "%(asctime)s.%(msecs)03d %(levelname)9s [%(filename)25s:%(lineno)4d - %(funcName)20s] [%(threadName)s] %(message)s"
+
+_DEFAULT_FORMATTER = logging.Formatter(DEFAULT_FORMAT)
+# Formatters for non-default format strings, built once per string
+_custom_formatters: Dict[str, logging.Formatter] = {}
+
+
+def _get_formatter(formatter_str: str) -> logging.Formatter:
+    """
+    Return the shared formatter for a format string.
+
+    Parameters
+    ----------
+    formatter_str : str
+        Formatter string for log messages.
+
+    Returns
+    -------
+    logging.Formatter
+        Formatter reused across calls with the same format string.
+    """
+    if formatter_str == DEFAULT_FORMAT:
+        return _DEFAULT_FORMATTER
+    formatter = _custom_formatters.get(formatter_str)
+    if formatter is None:
+        formatter = _custom_formatters[formatter_str] = logging.Formatter(formatter_str)
+    return formatter
+
+
+def _attach_package_handler(name: str, formatter_str: str) -> None:
+    """
+    Install a single StreamHandler on the top-level package logger of ``name``.
+
+    Module loggers propagate to it, and it does not propagate further, so the
+    root logger (and the logging setup of an embedding application) is left
+    untouched.
+
+    Parameters
+    ----------
+    name : str
+        Name of the logger being set up.
+    formatter_str : str
+        Formatter string for log messages.
+    """
+    package_logger = logging.getLogger(name.split(".", 1)[0])
+    if package_logger.handlers:
+        return
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(_get_formatter(formatter_str))
+    package_logger.addHandler(handler)
+    package_logger.propagate = False
+
+
 def setup_logger(
     name: str,
     level: Union[int, str] = None,
-    formatter_str: str = "%(asctime)s.%(msecs)03d %(levelname)9s [%(filename)25s:%(lineno)4d - %(funcName)20s] [%(threadName)s] %(message)s",
+    formatter_str: str = DEFAULT_FORMAT,
 ) -> logging.Logger:
     """
-    Set up a logger with the specified name, level, and formatter.
+    Set up a logger with the specified name and level.
+
+    Records propagate to a single handler on the top-level package logger
+    (e.g. ``metrics_computation_engine``), so no per-module handler is attached.
 
     Parameters
     ----------
@@ -46,31 +103,23 @@ def setup_logger(
         Logging level as string ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
         or integer (10, 20, 30, 40, 50). If None, defaults to LOG_LEVEL env var or INFO.
     formatter_str : str, optional
-        Formatter string for log messages.
+        Formatter string for log messages, applied when the package handler is
+        first installed.
 
     Returns
     -------
     logger : logging.Logger
         Configured logger.
     """
+    _attach_package_handler(name, formatter_str)
+
     # Determine the effective log level
     if level is not None:
         effective_level = _normalize_log_level(level)
     else:
-        env_level = os.getenv("LOG_LEVEL", "INFO")
-        effective_level = _normalize_log_level(env_level)
+        effective_level = _normalize_log_level(os.getenv("LOG_LEVEL", "INFO"))
 
     logger = logging.getLogger(name)
     logger.setLevel(effective_level)
 
-    ch = logging.StreamHandler()
-    ch.setLevel(effective_level)
-
-    formatter = logging.Formatter(formatter_str)
-    ch.setFormatter(formatter)
-
-    if not logger.handlers:  # Avoid adding multiple handlers to the logger
-        logger.addHandler(ch)
-        logger.propagate = False
-
     return logger
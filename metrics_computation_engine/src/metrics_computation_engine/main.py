@@ -3,7 +3,9 @@
 
 """Main FastAPI application for the Metrics Computation Engine."""
 
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from typing import Optional
 import uvicorn
 import os
 import logging
@@ -18,7 +20,10 @@ from metrics_computation_engine.dal.api_client import (
 )
 
 from metrics_computation_engine.models.requests import MetricsConfigRequest
-from metrics_computation_engine.processor import MetricsProcessor
+from metrics_computation_engine.processor import (
+    DEFAULT_MAX_CONCURRENCY,
+    MetricsProcessor,
+)
 from metrics_computation_engine.registry import MetricRegistry
 from metrics_computation_engine.util import (
     format_return,
@@ -38,6 +43,34 @@ logger = setup_logger(__name__)
 # initialize the dal api client
 get_api_client(logger=logger)
 
+
+@dataclass(frozen=True)
+class LLMDefaults:
+    """LLM judge defaults, resolved once from the environment at import time"""
+
+    LLM_BASE_MODEL_URL: str
+    LLM_MODEL_NAME: str
+    LLM_API_KEY: str
+
+
+LLM_DEFAULTS = LLMDefaults(
+    LLM_BASE_MODEL_URL=os.getenv("LLM_BASE_MODEL_URL", "https://api.openai.com/v1"),
+    LLM_MODEL_NAME=os.getenv("LLM_MODEL_NAME", "gpt-4-turbo"),
+    LLM_API_KEY=os.getenv("LLM_API_KEY", "sk-..."),
+)
+# None means keep the retry count sent with the request
+NUM_LLM_RETRIES: Optional[int] = (
+    int(os.environ["NUM_LLM_RETRIES"]) if "NUM_LLM_RETRIES" in os.environ else None
+)
+# Metric computations (and so concurrent judge requests) in flight at once
+MAX_METRIC_CONCURRENCY: int = int(
+    os.getenv("MAX_METRIC_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))
+)
+if MAX_METRIC_CONCURRENCY < 1:
+    raise ValueError(
+        f"MAX_METRIC_CONCURRENCY must be at least 1, got {MAX_METRIC_CONCURRENCY}"
+    )
+
 # TODO: we should create a class to hold the app and other global level variables (model_handler)
 # ========== FastAPI App ==========
 app = FastAPI(
@@ -179,22 +212,6 @@ async def compute_metrics(config: MetricsConfigRequest):
 
         # if logger.isEnabledFor(logging.DEBUG):  # DEBUG level
         #     logger.debug(f"Session IDs Content Found: {list(sessions_set.values())}")
-        # Configure LLM
-        llm_config = config.llm_judge_config
-        if llm_config.LLM_API_KEY == "sk-...":
-            llm_config.LLM_BASE_MODEL_URL = os.getenv(
-                "LLM_BASE_MODEL_URL", "https://api.openai.com/v1"
-            )
-            llm_config.LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME", "gpt-4-turbo")
-            llm_config.LLM_API_KEY = os.getenv("LLM_API_KEY", "sk-...")
-
-        llm_config.NUM_LLM_RETRIES = int(
-            os.getenv("NUM_LLM_RETRIES", str(llm_config.NUM_LLM_RETRIES))
-        )
-
-        logger.info(f"LLM Judge using - URL: {llm_config.LLM_BASE_MODEL_URL}")
-        logger.info(f"LLM Judge using - Model: {llm_config.LLM_MODEL_NAME}")
-
         # Register metrics
         registry = MetricRegistry()
         failed_registry_metrics = []
@@ -221,6 +238,21 @@ async def compute_metrics(config: MetricsConfigRequest):
 
         logger.info(f"Registered Metrics: {registry.list_metrics()}")
 
+        # Configure LLM, only when at least one registered metric needs a model
+        llm_config = None
+        if registry.requires_llm():
+            llm_config = config.llm_judge_config
+            if llm_config.LLM_API_KEY == "sk-...":
+                llm_config = llm_config.model_copy(update=asdict(LLM_DEFAULTS))
+            if NUM_LLM_RETRIES is not None:
+                llm_config.NUM_LLM_RETRIES = NUM_LLM_RETRIES
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"LLM Judge using - URL: {llm_config.LLM_BASE_MODEL_URL}")
+                logger.debug(f"LLM Judge using - Model: {llm_config.LLM_MODEL_NAME}")
+        else:
+            logger.info("No registered metric needs an LLM judge, skipping config")
+
         # Process metrics with structured session data
         processor = MetricsProcessor(
             registry=registry,
@@ -229,6 +261,7 @@ async def compute_metrics(config: MetricsConfigRequest):
             include_stack_trace=config.should_include_stack_trace(),
             include_unmatched_spans=config.should_include_unmatched_spans(),
             reorg_by_entity=config.should_reorg_by_entity(),
+            max_concurrency=MAX_METRIC_CONCURRENCY,
         )
 
         # Get computation levels from config
@@ -1,25 +1,191 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import hashlib
+import inspect
+import json
 import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from metrics_computation_engine.models.requests import LLMJudgeConfig
-from metrics_computation_engine.llm_judge.jury import Jury
-from metrics_computation_engine.models.eval import MetricResult
+from metrics_computation_engine.llm_judge.jury import Jury, JuryEnsemble
+from metrics_computation_engine.models.eval import BatchBinaryGrading, MetricResult
 from metrics_computation_engine.types import AggregationLevel
 from metrics_computation_engine.dal.api_client import get_api_client
 from metrics_computation_engine.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
 DEFAULT_PROVIDER = "NATIVE"
 
 
+def _decode_cached_metric(obj: Any) -> Optional[Dict[str, Any]]:
+    """
+    Return the 'metrics' payload of a cached DB row as a dict.
+
+    Payloads stored as JSON strings are decoded once and written back to the
+    row, so subsequent lookups on the same row skip the parse.
+    """
+    if not isinstance(obj, dict) or "metrics" not in obj:
+        return None
+
+    metric_data = obj["metrics"]
+    if isinstance(metric_data, str):
+        try:
+            metric_data = (orjson or json).loads(metric_data)
+        except (ValueError, TypeError):
+            return None
+        obj["metrics"] = metric_data
+
+    return metric_data if isinstance(metric_data, dict) else None
+
+
+def _session_metric_index(session_id: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch the cached metrics of a session and index the rows by metric name."""
+    index = defaultdict(list)
+    for obj in get_api_client().get_session_metrics(session_id=session_id) or []:
+        metric_data = _decode_cached_metric(obj)
+        if metric_data is not None:
+            index[metric_data.get("metric_name", "")].append(obj)
+    return dict(index)
+
+
+def _result_from_cache(metric_data: Dict[str, Any]) -> MetricResult:
+    """Rebuild a cached metric payload as a MetricResult, leaving the row as is."""
+    # Older rows may lack category and app_name
+    return MetricResult(
+        **{
+            "category": "application",
+            "app_name": "unknown",
+            **metric_data,
+            "from_cache": True,
+        }
+    )
+
+
+# Most recent judge verdicts kept per jury instance
+JUDGE_CACHE_SIZE = 10_000
+
+# jury -> {(prompt digest, response format name): (score, reasoning)}
+_judge_verdicts: "weakref.WeakKeyDictionary[Any, OrderedDict]" = (
+    weakref.WeakKeyDictionary()
+)
+# Verdicts are looked up and stored from judge worker threads too
+_judge_verdicts_lock = threading.Lock()
+
+
+def _judge_cached(jury: Any, key: Tuple[Any, ...], judge: Callable[[], Any]) -> Any:
+    # Returns the verdict stored under key for this jury, or judge() stored there
+    with _judge_verdicts_lock:
+        try:
+            verdicts = _judge_verdicts.setdefault(jury, OrderedDict())
+        except TypeError:
+            # Jury objects that cannot be weakly referenced are simply not cached
+            verdicts = None
+        if verdicts is not None and key in verdicts:
+            verdicts.move_to_end(key)
+            return verdicts[key]
+
+    verdict = judge()
+    if verdicts is not None:
+        with _judge_verdicts_lock:
+            verdicts[key] = verdict
+            if len(verdicts) > JUDGE_CACHE_SIZE:
+                verdicts.popitem(last=False)
+    return verdict
+
+
+def _verdict_key(prompt: str, response_format: Any) -> Tuple[str, str]:
+    return (
+        hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest(),
+        getattr(response_format, "__name__", str(response_format)),
+    )
+
+
+def judge_with_cache(jury: Any, prompt: str, response_format: Any) -> Tuple[Any, Any]:
+    """
+    Return ``jury.judge(prompt, response_format)``, reusing earlier verdicts.
+
+    Verdicts are keyed by a digest of the full prompt and the response format,
+    per jury instance, so re-evaluating identical spans or sessions skips the
+    LLM round-trip. Failed judgements raise as before and are not cached.
+    """
+    return _judge_cached(
+        jury,
+        _verdict_key(prompt, response_format),
+        lambda: jury.judge(prompt, response_format),
+    )
+
+
+def judge_batch_with_cache(
+    jury: Any, prompt: str, response_format: Any, num_items: int
+) -> List[Tuple[Any, Any]]:
+    """
+    Return ``jury.judge_batch(prompt, response_format, num_items)``, reusing
+    earlier verdicts for the same batch prompt like ``judge_with_cache``.
+    """
+    return _judge_cached(
+        jury,
+        (*_verdict_key(prompt, response_format), num_items),
+        lambda: jury.judge_batch(prompt, response_format, num_items),
+    )
+
+
+async def judge_in_thread(
+    jury: Any, prompt: str, response_format: Any
+) -> Tuple[Any, Any]:
+    """
+    Awaitable ``judge_with_cache`` running the blocking judge request in a
+    worker thread, so concurrently scheduled metric computations overlap
+    their LLM round-trips instead of serializing on the event loop.
+    """
+    return await asyncio.to_thread(judge_with_cache, jury, prompt, response_format)
+
+
+async def judge_batch_in_thread(
+    jury: Any, prompt: str, response_format: Any, num_items: int
+) -> List[Tuple[Any, Any]]:
+    """Awaitable ``judge_batch_with_cache``, run in a worker thread."""
+    return await asyncio.to_thread(
+        judge_batch_with_cache, jury, prompt, response_format, num_items
+    )
+
+
+def metrics_cache_enabled() -> bool:
+    """Whether metric results are looked up in the DAL cache before computing."""
+    return os.getenv("METRICS_CACHE_ENABLED", "false").lower() == "true"
+
+
 class BaseMetric(ABC):
     """Base class for generic metric"""
 
+    # True for metrics that only compute in-process (no LLM or network calls);
+    # the processor runs these inline (unless the metric cache must be probed
+    # first) and reuses one instance per metric name.
+    is_cpu_bound: bool = False
+
+    # Whether compute() accepts **kwargs; resolved once per class in
+    # __init_subclass__ so the processor never inspects signatures per call.
+    _supports_context: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        compute = getattr(cls, "compute", None)
+        cls._supports_context = compute is not None and any(
+            p.kind == inspect.Parameter.VAR_KEYWORD
+            for p in inspect.signature(compute).parameters.values()
+        )
+
     def __init__(self, jury: Optional[Jury] = None, dataset: Optional[Dict] = None):
         self.jury = jury
         self.dataset = dataset
@@ -212,6 +378,56 @@ class BaseMetric(ABC):
             error_message=error_message,
         )
 
+    def _is_judgeable_span(self, data: Any) -> bool:
+        """Whether a span has a required entity type, an input, an output and a name."""
+        return data.entity_type in self.required["entity_type"] and bool(
+            data.input_payload and data.output_payload and data.entity_name
+        )
+
+    async def _judge_spans_batched(
+        self,
+        spans: List[Any],
+        build_item: Callable[[int, Any], str],
+        batch_prompt: str,
+        make_result: Callable[[Any, Any, Any], MetricResult],
+        **context,
+    ) -> List[MetricResult]:
+        """
+        Grade the judgeable spans with a single batched judge request.
+
+        Args:
+            spans: Spans to grade, typically those of one session
+            build_item: Renders a span as the numbered item (1-based) of the batch
+            batch_prompt: Prompt template taking the joined items as ``{items}``
+            make_result: Builds the success result from (span, score, reasoning)
+
+        Returns:
+            One result per span, in the order of ``spans``. Other spans, and
+            every span when fewer than two qualify or no jury is configured,
+            go through ``compute``.
+        """
+        valid = [
+            index for index, span in enumerate(spans) if self._is_judgeable_span(span)
+        ]
+        if len(valid) < 2 or not self.jury:
+            return [await self.compute(span, **context) for span in spans]
+
+        items = "".join(
+            build_item(position + 1, spans[index])
+            for position, index in enumerate(valid)
+        )
+        verdicts = await judge_batch_in_thread(
+            self.jury, batch_prompt.format(items=items), BatchBinaryGrading, len(valid)
+        )
+
+        results: List[Optional[MetricResult]] = [None] * len(spans)
+        for index, (score, reasoning) in zip(valid, verdicts):
+            results[index] = make_result(spans[index], score, reasoning)
+        for index, span in enumerate(spans):
+            if results[index] is None:
+                results[index] = await self.compute(span, **context)
+        return results
+
     def get_cache_metric(
         self, data: Any, context: Optional[Dict[str, Any]] = None
     ) -> str:
@@ -227,18 +443,23 @@ class BaseMetric(ABC):
         Returns:
             A unique cache key string for this computation
         """
-        import hashlib
-
         data_str = str(data) if data else ""
         context_str = str(context) if context else ""
-        combined = f"{self.name}:{data_str}:{context_str}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        # Feed the parts straight into the hash rather than building a joined copy
+        digest = hashlib.blake2s(digest_size=16)
+        digest.update(str(self.name).encode())
+        digest.update(b":")
+        digest.update(data_str.encode())
+        digest.update(b":")
+        digest.update(context_str.encode())
+        return digest.hexdigest()
 
     async def check_cache_metric(
         self,
         metric_name: str,
         session_id: str,
         context: Optional[Dict[str, Any]] = None,
+        session_indices: Optional[Dict[str, "asyncio.Future"]] = None,
     ) -> Optional[Union[MetricResult, List[MetricResult]]]:
         """Check if this metric result exists in cache/database.
 
@@ -249,59 +470,28 @@ class BaseMetric(ABC):
             metric_name: Name of the metric
             session_id: Session ID
             context: Optional context data (for agent-specific caching)
+            session_indices: Per-run session metric index fetches, shared by
+                every probe of the run so each session is read from the DAL once
 
         Returns:
             Cached MetricResult or List[MetricResult] if found, None otherwise
         """
 
-        def _check_metrics_conditions(
-            list_of_json_objects: list, metric_name: str
-        ) -> bool:
-            """
-            Analyzes a list of JSON objects to check if any object's 'metrics' attribute
-            matches specific conditions.
-
-            Used conditionally to decide whether to skip writing metrics for a session.
-            Returns True if:
-            - 'metrics.aggregation_level' is set AND
-            - 'metrics.category' is set AND
-            - 'metrics.name' is set
-
-            Otherwise, returns False.
-
-            Args:
-                list_of_json_objects (list): A list of dictionaries (representing JSON objects).
-
-            Returns:
-                bool: True if any object meets the conditions, False otherwise.
-                Dict: the metric read from db as a db dict
-            """
-            for obj in list_of_json_objects:
-                if isinstance(obj, dict) and "metrics" in obj:
-                    metrics = obj["metrics"]
-                    # Parse JSON string if metrics is stored as string
-                    if isinstance(metrics, str):
-                        try:
-                            import json
-
-                            metrics = json.loads(metrics)
-                        except (json.JSONDecodeError, TypeError):
-                            continue
-
-                    if isinstance(metrics, dict):
-                        read_metric_name = metrics.get("metric_name", "")
-
-                        # Condition
-                        if metric_name == read_metric_name:
-                            return True, obj
-            return False, None
-
         # Check if caching is enabled
-        if not os.getenv("METRICS_CACHE_ENABLED", "false").lower() == "true":
+        if not metrics_cache_enabled():
             return None
 
-        # database retrieval here
-        metrics = get_api_client().get_session_metrics(session_id=session_id)
+        # database retrieval here, off the event loop since the DAL call blocks
+        if session_indices is None:
+            index = await asyncio.to_thread(_session_metric_index, session_id)
+        else:
+            pending = session_indices.get(session_id)
+            if pending is None:
+                pending = session_indices[session_id] = asyncio.ensure_future(
+                    asyncio.to_thread(_session_metric_index, session_id)
+                )
+            index = await pending
+        metrics = index.get(metric_name, [])
 
         # Handle agent-specific caching
         if context and context.get("agent_computation"):
@@ -318,26 +508,8 @@ class BaseMetric(ABC):
             is_cached_metric, metric = self._check_session_cache(metrics, metric_name)
 
             if is_cached_metric:
-                metric_data = metric.get("metrics", {})
-
-                # Parse JSON string if metrics is stored as string
-                if isinstance(metric_data, str):
-                    try:
-                        import json
-
-                        metric_data = json.loads(metric_data)
-                    except (json.JSONDecodeError, TypeError):
-                        return None
-
-                metric_data["from_cache"] = True
-
-                # Ensure required fields are present for backward compatibility with cached data
-                if "category" not in metric_data:
-                    metric_data["category"] = "application"  # Default category
-                if "app_name" not in metric_data:
-                    metric_data["app_name"] = "unknown"  # Default app_name
-
-                return MetricResult(**metric_data)
+                # Payload was already decoded by _check_session_cache
+                return _result_from_cache(metric["metrics"])
             return None
 
     def _check_agent_cache(
@@ -345,32 +517,14 @@ class BaseMetric(ABC):
     ) -> Optional[MetricResult]:
         """Check cache for specific agent result"""
         for obj in metrics:
-            if isinstance(obj, dict) and "metrics" in obj:
-                metric_data = obj["metrics"]
-
-                # Parse JSON string if metrics is stored as string
-                if isinstance(metric_data, str):
-                    try:
-                        import json
-
-                        metric_data = json.loads(metric_data)
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-
-                if isinstance(metric_data, dict):
-                    # Check if this matches our metric and agent
-                    if (
-                        metric_data.get("metric_name") == metric_name
-                        and metric_data.get("metadata", {}).get("agent_id") == agent_id
-                    ):
-                        metric_data["from_cache"] = True
-                        # Ensure backward compatibility
-                        if "category" not in metric_data:
-                            metric_data["category"] = "application"
-                        if "app_name" not in metric_data:
-                            metric_data["app_name"] = "unknown"
-
-                        return MetricResult(**metric_data)
+            metric_data = _decode_cached_metric(obj)
+            if metric_data is not None:
+                # Check if this matches our metric and agent
+                if (
+                    metric_data.get("metric_name") == metric_name
+                    and metric_data.get("metadata", {}).get("agent_id") == agent_id
+                ):
+                    return _result_from_cache(metric_data)
         return None
 
     def _check_all_agents_cache(
@@ -380,30 +534,13 @@ class BaseMetric(ABC):
         agent_results = []
 
         for obj in metrics:
-            if isinstance(obj, dict) and "metrics" in obj:
-                metric_data = obj["metrics"]
-
-                # Parse JSON string if metrics is stored as string
-                if isinstance(metric_data, str):
-                    try:
-                        import json
-
-                        metric_data = json.loads(metric_data)
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-
-                if isinstance(metric_data, dict):
-                    # Check if this is an agent result for our metric
-                    if metric_data.get(
-                        "metric_name"
-                    ) == metric_name and "agent_id" in metric_data.get("metadata", {}):
-                        metric_data["from_cache"] = True
-                        if "category" not in metric_data:
-                            metric_data["category"] = "application"
-                        if "app_name" not in metric_data:
-                            metric_data["app_name"] = "unknown"
-
-                        agent_results.append(MetricResult(**metric_data))
+            metric_data = _decode_cached_metric(obj)
+            if metric_data is not None:
+                # Check if this is an agent result for our metric
+                if metric_data.get(
+                    "metric_name"
+                ) == metric_name and "agent_id" in metric_data.get("metadata", {}):
+                    agent_results.append(_result_from_cache(metric_data))
 
         return agent_results if agent_results else None
 
@@ -412,30 +549,19 @@ class BaseMetric(ABC):
     ) -> tuple[bool, dict]:
         """Check cache for session-level metrics only (excludes agent metrics)"""
         for obj in metrics:
-            if isinstance(obj, dict) and "metrics" in obj:
-                metric_data = obj["metrics"]
-
-                # Parse JSON string if metrics is stored as string
-                if isinstance(metric_data, str):
-                    try:
-                        import json
-
-                        metric_data = json.loads(metric_data)
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-
-                if isinstance(metric_data, dict):
-                    read_metric_name = metric_data.get("metric_name", "")
-                    aggregation_level = metric_data.get("aggregation_level", "")
-                    has_agent_id = "agent_id" in metric_data.get("metadata", {})
-
-                    # Only match session-level metrics (not agent-level)
-                    if (
-                        metric_name == read_metric_name
-                        and aggregation_level == "session"
-                        and not has_agent_id
-                    ):
-                        return True, obj
+            metric_data = _decode_cached_metric(obj)
+            if metric_data is not None:
+                read_metric_name = metric_data.get("metric_name", "")
+                aggregation_level = metric_data.get("aggregation_level", "")
+                has_agent_id = "agent_id" in metric_data.get("metadata", {})
+
+                # Only match session-level metrics (not agent-level)
+                if (
+                    metric_name == read_metric_name
+                    and aggregation_level == "session"
+                    and not has_agent_id
+                ):
+                    return True, obj
         return False, None
 
     def get_default_provider(self) -> str:
@@ -448,7 +574,11 @@ class BaseMetric(ABC):
         return None
 
     def create_native_model(self, llm_config: LLMJudgeConfig) -> Any:
-        jury = Jury(llm_config.model_dump())
+        config = llm_config.model_dump()
+        weights = getattr(llm_config, "JURY_WEIGHTS", None)
+        if weights:
+            return JuryEnsemble([(Jury(config), weight) for weight in weights])
+        jury = Jury(config)
         return jury
 
 
@@ -462,16 +592,25 @@ class CustomBaseMetric(BaseMetric, ABC):
         None  # User must set this in the class definition
     )
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Validate once at class definition instead of on every instantiation.
+        # ABCMeta fills __abstractmethods__ only after this hook runs, so look
+        # for still-abstract members directly to let intermediate bases through.
+        is_abstract = any(
+            getattr(getattr(cls, attr, None), "__isabstractmethod__", False)
+            for attr in dir(cls)
+        )
+        if cls.aggregation_level is None and not is_abstract:
+            raise TypeError(
+                f"{cls.__name__} must set aggregation_level as a class variable."
+            )
+
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
         if metric_name is None:
             metric_name = self.__class__.__name__
         self.name = metric_name
-        # Optionally check that subclass has defined aggregation_level
-        if self.aggregation_level is None:
-            raise ValueError(
-                "aggregation_level must be set as a class variable in your metric subclass."
-            )
 
     @property
     def required_parameters(self) -> List[str]:
@@ -13,12 +13,17 @@ from metrics_computation_engine.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Entity types whose names form the interaction graph edges
+_AGENT_TOOL = frozenset(("agent", "tool"))
+
 
 class GraphDeterminismScore(BaseMetric):
     """
     Collects the Agent to Agent Interactions counts throughout a trace.
     """
 
+    is_cpu_bound = True
+
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
         if metric_name is None:
@@ -58,7 +63,7 @@ class GraphDeterminismScore(BaseMetric):
             for session in data.sessions:
                 filtered_events = []
                 for span in session.spans:
-                    if span.entity_type in ["agent", "tool"]:
+                    if span.entity_type in _AGENT_TOOL:
                         filtered_events.append(span.entity_name)
                         entities_involved.append(span.entity_name)
                 edges = []
@@ -13,6 +13,8 @@ class AgentToAgentInteractions(BaseMetric):
     Collects the Agent to Agent Interactions counts throughout a trace.
     """
 
+    is_cpu_bound = True
+
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
         if metric_name is None:
@@ -39,19 +41,11 @@ class AgentToAgentInteractions(BaseMetric):
     async def compute(self, session: SessionEntity, **context):
         try:
             # Use pre-computed agent transitions from SessionEntity
-            transition_counts = (
-                session.agent_transition_counts
-                if session.agent_transition_counts
-                else Counter()
-            )
-            transitions = session.agent_transitions if session.agent_transitions else []
+            transition_counts = session.agent_transition_counts or Counter()
+            transitions = session.agent_transitions or []
 
-            # Get span IDs from agent spans
-            span_ids = (
-                [span.span_id for span in session.agent_spans]
-                if session.agent_spans
-                else []
-            )
+            # Get span IDs from agent spans (memoized, empty when there are none)
+            span_ids = [span.span_id for span in session.agent_spans]
 
             return MetricResult(
                 metric_name=self.name,
@@ -13,6 +13,8 @@ class AgentToToolInteractions(BaseMetric):
     Collects the Agent to Tool Interactions counts throughout a trace.
     """
 
+    is_cpu_bound = True
+
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
         if metric_name is None:
@@ -38,18 +40,30 @@ class AgentToToolInteractions(BaseMetric):
 
     async def compute(self, session: SessionEntity, **context):
         try:
-            tool_spans = session.tool_spans if session.tool_spans else []
-
-            transitions = []
-            for span in tool_spans:
-                span_attrs = span.raw_span_data.get("SpanAttributes", {})
-                workflow_name = span_attrs["ioa_observe.workflow.name"]
-                tool_name = span_attrs.get("traceloop.entity.name", span.entity_name)
+            columns = session.span_columns
 
-                transition = f"(Agent: {workflow_name}) -> (Tool: {tool_name})"
-                transitions.append(transition)
+            # Single pass over the columns collects both the pairs and span ids
+            pairs, span_ids = [], []
+            for entity_type, workflow_name, tool_name, span_id in zip(
+                columns.entity_types,
+                columns.workflow_names,
+                columns.tool_names,
+                columns.span_ids,
+            ):
+                if entity_type != "tool":
+                    continue
+                if workflow_name is None:
+                    raise KeyError("ioa_observe.workflow.name")
+                pairs.append((workflow_name, tool_name))
+                span_ids.append(span_id)
 
-            transition_counts = Counter(transitions)
+            # Count (agent, tool) tuples and format each distinct pair only once
+            transition_counts = Counter(
+                {
+                    f"(Agent: {workflow_name}) -> (Tool: {tool_name})": count
+                    for (workflow_name, tool_name), count in Counter(pairs).items()
+                }
+            )
 
             return MetricResult(
                 metric_name=self.name,
@@ -60,14 +74,14 @@ class AgentToToolInteractions(BaseMetric):
                 description="Agent to tool interaction counts",
                 reasoning="",
                 unit="interactions",
-                span_id=[span.span_id for span in tool_spans],
+                span_id=span_ids,
                 session_id=[session.session_id],
                 source="native",
                 entities_involved=[],
                 edges_involved=[],
                 success=True,
                 metadata={
-                    "total_tool_calls": len(tool_spans),
+                    "total_tool_calls": len(span_ids),
                     "unique_interactions": len(transition_counts),
                 },
                 error_message=None,
@@ -94,5 +108,5 @@ class AgentToToolInteractions(BaseMetric):
                 edges_involved=[],
                 success=False,
                 metadata={},
-                error_message=e,
+                error_message=str(e),
             )
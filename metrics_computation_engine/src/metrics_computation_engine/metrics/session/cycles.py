@@ -1,7 +1,8 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Hashable, List, Optional, Sequence, Tuple
 from metrics_computation_engine.metrics.base import BaseMetric
 from metrics_computation_engine.models.eval import MetricResult
 from metrics_computation_engine.entities.models.session import SessionEntity
@@ -11,11 +12,103 @@ from metrics_computation_engine.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+# Polynomial rolling-hash parameters; products stay below 2**62 so they fit int64
+_HASH_BASE = 1_000_003
+_HASH_MOD = 2_147_483_647
+
+# Entity types whose names make up the cycle event sequence
+_AGENT_TOOL = frozenset(("agent", "tool"))
+
+
+def _count_cycles(ids, min_cycle_len):
+    """
+    Count contiguous repeated windows in an integer-encoded event sequence.
+
+    Candidate window pairs are rejected on their first element, then compared
+    in O(1) through prefix hashes; they are only checked element by element
+    when the hashes match.
+    Written with plain loops only so the same function can be compiled by
+    numba when it is available.
+    """
+    n = len(ids)
+    prefix = [0] * (n + 1)
+    powers = [1] * (n + 1)
+    for j in range(n):
+        prefix[j + 1] = (prefix[j] * _HASH_BASE + ids[j] + 1) % _HASH_MOD
+        powers[j + 1] = (powers[j] * _HASH_BASE) % _HASH_MOD
+
+    # Length-2 cycles dominate agent loops; check them without hashing
+    pair_fast_path = min_cycle_len == 2
+    first_k = 3 if pair_fast_path else min_cycle_len
+
+    cycle_count = 0
+    i = 0
+    # Once fewer than two minimal windows remain, no further cycle can start
+    while n - i >= 2 * min_cycle_len:
+        if pair_fast_path and ids[i] == ids[i + 2] and ids[i + 1] == ids[i + 3]:
+            cycle_count += 1
+            i += 2
+            continue
+        found_cycle = False
+        max_k = (n - i) >> 1
+        for k in range(first_k, max_k + 1):
+            mid = i + k
+            if ids[i] != ids[mid]:
+                continue
+            end = mid + k
+            left = (prefix[mid] - prefix[i] * powers[k]) % _HASH_MOD
+            right = (prefix[end] - prefix[mid] * powers[k]) % _HASH_MOD
+            if left != right:
+                continue
+            is_match = True
+            for t in range(k):
+                if ids[i + t] != ids[mid + t]:
+                    is_match = False
+                    break
+            if is_match:
+                cycle_count += 1
+                found_cycle = True
+                i = mid
+                break
+        if not found_cycle:
+            i += 1
+    return cycle_count
+
+
+try:
+    import numpy as np
+    from numba import njit
+
+    _count_cycles_jit = njit(cache=True)(_count_cycles)
+except ImportError:
+    _count_cycles_jit = None
+
+
+def _encode_sequence(seq: Sequence[Hashable]) -> List[int]:
+    """Intern each distinct event name to a small integer, preserving order."""
+    codes = {}
+    return [codes.setdefault(item, len(codes)) for item in seq]
+
+
+@lru_cache(maxsize=4096)
+def _cycle_count(events: Tuple[Hashable, ...], min_cycle_len: int) -> int:
+    """
+    Cycle count of an event sequence, memoized since the same trajectories
+    recur across sessions and between session- and agent-level runs.
+    """
+    ids = _encode_sequence(events)
+    if _count_cycles_jit is not None:
+        return int(_count_cycles_jit(np.asarray(ids, dtype=np.int32), min_cycle_len))
+    return _count_cycles(ids, min_cycle_len)
+
+
 class CyclesCount(BaseMetric):
     """
     Counts contiguous cycles in agent and tool interactions.
     """
 
+    is_cpu_bound = True
+
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
         if metric_name is None:
@@ -44,20 +137,7 @@ class CyclesCount(BaseMetric):
         return True
 
     def count_contiguous_cycles(self, seq, min_cycle_len=2):
-        n = len(seq)
-        cycle_count = 0
-        i = 0
-        while i < n:
-            found_cycle = False
-            for k in range(min_cycle_len, (n - i) // 2 + 1):
-                if seq[i : i + k] == seq[i + k : i + 2 * k]:
-                    cycle_count += 1
-                    found_cycle = True
-                    i += k
-                    break
-            if not found_cycle:
-                i += 1
-        return cycle_count
+        return _cycle_count(tuple(seq), min_cycle_len)
 
     async def compute(self, session: SessionEntity, **context) -> MetricResult:
         # Session-level computation (existing logic)
@@ -71,13 +151,16 @@ class CyclesCount(BaseMetric):
             # Sort by timestamp to maintain order
             # agent_tool_spans.sort(key=lambda x: x.timestamp or "")
 
-            agent_tool_spans = [
-                span for span in session.spans if span.entity_type in ["agent", "tool"]
-            ]
-            events = [span.entity_name for span in agent_tool_spans]
+            # Agent and tool rows in span order, read from the column view
+            columns = session.span_columns
+            positions = sorted(
+                columns.indices_of("agent") + columns.indices_of("tool")
+            )
+            names, all_span_ids = columns.entity_names, columns.span_ids
+            events = [names[i] for i in positions]
             cycle_count = self.count_contiguous_cycles(events)
 
-            span_ids = [span.span_id for span in agent_tool_spans]
+            span_ids = [all_span_ids[i] for i in positions]
 
             result = self._create_success_result(
                 score=cycle_count,
@@ -152,7 +235,7 @@ class CyclesCount(BaseMetric):
                 agent_tool_spans = [
                     span
                     for span in agent_view.all_spans
-                    if span.entity_type in ["agent", "tool"]
+                    if span.entity_type in _AGENT_TOOL
                 ]
 
                 # Extract entity names and compute cycles
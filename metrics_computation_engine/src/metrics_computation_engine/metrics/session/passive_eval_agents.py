@@ -16,6 +16,8 @@ class PassiveEvalAgents(BaseMetric):
     Returns various stats for the agents for a given application.
     """
 
+    is_cpu_bound = True
+
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
         if metric_name is None:
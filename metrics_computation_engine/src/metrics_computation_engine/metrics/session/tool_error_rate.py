@@ -17,6 +17,8 @@ class ToolErrorRate(BaseMetric):
     Calculates the percentage of tool spans that resulted in an error.
     """
 
+    is_cpu_bound = True
+
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
         if metric_name is None:
@@ -47,12 +49,21 @@ class ToolErrorRate(BaseMetric):
     async def compute(self, session: SessionEntity, **context) -> MetricResult:
         # Session-level computation (existing logic)
         try:
-            tool_spans = session.tool_spans if session.tool_spans else []
-            total_tool_calls = len(tool_spans)
-
-            error_spans = [span for span in tool_spans if span.contains_error]
-            total_tool_errors = len(error_spans)
-            error_span_ids = [span.span_id for span in error_spans]
+            if session.tool_span_count == 0:
+                # Nothing to rate; skip building the column view
+                tool_span_ids, error_span_ids = [], []
+            else:
+                columns = session.span_columns
+
+                # Only the tool rows of the span_id / contains_error columns are read
+                tool_indices = columns.indices_of("tool")
+                span_ids, contains_error = columns.span_ids, columns.contains_error
+                tool_span_ids = [span_ids[i] for i in tool_indices]
+                error_span_ids = [
+                    span_ids[i] for i in tool_indices if contains_error[i]
+                ]
+            total_tool_calls = len(tool_span_ids)
+            total_tool_errors = len(error_span_ids)
 
             tool_error_rate = (
                 (total_tool_errors / total_tool_calls) * 100 if total_tool_calls else 0
@@ -73,7 +84,7 @@ class ToolErrorRate(BaseMetric):
             result.metadata = {
                 "total_tool_calls": total_tool_calls,
                 "total_tool_errors": total_tool_errors,
-                "all_tool_span_ids": [span.span_id for span in tool_spans],
+                "all_tool_span_ids": tool_span_ids,
             }
 
             return result
@@ -3,8 +3,8 @@
 
 from typing import List, Optional
 
-from metrics_computation_engine.metrics.base import BaseMetric
-from metrics_computation_engine.models.eval import BinaryGrading
+from metrics_computation_engine.metrics.base import BaseMetric, judge_in_thread
+from metrics_computation_engine.models.eval import BinaryGrading, MetricResult
 
 
 class TaskDelegationAccuracy(BaseMetric):
@@ -24,6 +24,24 @@ class TaskDelegationAccuracy(BaseMetric):
     1: Task delegation was accurate
     0: Task delegation was not accurate
     """
+    TASK_DELEGATION_ACCURACY_BATCH_PROMPT = """
+    You are an evaluator tasked with assessing the Task Delegation Accuracy of several agents in a multi-agent application. Each agent received a task as input and produced an output, either by handling the task itself or by delegating it.
+
+    Grade each numbered agent delegation independently and return exactly one grading per delegation, in the same order.
+
+    {items}
+
+    Evaluation Task: Assess the task delegation accuracy of each delegation.
+
+    Scoring Rubric:
+    1: Task delegation was accurate
+    0: Task delegation was not accurate
+    """
+    DELEGATION_ITEM = """
+    Delegation {index}:
+    Agent Input: {agent_input}
+    Agent Output: {agent_output}
+    """
 
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
@@ -51,10 +69,33 @@ class TaskDelegationAccuracy(BaseMetric):
     def create_model(self, llm_config):
         return self.create_native_model(llm_config)
 
+    def _success_result(self, data, score, reasoning) -> MetricResult:
+        return self._create_success_result(
+            score,
+            category="agent",
+            app_name=data.app_name,
+            agent_id=data.agent_id,
+            reasoning=reasoning,
+            span_ids=[data.span_id],
+            session_ids=[data.session_id],
+        )
+
+    async def compute_batch(self, spans, **context) -> List[MetricResult]:
+        """Grade all agent spans of a session with a single judge request."""
+        return await self._judge_spans_batched(
+            spans,
+            lambda index, data: self.DELEGATION_ITEM.format(
+                index=index,
+                agent_input=data.input_payload,
+                agent_output=data.output_payload,
+            ),
+            self.TASK_DELEGATION_ACCURACY_BATCH_PROMPT,
+            self._success_result,
+            **context,
+        )
+
     async def compute(self, data, **context):
-        if data.entity_type not in self.required["entity_type"] or not (
-            data.input_payload and data.output_payload and data.entity_name
-        ):
+        if not self._is_judgeable_span(data):
             return self._create_error_result(
                 category="agent",
                 app_name=data.app_name,
@@ -66,16 +107,8 @@ class TaskDelegationAccuracy(BaseMetric):
                 agent_input=data.input_payload, agent_output=data.output_payload
             )
 
-            score, reasoning = self.jury.judge(prompt, BinaryGrading)
-            return self._create_success_result(
-                score,
-                category="agent",
-                app_name=data.app_name,
-                agent_id=data.agent_id,
-                reasoning=reasoning,
-                span_ids=[data.span_id],
-                session_ids=data.session_id,
-            )
+            score, reasoning = await judge_in_thread(self.jury, prompt, BinaryGrading)
+            return self._success_result(data, score, reasoning)
 
         return self._create_error_result(
             category="agent",
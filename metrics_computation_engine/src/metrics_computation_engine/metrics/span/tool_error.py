@@ -1,16 +1,50 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from metrics_computation_engine.metrics.base import BaseMetric
 
+_MISSING = object()
+
+
+class _Hit:
+    """Stack marker for a value stored under the searched key."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def _find_first(root: Any, search: str = "status") -> Any:
+    """
+    Return the first value stored under ``search`` in a nested dict/list.
+
+    Walks depth-first in insertion order with an explicit stack and stops at
+    the first hit. Returns ``_MISSING`` when the key does not occur.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _Hit):
+            return node.value
+        if isinstance(node, dict):
+            # Push in reverse so entries are visited in insertion order
+            for key, value in reversed(node.items()):
+                stack.append(_Hit(value) if key == search else value)
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return _MISSING
+
 
 class ToolError(BaseMetric):
     """
     Collects the Agent to Agent Interactions counts throughout a trace.
     """
 
+    is_cpu_bound = True
+
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
         if metric_name is None:
@@ -37,19 +71,6 @@ class ToolError(BaseMetric):
         return True
 
     async def compute(self, data, **context):
-        # TODO: Should not be responsible for this here.
-        def find(d, search="status"):
-            """Recursively search for all <search> fields in a nested dict."""
-            if isinstance(d, dict):
-                for key, value in d.items():
-                    if key == search:
-                        yield value
-                    else:
-                        yield from find(value, search)
-            elif isinstance(d, list):
-                for item in d:
-                    yield from find(item, search)
-
         if data.entity_type not in self.required["entity_type"]:
             return self._create_error_result(
                 category="agent",
@@ -57,11 +78,17 @@ class ToolError(BaseMetric):
                 error_message="Entity is not a tool!",
             )
 
-        results = list(find(dict(data), "status"))
+        # TODO: Should not be responsible for this here.
+        # The status lives under the required Events.Attributes subtree; walk it
+        # directly instead of copying the whole span model into a dict.
+        raw_span_data = data.raw_span_data
+        status = _find_first(
+            raw_span_data.get("Events.Attributes", raw_span_data), "status"
+        )
 
-        if len(results) > 0:
+        if status is not _MISSING:
             return self._create_success_result(
-                results[0],
+                status,
                 category="agent",
                 app_name=data.app_name,
                 agent_id=data.agent_id,
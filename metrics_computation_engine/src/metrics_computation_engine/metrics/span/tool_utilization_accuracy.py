@@ -3,8 +3,8 @@
 
 from typing import List, Optional
 
-from metrics_computation_engine.metrics.base import BaseMetric
-from metrics_computation_engine.models.eval import BinaryGrading
+from metrics_computation_engine.metrics.base import BaseMetric, judge_in_thread
+from metrics_computation_engine.models.eval import BinaryGrading, MetricResult
 
 
 class ToolUtilizationAccuracy(BaseMetric):
@@ -35,6 +35,26 @@ class ToolUtilizationAccuracy(BaseMetric):
     1: The tool call was completeley reasonable addressed the input.
     0: It is unclear why this tool was called and/or it failed to provide useful output.
     """
+    TOOL_UTILIZATION_ACCURACY_BATCH_PROMPT = """
+    You are an evaluator tasked with assessing the Tool Utilization Accuracy of several tool calls made by an AI agent.
+
+    Grade each numbered tool call independently and return exactly one grading per tool call, in the same order.
+
+    {items}
+
+    Evaluation Task - For each tool call, determine if the tool called was reasonable in response to the input. Further determine if the tool was able to provide output to address the needs in the input.
+
+    Scoring Rubric:
+    1: The tool call was completeley reasonable addressed the input.
+    0: It is unclear why this tool was called and/or it failed to provide useful output.
+    """
+    TOOL_CALL_ITEM = """
+    Tool Call {index}:
+    Input: {tool_input}
+    Tool Called: {tool_name}
+    Tool Definition: {tool_definition}
+    Output: {tool_output}
+    """
 
     def __init__(self, metric_name: Optional[str] = None):
         super().__init__()
@@ -62,10 +82,36 @@ class ToolUtilizationAccuracy(BaseMetric):
     def create_model(self, llm_config):
         return self.create_native_model(llm_config)
 
+    def _success_result(self, data, score, reasoning) -> MetricResult:
+        return self._create_success_result(
+            score,
+            category="agent",
+            app_name=data.app_name,
+            agent_id=data.agent_id,
+            reasoning=reasoning,
+            entities_involved=[data.entity_name],
+            span_ids=[data.span_id],
+            session_ids=[data.session_id],
+        )
+
+    async def compute_batch(self, spans, **context) -> List[MetricResult]:
+        """Grade all tool spans of a session with a single judge request."""
+        return await self._judge_spans_batched(
+            spans,
+            lambda index, data: self.TOOL_CALL_ITEM.format(
+                index=index,
+                tool_input=data.input_payload,
+                tool_output=data.output_payload,
+                tool_name=data.entity_name,
+                tool_definition=data.tool_definition,
+            ),
+            self.TOOL_UTILIZATION_ACCURACY_BATCH_PROMPT,
+            self._success_result,
+            **context,
+        )
+
     async def compute(self, data, **context):
-        if data.entity_type not in self.required["entity_type"] or not (
-            data.input_payload and data.output_payload and data.entity_name
-        ):
+        if not self._is_judgeable_span(data):
             return self._create_error_result(
                 category="agent",
                 app_name=data.app_name,
@@ -83,17 +129,8 @@ class ToolUtilizationAccuracy(BaseMetric):
                 tool_definition=data.tool_definition,
             )
 
-            score, reasoning = self.jury.judge(prompt, BinaryGrading)
-            return self._create_success_result(
-                score,
-                category="agent",
-                app_name=data.app_name,
-                agent_id=data.agent_id,
-                reasoning=reasoning,
-                entities_involved=[data.entity_name],
-                span_ids=[data.span_id],
-                session_ids=[data.session_id],
-            )
+            score, reasoning = await judge_in_thread(self.jury, prompt, BinaryGrading)
+            return self._success_result(data, score, reasoning)
 
         return self._create_error_result(
             category="agent",
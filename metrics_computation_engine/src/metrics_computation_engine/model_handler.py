@@ -57,6 +57,8 @@ class ModelHandler:
             "LLM_API_KEY_HASH": hashlib.sha256(
                 getattr(llm_config, "LLM_API_KEY", "").encode()
             ).hexdigest()[:16],
+            # Ensemble and single-jury judges must not share a cache entry
+            "JURY_WEIGHTS": getattr(llm_config, "JURY_WEIGHTS", None),
         }
 
         config_str = json.dumps(config_dict, sort_keys=True)
@@ -7,9 +7,13 @@ from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricResult:
-    """Result of a metric computation"""
+    """Result of a metric computation
+
+    Results are still mutated after construction (labels, app name,
+    descriptions), so the class uses slots rather than being frozen.
+    """
 
     metric_name: str
     value: Union[float, int, str, Dict[str, Any]]
@@ -32,6 +36,30 @@ class MetricResult:
     error_message: Optional[str] = None
     from_cache: bool = False
 
+    @classmethod
+    def error_result(
+        cls, metric: Any, data: Any, error_message: str
+    ) -> "MetricResult":
+        """Build the failed result reported when ``metric`` raised on ``data``."""
+        try:
+            app_name = data.app_name
+        except AttributeError:
+            try:
+                app_name = data.spans[0].app_name
+            except (AttributeError, IndexError, TypeError):
+                app_name = "unknown-app"
+
+        return cls(
+            metric_name=metric.name,
+            value=-1,
+            aggregation_level=metric.aggregation_level,
+            category="application",
+            app_name=app_name,
+            source="native",
+            success=False,
+            error_message=error_message,
+        )
+
 
 class BinaryGrading(BaseModel):
     """
@@ -57,3 +85,19 @@ class BinaryGrading(BaseModel):
         ge=0,
         le=1,
     )
+
+
+class BatchBinaryGrading(BaseModel):
+    """
+    A Pydantic model for grading several numbered items in a single judge call.
+
+    Attributes:
+    -----------
+    gradings : List[BinaryGrading]
+        One grading per item, in the same order as the items in the prompt.
+    """
+
+    gradings: List[BinaryGrading] = Field(
+        title="Gradings",
+        description="""A JSON list with one object per numbered item, in item order. Each object has `score_reasoning` (concise feedback, ≤100 words) and `metric_score` (1 or 0, strictly following the rubric).""",
+    )
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime, timedelta, timezone
 
 
@@ -11,6 +11,13 @@ class LLMJudgeConfig(BaseModel):
     LLM_MODEL_NAME: str = "gpt-5"
     LLM_API_KEY: str = "sk-..."
     NUM_LLM_RETRIES: int = 3
+    # Cap on metric computations (and judge requests) in flight for this
+    # judge endpoint; None keeps the processor's max_concurrency
+    MAX_CONCURRENCY: Optional[int] = Field(default=None, ge=1)
+    # One weight per juror: each entry adds an independent Jury to a
+    # JuryEnsemble whose verdict is the weighted median; None judges with a
+    # single Jury
+    JURY_WEIGHTS: Optional[List[float]] = None
 
 
 class BatchTimeRange(BaseModel):
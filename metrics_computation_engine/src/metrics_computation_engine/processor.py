@@ -3,13 +3,12 @@
 
 import logging
 import asyncio
-import inspect
 import json
 import traceback
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from metrics_computation_engine.constants import BINARY_GRADING_LABELS, DEEPEVAL_METRICS
-from metrics_computation_engine.metrics.base import BaseMetric
+from metrics_computation_engine.metrics.base import BaseMetric, metrics_cache_enabled
 from metrics_computation_engine.models.eval import MetricResult
 from metrics_computation_engine.entities.models.session import SessionEntity
 from metrics_computation_engine.entities.models.session_set import SessionSet
@@ -20,6 +19,79 @@ from metrics_computation_engine.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+def _missing_conversation_data(value: Any) -> Optional[str]:
+    # conversation_data needs its nested elements, not just a non-empty dict
+    if isinstance(value, dict):
+        return None if value.get("elements") else "conversation_data.elements"
+    return None if value else "conversation_data"
+
+
+# Upper bound on metric computations in flight at once; bounds the number of
+# live coroutines and concurrent judge requests for large session sets
+DEFAULT_MAX_CONCURRENCY = 64
+
+
+class _BoundedTasks:
+    """
+    Ordered result slots whose coroutines run as at most ``limit`` tasks.
+
+    Coroutines are started as they are added; once ``limit`` are running,
+    adding another waits for one to finish. Inline results keep their slot,
+    so results() preserves submission order.
+    """
+
+    def __init__(self, limit: Optional[int]):
+        if limit is not None and limit < 1:
+            raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
+        self._limit = limit
+        self._slots: List[Any] = []
+        self._running: set = set()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add_result(self, result: Any) -> None:
+        self._slots.append(result)
+
+    async def add(self, coro) -> None:
+        while self._limit is not None and len(self._running) >= self._limit:
+            _, self._running = await asyncio.wait(
+                self._running, return_when=asyncio.FIRST_COMPLETED
+            )
+        task = asyncio.create_task(coro)
+        self._running.add(task)
+        self._slots.append(task)
+
+    async def results(self) -> List[Any]:
+        if self._running:
+            await asyncio.wait(self._running)
+            self._running = set()
+        return [
+            slot.result() if isinstance(slot, asyncio.Task) else slot
+            for slot in self._slots
+        ]
+
+
+# metric_results bucket for each aggregation level
+_RESULT_KEYS = {
+    "span": "span_metrics",
+    "session": "session_metrics",
+    "agent": "agent_metrics",
+    "population": "population_metrics",
+}
+# Levels whose results belong to one session and take that session's app name
+_SESSION_SCOPED_LEVELS = frozenset(("span", "session", "agent"))
+
+# Levels whose results are looked up in the metric cache by session id
+_CACHED_LEVELS = frozenset(("span", "session"))
+
+# Per-parameter checks returning the label to report as missing (None if ok);
+# parameters without an entry only need a truthy value
+_SESSION_PARAM_CHECKS = {
+    "conversation_data": _missing_conversation_data,
+}
+
+
 class MetricsProcessor:
     """Main processor for computing metrics"""
 
@@ -31,21 +103,30 @@ class MetricsProcessor:
         dataset=None,  # TODO: remove dataset
         include_stack_trace: bool = False,
         include_unmatched_spans: bool = False,
+        include_results_by_name: bool = False,
         reorg_by_entity: bool = False,
+        max_concurrency: Optional[int] = DEFAULT_MAX_CONCURRENCY,
     ):
         self.registry = registry
         self._metric_instances: Dict[str, BaseMetric] = {}
         self._jury = None
+        # Models resolved per (provider, llm_config) so metrics sharing a
+        # provider skip the model handler round-trip
+        self._model_cache: Dict[Tuple[str, int], Any] = {}
         self.dataset = dataset
         self.llm_config = llm_config
         self.model_handler = model_handler
         self.include_stack_trace = include_stack_trace
         self.include_unmatched_spans = include_unmatched_spans
+        # Also index the flat results by metric name under "by_name"
+        self.include_results_by_name = include_results_by_name
         self.reorg_by_entity = reorg_by_entity
-        # Cache for introspection results
-        self._context_support_cache: Dict[str, bool] = {}
+        # None or 0 lets every metric computation run at once
+        self.max_concurrency = max_concurrency
         # Track unmatched spans per metric
         self._unmatched_spans: List[Dict[str, Any]] = []
+        # Cached metric indices fetched per session during one computation
+        self._session_metric_indices: Dict[str, asyncio.Future] = {}
 
     def _format_error_message(self, exception: Exception) -> str:
         """Format error message, optionally including stack trace."""
@@ -83,20 +164,6 @@ class MetricsProcessor:
             }
         )
 
-    def _metric_supports_context(self, metric: BaseMetric) -> bool:
-        """Check if metric's compute method accepts **kwargs (cached)"""
-        metric_class_name = metric.__class__.__name__
-
-        if metric_class_name not in self._context_support_cache:
-            signature = inspect.signature(metric.compute)
-
-            self._context_support_cache[metric_class_name] = any(
-                p.kind == inspect.Parameter.VAR_KEYWORD
-                for p in signature.parameters.values()
-            )
-
-        return self._context_support_cache[metric_class_name]
-
     def _metric_supports_agent_computation(self, metric: BaseMetric) -> bool:
         """Check if metric supports agent-level computation"""
         return (
@@ -159,28 +226,32 @@ class MetricsProcessor:
         """Handle caching and computation for agent-level metrics"""
 
         # Discover agents first - ensure execution_tree is available
-        if not hasattr(data, "execution_tree") or data.execution_tree is None:
+        if getattr(data, "execution_tree", None) is None:
             from metrics_computation_engine.entities.models.execution_tree import (
                 ExecutionTree,
             )
 
             data.execution_tree = ExecutionTree()
 
-        agent_ids = list(data.agent_stats.keys()) if data.agent_stats else []
+        # agent_stats is rebuilt on every access, so read it only once
+        agent_ids = list(data.agent_stats)
 
         if not agent_ids:
             logger.debug(
-                f"No agents found for {metric.name} in session {data.session_id}"
+                "No agents found for %s in session %s", metric.name, data.session_id
             )
             return []  # No agents found
 
-        logger.debug(f"Found {len(agent_ids)} agents for {metric.name}: {agent_ids}")
+        logger.debug(
+            "Found %d agents for %s: %s", len(agent_ids), metric.name, agent_ids
+        )
 
         # Try to get all agent results from cache at once
         cached_results = await metric.check_cache_metric(
             metric_name=metric.name,
             session_id=data.session_id,
             context=context,  # This will trigger _check_all_agents_cache
+            session_indices=self._session_metric_indices,
         )
 
         # Filter cached results to only include agents from current session
@@ -194,20 +265,22 @@ class MetricsProcessor:
             if len(filtered_results) == len(agent_ids):
                 # All agents cached
                 logger.debug(
-                    f"Cache hit for all {len(agent_ids)} agents of {metric.name}"
+                    "Cache hit for all %d agents of %s", len(agent_ids), metric.name
                 )
                 return filtered_results
             else:
                 logger.debug(
-                    f"Partial cache hit: {len(filtered_results)}/{len(agent_ids)} agents cached"
+                    "Partial cache hit: %d/%d agents cached",
+                    len(filtered_results),
+                    len(agent_ids),
                 )
                 # For now, recompute all if not all cached (simpler logic)
                 pass
 
         # Some or all agents missing from cache - compute all
-        logger.debug(f"Cache miss for {metric.name} agents, computing...")
+        logger.debug("Cache miss for %s agents, computing...", metric.name)
 
-        if self._metric_supports_context(metric):
+        if metric._supports_context:
             new_results = await metric.compute_with_dispatch(data, **context)
         else:
             new_results = await metric.compute_with_dispatch(data)
@@ -226,16 +299,20 @@ class MetricsProcessor:
             # Check if this is agent computation
             is_agent_computation = context and context.get("agent_computation", False)
 
-            if is_agent_computation and hasattr(data, "agent_stats"):
+            # Probe the class: agent_stats is a property that walks every span
+            if is_agent_computation and hasattr(type(data), "agent_stats"):
                 # Agent computation - use agent-aware caching
                 return await self._handle_agent_cache_and_compute(metric, data, context)
 
             # Regular session/span computation - existing logic
             cached_result = None
 
-            if metric.aggregation_level in ["span", "session"]:
+            if metric.aggregation_level in _CACHED_LEVELS:
                 cached_result = await metric.check_cache_metric(
-                    metric_name=metric.name, session_id=data.session_id, context=context
+                    metric_name=metric.name,
+                    session_id=data.session_id,
+                    context=context,
+                    session_indices=self._session_metric_indices,
                 )
             if cached_result is not None:
                 if logger.isEnabledFor(logging.DEBUG):
@@ -244,78 +321,105 @@ class MetricsProcessor:
                 return cached_result
 
             # Cache miss - compute normally
-            logger.debug(f"Cache miss for {metric.name}, computing...")
+            logger.debug("Cache miss for %s, computing...", metric.name)
 
-            if self._metric_supports_context(metric) and context is not None:
-                logger.debug(
-                    f"Calling {metric.name} with context: {list(context.keys()) if context else 'None'}"
-                )
+            if metric._supports_context and context is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Calling {metric.name} with context: {list(context.keys()) if context else 'None'}"
+                    )
                 result = await metric.compute(data, **context)
             else:
                 logger.debug(
-                    f"Calling {metric.name} without context (supports_context: {self._metric_supports_context(metric)}, context is None: {context is None})"
+                    "Calling %s without context (supports_context: %s, context is None: %s)",
+                    metric.name,
+                    metric._supports_context,
+                    context is None,
                 )
                 result = await metric.compute(data)
             return result
         except Exception as e:
             logger.exception(f"Error computing metric {metric.name}: {e}")
             # Return error result instead of crashing
-            # Extract basic info from data for error reporting
-            app_name = "unknown-app"
-            if hasattr(data, "app_name"):
-                app_name = data.app_name
-            elif (
-                hasattr(data, "spans")
-                and data.spans
-                and hasattr(data.spans[0], "app_name")
-            ):
-                app_name = data.spans[0].app_name
-
-            return MetricResult(
-                metric_name=metric.name,
-                description="",
-                value=-1,
-                reasoning="",
-                unit="",
-                aggregation_level=metric.aggregation_level,
-                category="application",
-                app_name=app_name,
-                span_id=[],
-                session_id=[],
-                source="native",
-                entities_involved=[],
-                edges_involved=[],
-                success=False,
-                metadata={},
-                error_message=self._format_error_message(e),
+            return MetricResult.error_result(
+                metric, data, self._format_error_message(e)
+            )
+
+    async def _safe_compute_batch(
+        self,
+        metric: BaseMetric,
+        spans: List[Any],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[MetricResult]:
+        """Compute a span metric over all matching spans of a session at once.
+
+        The session-level metric cache is not consulted: a cached row holds one
+        span's verdict and cannot stand in for every span of the batch.
+        Falls back to per-span computation if the batched call fails, so one
+        malformed judge response does not fail every span of the session. The
+        fallback runs the spans one at a time, since this call already holds a
+        single slot of the processor's concurrency limit.
+        """
+        try:
+            return await metric.compute_batch(spans, **(context or {}))
+        except Exception as e:
+            logger.warning(
+                f"Batched computation of {metric.name} failed, computing per span: {e}"
             )
+            return [
+                await self._safe_compute(metric, span, context=context)
+                for span in spans
+            ]
 
-    async def _initialize_metric(self, metric_name: str, metric_class) -> BaseMetric:
-        """Initialize a metric with its required model"""
-        metric_instance = metric_class(metric_name)
+    async def _initialize_metric(
+        self,
+        metric_name: str,
+        metric_class,
+        metric_instance: Optional[BaseMetric] = None,
+    ) -> BaseMetric:
+        """Initialize a metric with its required model
+
+        An already constructed (but not yet initialized) ``metric_instance``
+        is used instead of building a new one.
+        """
+        cpu_bound = getattr(metric_class, "is_cpu_bound", False)
+        if cpu_bound:
+            cached = self._metric_instances.get(metric_name)
+            if isinstance(cached, metric_class):
+                return cached
+
+        if metric_instance is None:
+            metric_instance = metric_class(metric_name)
 
         model_provider = metric_instance.get_model_provider()
         model = None
 
         # If model_provider is None, this metric doesn't need an LLM model
         if model_provider is not None:
-            # Use the enhanced model handler to get or create the model
-            model = await self.model_handler.get_or_create_model(
-                provider=model_provider, llm_config=self.llm_config
-            )
+            model_key = (model_provider, id(self.llm_config))
+            model = self._model_cache.get(model_key)
 
-            # Fallback: if model handler couldn't create it, try the metric's method
             if model is None:
-                # Check if the metric has its own model creation method
-                if hasattr(metric_instance, "create_model"):
-                    model = metric_instance.create_model(self.llm_config)
-                    if model is not None:
-                        # Store the model in the handler for future use
-                        await self.model_handler.set_model(
-                            provider=model_provider,
-                            llm_config=self.llm_config,
-                            model=model,
-                        )
+                # Use the enhanced model handler to get or create the model
+                model = await self.model_handler.get_or_create_model(
+                    provider=model_provider, llm_config=self.llm_config
+                )
+
+                # Fallback: if model handler couldn't create it, try the metric's method
+                if model is None:
+                    # Check if the metric has its own model creation method
+                    if hasattr(metric_instance, "create_model"):
+                        model = metric_instance.create_model(self.llm_config)
+                        if model is not None:
+                            # Store the model in the handler for future use
+                            await self.model_handler.set_model(
+                                provider=model_provider,
+                                llm_config=self.llm_config,
+                                model=model,
+                            )
+
+                if model is not None:
+                    self._model_cache[model_key] = model
 
         # Initialize the metric with the model
         ok = metric_instance.init_with_model(model)
@@ -325,8 +429,57 @@ class MetricsProcessor:
             )
             return None
 
+        if cpu_bound:
+            self._metric_instances[metric_name] = metric_instance
         return metric_instance
 
+    async def _get_span_metric(
+        self,
+        instances: Dict[str, Any],
+        metric_name: str,
+        metric_class,
+        constructed: Optional[Dict[str, BaseMetric]] = None,
+    ) -> Optional[BaseMetric]:
+        """Initialize a span-level metric once per computation and reuse it.
+
+        Span metrics keep no per-span state, so one instance serves every span
+        of the run. Initialization errors are memoized too and re-raised so
+        each affected span still reports the failure. Instances already built
+        while grouping metrics (``constructed``) are initialized in place.
+        """
+        if metric_name not in instances:
+            try:
+                instances[metric_name] = await self._initialize_metric(
+                    metric_name,
+                    metric_class,
+                    constructed.pop(metric_name, None) if constructed else None,
+                )
+            except Exception as e:
+                instances[metric_name] = e
+        instance = instances[metric_name]
+        if isinstance(instance, Exception):
+            raise instance
+        return instance
+
+    async def _submit(
+        self,
+        pending: _BoundedTasks,
+        metric: BaseMetric,
+        data: Any,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Queue a metric computation, running CPU-bound metrics immediately.
+
+        CPU-bound metrics have no I/O to overlap, so their result is stored in
+        place of a task rather than paying for an asyncio task. With the metric
+        cache enabled each computation starts with a DAL lookup, so they are
+        queued like any other metric to keep those lookups concurrent.
+        """
+        if getattr(metric, "is_cpu_bound", False) and not metrics_cache_enabled():
+            pending.add_result(await self._safe_compute(metric, data, context=context))
+        else:
+            await pending.add(self._safe_compute(metric, data, context=context))
+
     def _check_session_requirements(
         self, metric_name: str, session_entity: SessionEntity, required_params: list
     ) -> tuple[bool, Optional[str]]:
@@ -337,41 +490,32 @@ class MetricsProcessor:
             tuple: (is_valid, skip_reason)
         """
         missing = []
-        present = {}
+        present = []
 
         for param in required_params:
             value = getattr(session_entity, param, None)
+            check = _SESSION_PARAM_CHECKS.get(param)
+            if check is not None:
+                missing_label = check(value)
+            else:
+                missing_label = None if value else param
 
-            # Special case: conversation_data needs to check nested elements
-            if param == "conversation_data" and isinstance(value, dict):
-                if not value.get("elements"):
-                    missing.append(f"{param}.elements")
-                    continue
-
-            if not value:
-                missing.append(param)
+            if missing_label is not None:
+                missing.append(missing_label)
             else:
-                present[param] = value
+                present.append(param)
 
         if missing:
-            present_str = ", ".join(present.keys()) if present else "none"
+            present_str = ", ".join(present) if present else "none"
             reason = f"Missing/empty required params: [{', '.join(missing)}]. Present: [{present_str}]"
-            logger.info(
-                f"{metric_name} invalid for session {session_entity.session_id}: {reason}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"{metric_name} invalid for session {session_entity.session_id}: {reason}"
+                )
             return (False, reason)
 
         return (True, None)
 
-    def _get_metric_requirements(self, metric_class, metric_name: str) -> list:
-        """Get required parameters from class without instantiation"""
-        required_params_dict = getattr(metric_class, "REQUIRED_PARAMETERS", {})
-
-        if isinstance(required_params_dict, dict):
-            return required_params_dict.get(metric_name, [])
-
-        return []
-
     def _deduplicate_failures(self, failures):
         seen = set()
         deduplicated = []
@@ -582,73 +726,56 @@ class MetricsProcessor:
             return False, "Missing entity_type"
         return True, None
 
-    def _get_matching_metrics_for_span(
-        self, span: Any, span_metrics: List[tuple]
-    ) -> List[tuple]:
+    def _group_span_metrics_by_entity_type(
+        self,
+        span_metrics: List[tuple],
+        constructed: Optional[Dict[str, BaseMetric]] = None,
+    ) -> Dict[str, List[tuple]]:
         """
-        Get list of metrics that match this span's entity type.
+        Group span-level metrics by the entity types they require.
+
+        Resolved once per computation so each span only needs a dict lookup on
+        its entity type instead of re-checking (and possibly re-instantiating)
+        every requested metric. Instances built to read per-instance
+        requirements are stored in ``constructed`` so they can be initialized
+        instead of constructed a second time.
 
         Returns:
-            List of (metric_name, metric_class) tuples that match the span
+            Dict mapping entity type to the (metric_name, metric_class) tuples
+            that apply to spans of that type
         """
-        matching = []
-        span_entity_type = getattr(span, "entity_type", None)
+        by_entity_type: Dict[str, List[tuple]] = {}
 
-        for metric_name, metric_class in span_metrics:
+        for metric_name, metric_class, *_ in span_metrics:
             # Get required entity types for this metric
             required_types = []
             if hasattr(metric_class, "required"):
                 required_types = metric_class.required.get("entity_type", [])
             else:
-                # Need to instantiate to check
+                # Need to instantiate to check; keep the instance for reuse
                 temp_instance = metric_class(metric_name)
+                if constructed is not None:
+                    constructed[metric_name] = temp_instance
                 if hasattr(temp_instance, "required"):
                     required_types = temp_instance.required.get("entity_type", [])
 
-            if span_entity_type in required_types:
-                matching.append((metric_name, metric_class))
+            # Deduplicate so a repeated type never queues the metric twice
+            for entity_type in dict.fromkeys(required_types):
+                by_entity_type.setdefault(entity_type, []).append(
+                    (metric_name, metric_class)
+                )
 
-        return matching
+        return by_entity_type
 
     def _classify_metrics_by_aggregation_level(self) -> Dict[str, List[tuple]]:
         """
         Pre-classify metrics by aggregation level to avoid repeated filtering.
 
         Returns:
-            Dict mapping aggregation levels to list of (metric_name, metric_class) tuples
+            Dict mapping aggregation levels to list of
+            (metric_name, metric_class, required_params) tuples
         """
-        classified_metrics = {
-            "span": [],
-            "session": [],
-            "agent": [],  # Session-level metrics that support agent computation
-            "population": [],
-        }
-
-        for metric_name in self.registry.list_metrics():
-            metric_class = self.registry.get_metric(metric_name)
-
-            # Determine aggregation level
-            if hasattr(metric_class, "aggregation_level"):
-                agg_level = metric_class.aggregation_level
-            else:
-                # Need to instantiate to get aggregation level
-                temp_instance = metric_class(metric_name)
-                agg_level = temp_instance.aggregation_level
-
-            # Add to appropriate category
-            if agg_level == "span":
-                classified_metrics["span"].append((metric_name, metric_class))
-            elif agg_level == "session":
-                classified_metrics["session"].append((metric_name, metric_class))
-
-                # Also check if it supports agent computation
-                temp_instance = metric_class(metric_name)
-                if self._metric_supports_agent_computation(temp_instance):
-                    classified_metrics["agent"].append((metric_name, metric_class))
-            elif agg_level == "population":
-                classified_metrics["population"].append((metric_name, metric_class))
-
-        return classified_metrics
+        return self.registry.metrics_by_level()
 
     async def compute_metrics(
         self, sessions_set: SessionSet, computation_levels: Optional[List[str]] = None
@@ -666,11 +793,17 @@ class MetricsProcessor:
 
         # Pre-classify metrics by aggregation level for efficiency
         classified_metrics = self._classify_metrics_by_aggregation_level()
-        logger.info(
-            f"Classified metrics: {[(level, len(metrics)) for level, metrics in classified_metrics.items()]}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Classified metrics: {[(level, len(metrics)) for level, metrics in classified_metrics.items()]}"
+            )
 
-        tasks = []
+        # Metric computations in flight, or results of metrics already run inline;
+        # a cap set on the judge config (its endpoint's rate limit) takes precedence
+        judge_limit = getattr(self.llm_config, "MAX_CONCURRENCY", None)
+        tasks = _BoundedTasks(
+            judge_limit if judge_limit is not None else self.max_concurrency
+        )
         metric_results = {
             "span_metrics": [],
             "session_metrics": [],
@@ -679,12 +812,42 @@ class MetricsProcessor:
             "failed_metrics": [],
         }
 
-        # Clear unmatched spans tracking for this computation
+        # Successful results per metric name, filled as results are sorted by level
+        results_by_name: Dict[str, List[MetricResult]] = {}
+
+        # Clear unmatched spans tracking and cache reads for this computation
         self._unmatched_spans = []
+        self._session_metric_indices = {}
+
+        # Span metrics constructed while grouping, awaiting initialization
+        constructed_span_metrics: Dict[str, BaseMetric] = {}
+        span_metrics_by_type = self._group_span_metrics_by_entity_type(
+            classified_metrics["span"], constructed_span_metrics
+        )
+        requested_span_types = list(span_metrics_by_type)
+        span_metric_instances: Dict[str, Any] = {}
+
+        # Context shared by every task of the run. Metrics receive it as
+        # **kwargs copies, so the same dicts can back many concurrent tasks;
+        # stats are read once (and only for session metrics) since each access
+        # re-hashes every session.
+        span_context = {"include_stack_trace": self.include_stack_trace}
+        base_context = {"include_stack_trace": self.include_stack_trace}
+        if classified_metrics["session"]:
+            base_context["session_set_stats"] = sessions_set.stats
+            base_context["session_set"] = sessions_set
 
         for session_index, session_entity in enumerate(
             sessions_set.sessions
         ):  # browse by SessionEntity
+            session_context = {**base_context, "session_index": session_index}
+            agent_context = {**session_context, "agent_computation": True}
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Prepared context with keys: {list(session_context)}")
+
+            # Span metrics exposing compute_batch are judged once per session
+            batched_spans: Dict[str, tuple] = {}
+
             # Span-level metrics: iterate through spans in the session
             for span in session_entity.spans:
                 # 1. Check if span is valid (has required basic fields)
@@ -703,19 +866,10 @@ class MetricsProcessor:
                     continue
 
                 # 2. Find which metrics match this span
-                matching_metrics = self._get_matching_metrics_for_span(
-                    span, classified_metrics["span"]
-                )
+                matching_metrics = span_metrics_by_type.get(span.entity_type, [])
 
                 # 3. If no metrics match, record as no_matching_metrics
                 if not matching_metrics:
-                    all_required_types = []
-                    for _, mc in classified_metrics["span"]:
-                        if hasattr(mc, "required"):
-                            all_required_types.extend(
-                                mc.required.get("entity_type", [])
-                            )
-
                     self._record_unmatched_span(
                         metric_name="ALL",
                         aggregation_level="span",
@@ -726,26 +880,29 @@ class MetricsProcessor:
                         skip_category="no_matching_metrics",
                         details={
                             "app_name": span.app_name,
-                            "requested_metrics_require": list(set(all_required_types)),
+                            "requested_metrics_require": requested_span_types,
                         },
                     )
                     continue
 
                 # 4. Process matching metrics
                 for metric_name, metric_class in matching_metrics:
+                    if hasattr(metric_class, "compute_batch"):
+                        batched_spans.setdefault(metric_name, (metric_class, []))[
+                            1
+                        ].append(span)
+                        continue
                     try:
-                        metric_instance = await self._initialize_metric(
-                            metric_name, metric_class
+                        metric_instance = await self._get_span_metric(
+                            span_metric_instances,
+                            metric_name,
+                            metric_class,
+                            constructed_span_metrics,
                         )
 
                         if metric_instance is not None:
-                            span_context = {
-                                "include_stack_trace": self.include_stack_trace,
-                            }
-                            tasks.append(
-                                self._safe_compute(
-                                    metric_instance, span, context=span_context
-                                )
+                            await self._submit(
+                                tasks, metric_instance, span, context=span_context
                             )
 
                     except Exception as e:
@@ -762,14 +919,43 @@ class MetricsProcessor:
                         )
                         continue
 
+            for metric_name, (metric_class, spans) in batched_spans.items():
+                try:
+                    metric_instance = await self._get_span_metric(
+                        span_metric_instances,
+                        metric_name,
+                        metric_class,
+                        constructed_span_metrics,
+                    )
+                except Exception as e:
+                    for span in spans:
+                        metric_results["failed_metrics"].append(
+                            {
+                                "metric_name": metric_name,
+                                "aggregation_level": "span",
+                                "session_id": [session_entity.session_id],
+                                "span_id": span.span_id,
+                                "app_name": [span.app_name],
+                                "error_message": self._format_error_message(e),
+                                "metadata": {},
+                            }
+                        )
+                    continue
+
+                if metric_instance is not None:
+                    await tasks.add(
+                        self._safe_compute_batch(
+                            metric_instance, spans, context=span_context
+                        )
+                    )
+
             # Session-level metrics: pass the SessionEntity directly
             if "session" in computation_levels:
-                for metric_name, metric_class in classified_metrics["session"]:
-                    logger.info(f"METRIC NAME (session level): {metric_name}")
-                    required_params = self._get_metric_requirements(
-                        metric_class, metric_name
-                    )
-                    logger.info(f"REQUIRED PARAMS: {required_params}")
+                for metric_name, metric_class, required_params in classified_metrics[
+                    "session"
+                ]:
+                    logger.info("METRIC NAME (session level): %s", metric_name)
+                    logger.info("REQUIRED PARAMS: %s", required_params)
 
                     is_valid, skip_reason = self._check_session_requirements(
                         metric_name, session_entity, required_params
@@ -809,47 +995,32 @@ class MetricsProcessor:
                         continue
 
                     if metric_instance is not None:
-                        # Prepare context for metrics that need it
-                        context = {
-                            "include_stack_trace": self.include_stack_trace,
-                        }
-                        if sessions_set is not None:
-                            context.update(
-                                {
-                                    "session_set_stats": sessions_set.stats,
-                                    "session_index": session_index,
-                                    "session_set": sessions_set,
-                                }
-                            )
-                            if logger.isEnabledFor(logging.DEBUG):
-                                logger.debug(
-                                    f"Prepared context with keys: {list(context.keys())}"
-                                )
                         # Pass the SessionEntity directly to session-level metrics
-                        tasks.append(
-                            self._safe_compute(
-                                metric_instance, session_entity, context=context
-                            )
+                        await self._submit(
+                            tasks,
+                            metric_instance,
+                            session_entity,
+                            context=session_context,
                         )
 
             # Agent-level metrics: process session-level metrics that support agent computation
             if "agent" in computation_levels:
                 logger.info(
-                    f"Processing agent-level metrics for session {session_entity.session_id}"
+                    "Processing agent-level metrics for session %s",
+                    session_entity.session_id,
                 )
 
-                for metric_name, metric_class in classified_metrics["agent"]:
-                    logger.info(f"METRIC NAME (agent level): {metric_name}")
+                for metric_name, metric_class, required_params in classified_metrics[
+                    "agent"
+                ]:
+                    logger.info("METRIC NAME (agent level): %s", metric_name)
                     # Check requirements for the session
-                    required_params = self._get_metric_requirements(
-                        metric_class, metric_name
-                    )
                     is_valid, skip_reason = self._check_session_requirements(
                         metric_name, session_entity, required_params
                     )
                     if not is_valid:
                         logger.debug(
-                            f"Session doesn't meet requirements for {metric_name}"
+                            "Session doesn't meet requirements for %s", metric_name
                         )
                         self._record_unmatched_span(
                             metric_name=metric_name,
@@ -865,41 +1036,27 @@ class MetricsProcessor:
                             },
                         )
                         continue
-                    logger.info(f"REQUIRED PARAMS: {required_params}")
+                    logger.info("REQUIRED PARAMS: %s", required_params)
                     # Initialize the metric
                     metric_instance = await self._initialize_metric(
                         metric_name, metric_class
                     )
 
                     if metric_instance is not None:
-                        # Prepare context with agent computation flag
-                        context = {
-                            "include_stack_trace": self.include_stack_trace,
-                            "agent_computation": True,
-                        }
-                        if sessions_set is not None:
-                            context.update(
-                                {
-                                    "session_set_stats": sessions_set.stats,
-                                    "session_index": session_index,
-                                    "session_set": sessions_set,
-                                }
-                            )
-                            logger.debug(
-                                f"Prepared context with agent computation flag for {metric_name}"
-                            )
-
                         # Compute the metric with agent option
-                        tasks.append(
-                            self._safe_compute(
-                                metric=metric_instance,
-                                data=session_entity,
-                                context=context,
-                            )
+                        await self._submit(
+                            tasks,
+                            metric_instance,
+                            session_entity,
+                            context=agent_context,
                         )
 
-        # Population-level metrics: pass all sessions data
-        for metric_name, metric_class in classified_metrics["population"]:
+        # Population-level metrics: pass all sessions data. Skipped outright on
+        # an empty session set, so no model is resolved for nothing to compute
+        population_metrics = (
+            classified_metrics["population"] if sessions_set.sessions else []
+        )
+        for metric_name, metric_class, _ in population_metrics:
             try:
                 metric_instance = await self._initialize_metric(
                     metric_name, metric_class
@@ -930,18 +1087,16 @@ class MetricsProcessor:
 
             if metric_instance is not None:
                 # Pass the entire sessions_data dict for population metrics
-                tasks.append(self._safe_compute(metric_instance, sessions_set))
+                await self._submit(tasks, metric_instance, sessions_set)
 
-        # Execute all tasks concurrently
+        # Wait for the remaining computations; results come back in submission order
         if tasks:
             raw_results: List[
                 Union[MetricResult, List[MetricResult]]
-            ] = await asyncio.gather(*tasks)
+            ] = await tasks.results()
 
             # mapping of session ids / app name
-            sessions_appname_dict = {
-                k: v for k, v in sessions_set.stats.meta.session_ids
-            }
+            sessions_appname_dict = dict(sessions_set.stats.meta.session_ids)
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"sessions_appname_dict: {sessions_appname_dict}")
 
@@ -972,11 +1127,23 @@ class MetricsProcessor:
                     # Single result
                     flattened_results.append(raw_result)
 
-            # Organize results by aggregation level
+            # Organize results by aggregation level; the target lists and
+            # lookups are bound to locals once for the per-result loop
+            failed_list = metric_results["failed_metrics"]
+            level_lists = {
+                level: metric_results[key] for level, key in _RESULT_KEYS.items()
+            }
+            appname_get = sessions_appname_dict.get
+            assign_label = self._assign_metric_label
+            by_name = (
+                results_by_name
+                if self.include_results_by_name and not self.reorg_by_entity
+                else None
+            )
             for result in flattened_results:
                 if result is None:
                     logger.error("Got None result from flattened results - skipping")
-                    metric_results["failed_metrics"].append(
+                    failed_list.append(
                         {
                             "metric_name": result.metric_name,
                             "aggregation_level": result.aggregation_level,
@@ -989,8 +1156,8 @@ class MetricsProcessor:
                         }
                     )
                     continue
-                if (result.value == -1 or result.value == {}) and not result.success:
-                    metric_results["failed_metrics"].append(
+                if not result.success:
+                    failed_list.append(
                         {
                             "metric_name": result.metric_name,
                             "aggregation_level": result.aggregation_level,
@@ -1003,14 +1170,14 @@ class MetricsProcessor:
                         }
                     )
                     continue
-                self._assign_metric_label(result)
+                assign_label(result)
                 aggregation_level = result.aggregation_level
-                if aggregation_level in ["span", "session", "agent"]:
-                    result.app_name = sessions_appname_dict.get(
-                        result.session_id[0], result.app_name
-                    )
+                if aggregation_level in _SESSION_SCOPED_LEVELS:
+                    result.app_name = appname_get(result.session_id[0], result.app_name)
 
-                metric_results[f"{aggregation_level}_metrics"].append(result)
+                level_lists[aggregation_level].append(result)
+                if by_name is not None:
+                    by_name.setdefault(result.metric_name, []).append(result)
 
         metric_results["failed_metrics"] = self._deduplicate_failures(
             metric_results["failed_metrics"]
@@ -1026,5 +1193,7 @@ class MetricsProcessor:
         # Default: return flat structure with optional unmatched_spans
         if self.include_unmatched_spans:
             metric_results["unmatched_spans"] = self._unmatched_spans
+        if self.include_results_by_name:
+            metric_results["by_name"] = results_by_name
 
         return metric_results
@@ -1,7 +1,7 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from metrics_computation_engine.metrics.base import BaseMetric
 
@@ -11,6 +11,9 @@ class MetricRegistry:
 
     def __init__(self, config=None):
         self._metrics: Dict[str, Any] = {}
+        # (metric_name, metric_class, required_params) per aggregation level,
+        # rebuilt lazily after each registration
+        self._by_level: Optional[Dict[str, List[Tuple[str, Any, list]]]] = None
 
     def register_metric(self, metric_class, metric_name: Optional[str] = None):
         """Register either a native metric class or DeepEval metric instance"""
@@ -20,6 +23,7 @@ class MetricRegistry:
         if metric_name is None:
             metric_name = metric_class.__name__
         self._metrics[metric_name] = metric_class
+        self._by_level = None
 
     def get_metric(self, name: str):
         """Get a metric by name"""
@@ -28,3 +32,68 @@ class MetricRegistry:
     def list_metrics(self):
         """List all registered metrics"""
         return list(self._metrics.keys())
+
+    def requires_llm(self) -> bool:
+        """Check whether any registered metric needs an LLM model"""
+        for name, metric_class in self._metrics.items():
+            try:
+                if metric_class(name).get_model_provider() is not None:
+                    return True
+            except Exception:
+                # Cannot tell without a working instance, assume a model is needed
+                return True
+        return False
+
+    def metrics_by_level(self) -> Dict[str, List[Tuple[str, Any, list]]]:
+        """
+        Group registered metrics by aggregation level.
+
+        Session metrics that support agent computation are also listed under
+        "agent". Each entry is (metric_name, metric_class, required_params); the
+        grouping is computed once and reused until another metric is registered.
+        """
+        if self._by_level is None:
+            by_level = {"span": [], "session": [], "agent": [], "population": []}
+            for metric_name, metric_class in self._metrics.items():
+                entry = (
+                    metric_name,
+                    metric_class,
+                    _required_parameters(metric_class, metric_name),
+                )
+
+                # Determine aggregation level
+                instance = None
+                if hasattr(metric_class, "aggregation_level"):
+                    agg_level = metric_class.aggregation_level
+                else:
+                    # Need to instantiate to get aggregation level
+                    instance = metric_class(metric_name)
+                    agg_level = instance.aggregation_level
+
+                if agg_level == "span":
+                    by_level["span"].append(entry)
+                elif agg_level == "session":
+                    by_level["session"].append(entry)
+
+                    # Also check if it supports agent computation
+                    if instance is None:
+                        instance = metric_class(metric_name)
+                    if (
+                        hasattr(instance, "supports_agent_computation")
+                        and instance.supports_agent_computation()
+                    ):
+                        by_level["agent"].append(entry)
+                elif agg_level == "population":
+                    by_level["population"].append(entry)
+            self._by_level = by_level
+        return self._by_level
+
+
+def _required_parameters(metric_class, metric_name: str) -> list:
+    """Get required parameters from class without instantiation"""
+    required_params_dict = getattr(metric_class, "REQUIRED_PARAMETERS", {})
+
+    if isinstance(required_params_dict, dict):
+        return required_params_dict.get(metric_name, [])
+
+    return []
@@ -18,7 +18,7 @@ from unittest.mock import patch, MagicMock
 from datetime import datetime
 
 from fastapi.testclient import TestClient
-from metrics_computation_engine.main import app
+from metrics_computation_engine.main import LLMDefaults, app
 
 
 # ============================================================================
@@ -670,18 +670,18 @@ class TestComputeMetricsErrors:
 
     @patch("metrics_computation_engine.main.get_traces_by_session_ids")
     @patch("litellm.completion")
-    @patch.dict(
-        "os.environ",
-        {
-            "LLM_BASE_MODEL_URL": "https://env.test.com",
-            "LLM_MODEL_NAME": "env-model",
-            "LLM_API_KEY": "env-key",
-        },
+    @patch(
+        "metrics_computation_engine.main.LLM_DEFAULTS",
+        LLMDefaults(
+            LLM_BASE_MODEL_URL="https://env.test.com",
+            LLM_MODEL_NAME="env-model",
+            LLM_API_KEY="env-key",
+        ),
     )
     def test_llm_config_uses_env_defaults(
         self, mock_llm, mock_db, api_client, mock_grouped_traces
     ):
-        """Test LLM config falls back to environment variables."""
+        """Test LLM config falls back to the environment defaults."""
         mock_db.return_value = (mock_grouped_traces, [])
         mock_llm.return_value = MagicMock(
             choices=[
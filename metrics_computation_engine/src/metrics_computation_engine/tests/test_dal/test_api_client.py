@@ -11,6 +11,8 @@ Tests cover:
 - Error handling
 """
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -187,6 +189,23 @@ class TestApiClient:
         with pytest.raises(ValueError, match="No session data provided"):
             client.load_session_set_from_file(str(empty_file))
 
+    def test_post_api_request_sends_json_body(self, logger):
+        """Test POST payloads reach the API as the same JSON document."""
+        client = ApiClient(logger=logger)
+        client._api_config = MagicMock(base_url="http://dal", verify_ssl=True)
+        payload = {"metrics": {"metric_name": "m", "value": 0.5, "span_id": ["s"]}}
+
+        with patch(
+            "metrics_computation_engine.dal.api_client.requests.post"
+        ) as mock_post:
+            mock_post.return_value.status_code = 200
+            assert client._post_api_request("/metrics", payload) == 200
+
+        kwargs = mock_post.call_args.kwargs
+        body = kwargs["data"] if "data" in kwargs else json.dumps(kwargs["json"])
+        assert json.loads(body) == payload
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
 
 class TestApiClientIntegration:
     """Integration tests for ApiClient with real data."""
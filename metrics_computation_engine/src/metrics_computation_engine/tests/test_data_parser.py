@@ -489,6 +489,17 @@ class TestParseRawSpansIntegration:
             assert span.session_id is not None
             assert len(span.session_id) > 0
 
+    def test_parse_interns_recurring_ids(self, api_noa_2_data):
+        """Test spans of one session share their id and app name strings."""
+        result = parse_raw_spans(api_noa_2_data)
+
+        first_by_session = {}
+        for span in result:
+            first = first_by_session.setdefault(span.session_id, span)
+            assert span.session_id is first.session_id
+            if span.app_name == first.app_name:
+                assert span.app_name is first.app_name
+
     def test_parse_preserves_parent_child_relationships(self, api_noa_2_data):
         """Test that parent-child relationships are preserved."""
         result = parse_raw_spans(api_noa_2_data)
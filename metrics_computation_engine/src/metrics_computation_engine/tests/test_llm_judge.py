@@ -8,6 +8,7 @@ Tests cover:
 1. Response parsing utilities (safe_json_from_llm, parse_key_from_nested_dict)
 2. LLMClient (initialization, provider detection, query - mocked)
 3. Jury (initialization, prompt augmentation, consensus, judge - mocked)
+   and JuryEnsemble (parallel jurors, weighted median)
 4. Integration testing with full workflow
 """
 
@@ -15,12 +16,12 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from metrics_computation_engine.llm_judge.llm import LLMClient
-from metrics_computation_engine.llm_judge.jury import Jury
+from metrics_computation_engine.llm_judge.jury import Jury, JuryEnsemble
 from metrics_computation_engine.llm_judge.utils.response_parsing import (
     safe_json_from_llm,
     parse_key_from_nested_dict,
 )
-from metrics_computation_engine.models.eval import BinaryGrading
+from metrics_computation_engine.models.eval import BatchBinaryGrading, BinaryGrading
 
 
 # ============================================================================
@@ -381,6 +382,141 @@ class TestJury:
 
         assert "Unable to parse LLM response" in str(exc_info.value)
 
+    @patch("metrics_computation_engine.llm_judge.llm.completion")
+    def test_judge_batch_returns_one_verdict_per_item(self, mock_completion):
+        """Test Jury.judge_batch() grades several items with a single LLM call."""
+        mock_completion.return_value = MagicMock(
+            choices=[
+                MagicMock(
+                    message=MagicMock(
+                        content='{"gradings": ['
+                        '{"metric_score": 1, "score_reasoning": "First ok"}, '
+                        '{"metric_score": 0, "score_reasoning": "Second off"}]}'
+                    )
+                )
+            ]
+        )
+
+        config = {
+            "LLM_MODEL_NAME": "gpt-4",
+            "LLM_BASE_MODEL_URL": "https://api.openai.com/v1",
+            "LLM_API_KEY": "test-key",
+        }
+
+        jury = Jury(config, num_models=1)
+
+        # Execute: Judge two items at once
+        verdicts = jury.judge_batch("Grade these:", BatchBinaryGrading, 2)
+
+        # Assert: Verdicts returned in item order from one request
+        assert verdicts == [(1, "First ok"), (0, "Second off")]
+        mock_completion.assert_called_once()
+
+        # Assert: Mismatched grading count is rejected
+        with pytest.raises(ValueError):
+            jury.judge_batch("Grade these:", BatchBinaryGrading, 3)
+
+    @patch("metrics_computation_engine.llm_judge.llm.completion")
+    def test_judge_batch_consolidates_reasoning_across_models(self, mock_completion):
+        """Test Jury.judge_batch() averages scores and keeps each model's reasoning."""
+        mock_completion.side_effect = [
+            MagicMock(
+                choices=[
+                    MagicMock(
+                        message=MagicMock(
+                            content='{"gradings": [{"metric_score": %d, '
+                            '"score_reasoning": "%s"}]}' % (score, reasoning)
+                        )
+                    )
+                ]
+            )
+            for score, reasoning in [(1, "Looks right"), (0, "Missed a step")]
+        ]
+
+        config = {
+            "LLM_MODEL_NAME": "gpt-4",
+            "LLM_BASE_MODEL_URL": "https://api.openai.com/v1",
+            "LLM_API_KEY": "test-key",
+        }
+
+        jury = Jury(config, num_models=2)
+
+        verdicts = jury.judge_batch("Grade these:", BatchBinaryGrading, 1)
+
+        assert verdicts == [(0.5, "Looks right\nMissed a step")]
+
+
+class MockJuror:
+    """Juror returning a fixed verdict for every item."""
+
+    def __init__(self, score, reasoning):
+        self.verdict = (score, reasoning)
+
+    def judge(self, prompt, response_format=None):
+        return self.verdict
+
+    def judge_batch(self, prompt, response_format, num_items):
+        return [self.verdict] * num_items
+
+
+class TestJuryEnsemble:
+    """Test JuryEnsemble combines juror verdicts."""
+
+    def test_judge_majority_with_equal_weights(self):
+        """Test equally weighted binary jurors resolve to the majority verdict."""
+        ensemble = JuryEnsemble(
+            [
+                (MockJuror(1, "yes"), 1.0),
+                (MockJuror(0, "no"), 1.0),
+                (MockJuror(1, "yes"), 1.0),
+            ]
+        )
+
+        assert ensemble.judge("Test", BinaryGrading) == (1, "yes")
+
+    def test_judge_weighted_median(self):
+        """Test a heavily weighted juror decides the verdict."""
+        ensemble = JuryEnsemble(
+            [
+                (MockJuror(1, "yes"), 1.0),
+                (MockJuror(0, "no"), 3.0),
+                (MockJuror(1, "yes"), 1.0),
+            ]
+        )
+
+        assert ensemble.judge("Test", BinaryGrading) == (0, "no")
+
+    def test_judge_batch_combines_per_item(self):
+        """Test judge_batch returns one combined verdict per item."""
+        ensemble = JuryEnsemble(
+            [(MockJuror(0, "no"), 1.0), (MockJuror(1, "yes"), 2.0)]
+        )
+
+        verdicts = ensemble.judge_batch("Grade these:", BatchBinaryGrading, 2)
+
+        assert verdicts == [(1, "yes"), (1, "yes")]
+
+    def test_empty_ensemble_rejected(self):
+        """Test an ensemble without jurors cannot be built."""
+        with pytest.raises(ValueError):
+            JuryEnsemble([])
+
+    def test_native_model_follows_jury_weights(self):
+        """Test JURY_WEIGHTS turns the native judge model into an ensemble."""
+        from metrics_computation_engine.metrics.span.tool_utilization_accuracy import (
+            ToolUtilizationAccuracy,
+        )
+        from metrics_computation_engine.models.requests import LLMJudgeConfig
+
+        metric = ToolUtilizationAccuracy()
+
+        assert isinstance(metric.create_native_model(LLMJudgeConfig()), Jury)
+
+        model = metric.create_native_model(LLMJudgeConfig(JURY_WEIGHTS=[1.0, 2.0]))
+        assert isinstance(model, JuryEnsemble)
+        assert model.weights == [1.0, 2.0]
+        assert all(isinstance(juror, Jury) for juror in model.jurors)
+
 
 # ============================================================================
 # TEST CLASS 4: INTEGRATION TESTS
@@ -5,6 +5,8 @@ This module contains tests for session-level metric caching behavior,
 including cache lookup, cache miss handling, and session-only filtering.
 """
 
+from unittest.mock import MagicMock, patch
+
 from metrics_computation_engine.metrics.base import BaseMetric
 from metrics_computation_engine.models.eval import MetricResult
 from metrics_computation_engine.entities.models.session import SessionEntity
@@ -251,6 +253,36 @@ class TestSessionCacheFunctionality:
         assert metrics_data["value"] == 0.9
         assert metrics_data["metadata"]["session_id"] == "session_json"
 
+    def test_session_cache_decodes_json_string_once(self):
+        """Test JSON string payloads are decoded in place for later lookups."""
+        import json
+
+        cached_metrics = [
+            {
+                "metrics": json.dumps(
+                    {
+                        "metric_name": "test_session_metric",
+                        "value": 0.6,
+                        "aggregation_level": "session",
+                        "category": "application",
+                        "app_name": "test_app",
+                        "session_id": ["session_json"],
+                        "success": True,
+                        "metadata": {},
+                    }
+                )
+            }
+        ]
+
+        found, result = self.metric._check_session_cache(
+            cached_metrics, "test_session_metric"
+        )
+
+        # Verify the row now holds the decoded dict
+        assert found is True
+        assert isinstance(cached_metrics[0]["metrics"], dict)
+        assert result["metrics"]["value"] == 0.6
+
     def test_session_cache_with_malformed_json(self):
         """Test cache handling with malformed JSON strings."""
         cached_metrics = [
@@ -321,3 +353,50 @@ class TestSessionCacheFunctionality:
         assert result is not None
         assert result["metrics"]["value"] == 0.5
         assert result["metrics"]["metadata"]["session_id"] == "session_compat"
+
+    @patch.dict("os.environ", {"METRICS_CACHE_ENABLED": "true"})
+    async def test_check_cache_metric_reads_from_dal(self):
+        """Test check_cache_metric fetches metrics off-loop and builds a result."""
+        client = MagicMock()
+        client.get_session_metrics.return_value = [
+            {
+                "metrics": {
+                    "metric_name": "test_session_metric",
+                    "value": 0.4,
+                    "aggregation_level": "session",
+                    "session_id": ["session_dal"],
+                    "success": True,
+                    "metadata": {},
+                }
+            }
+        ]
+
+        session_indices = {}
+        with patch(
+            "metrics_computation_engine.metrics.base.get_api_client",
+            return_value=client,
+        ):
+            result = await self.metric.check_cache_metric(
+                metric_name="test_session_metric",
+                session_id="session_dal",
+                session_indices=session_indices,
+            )
+            # Second probe of the same run reuses the session index
+            missing = await self.metric.check_cache_metric(
+                metric_name="other_metric",
+                session_id="session_dal",
+                session_indices=session_indices,
+            )
+
+        # Verify the DAL was queried once and the cached result was rebuilt
+        client.get_session_metrics.assert_called_once_with(session_id="session_dal")
+        assert missing is None
+        assert isinstance(result, MetricResult)
+        assert result.value == 0.4
+        assert result.from_cache is True
+        assert result.category == "application"
+
+        # The cached row itself is left untouched
+        row = client.get_session_metrics.return_value[0]["metrics"]
+        assert "from_cache" not in row
+        assert "category" not in row
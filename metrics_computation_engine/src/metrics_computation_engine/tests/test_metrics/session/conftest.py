@@ -0,0 +1,39 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Pytest configuration and fixtures for session metric tests.
+"""
+
+import pytest
+
+from metrics_computation_engine.entities.models.span import SpanEntity
+
+
+@pytest.fixture
+def span_factory():
+    """Build SpanEntity objects with the boilerplate fields filled in.
+
+    Any other SpanEntity field can be set through keyword overrides; each span
+    gets its own ``raw_span_data`` dict.
+    """
+
+    def _make(span_id, name, raw=None, entity_type="agent", **overrides):
+        fields = dict(
+            entity_type=entity_type,
+            span_id=span_id,
+            entity_name=name,
+            app_name="example_app",
+            contains_error=False,
+            timestamp="",
+            parent_span_id=None,
+            trace_id="t1",
+            session_id="s1",
+            start_time=None,
+            end_time=None,
+            raw_span_data=raw if raw is not None else {},
+        )
+        fields.update(overrides)
+        return SpanEntity(**fields)
+
+    return _make
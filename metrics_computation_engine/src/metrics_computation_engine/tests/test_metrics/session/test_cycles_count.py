@@ -2,13 +2,15 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
-from metrics_computation_engine.metrics.session.cycles import CyclesCount
-from metrics_computation_engine.entities.models.span import SpanEntity
+from metrics_computation_engine.metrics.session.cycles import (
+    CyclesCount,
+    _cycle_count,
+)
 from metrics_computation_engine.entities.models.session import SessionEntity
 
 
 @pytest.mark.asyncio
-async def test_cycles_count_no_agents_or_tools():
+async def test_cycles_count_no_agents_or_tools(span_factory):
     """Case 1: No spans with agent/tool entity_type, should return 0 cycles."""
     metric = CyclesCount()
 
@@ -29,21 +31,13 @@ async def test_cycles_count_no_agents_or_tools():
     }
 
     spans = [
-        SpanEntity(
+        span_factory(
+            "1",
+            "NotRelevant",
             entity_type="llm",
-            span_id="1",
-            entity_name="NotRelevant",
-            app_name="example_app",
             timestamp="2025-06-20 21:37:02.832759",
-            parent_span_id=None,
-            trace_id="t1",
-            session_id="s1",
-            start_time=None,
             input_payload=default_input,
             output_payload=default_output,
-            end_time=None,
-            raw_span_data={},
-            contains_error=False,
         )
     ]
 
@@ -54,68 +48,19 @@ async def test_cycles_count_no_agents_or_tools():
 
 
 @pytest.mark.asyncio
-async def test_cycles_count_with_one_cycle():
+async def test_cycles_count_with_one_cycle(span_factory):
     """
     Case 2: A → B → A → B is a repeating pattern, should be identified as one cycle.
     """
     metric = CyclesCount()
     spans = [
-        SpanEntity(
-            entity_type="agent",
-            span_id="1",
-            entity_name="A",
-            app_name="example_app",
-            timestamp="2025-06-20 21:37:02.832759",
-            parent_span_id=None,
-            trace_id="t1",
-            session_id="s1",
-            start_time=None,
-            end_time=None,
-            raw_span_data={},
-            contains_error=False,
-        ),
-        SpanEntity(
-            entity_type="tool",
-            span_id="2",
-            entity_name="B",
-            app_name="example_app",
-            timestamp="2025-06-20 21:40:02.832759",
-            parent_span_id=None,
-            trace_id="t1",
-            session_id="s1",
-            start_time=None,
-            end_time=None,
-            raw_span_data={},
-            contains_error=False,
-        ),
-        SpanEntity(
-            entity_type="agent",
-            span_id="3",
-            entity_name="A",
-            app_name="example_app",
-            timestamp="2025-06-20 21:45:02.832759",
-            parent_span_id=None,
-            trace_id="t1",
-            session_id="s1",
-            start_time=None,
-            end_time=None,
-            raw_span_data={},
-            contains_error=False,
-        ),
-        SpanEntity(
-            entity_type="tool",
-            span_id="4",
-            entity_name="B",
-            app_name="example_app",
-            timestamp="",
-            parent_span_id=None,
-            trace_id="t1",
-            session_id="s1",
-            start_time=None,
-            end_time=None,
-            raw_span_data={},
-            contains_error=False,
-        ),
+        span_factory(span_id, name, entity_type=kind, timestamp=ts)
+        for kind, span_id, name, ts in [
+            ("agent", "1", "A", "2025-06-20 21:37:02.832759"),
+            ("tool", "2", "B", "2025-06-20 21:40:02.832759"),
+            ("agent", "3", "A", "2025-06-20 21:45:02.832759"),
+            ("tool", "4", "B", ""),
+        ]
     ]
     session_entity = SessionEntity(session_id=spans[0].session_id, spans=spans)
     result = await metric.compute(session_entity)
@@ -138,22 +83,26 @@ async def test_cycles_count_invalid_input_handling():
     assert result.value == 0
 
 
-def make_agent_span(entity_type, entity_name, contains_error, span_id, agent_id):
-    """Create a span with agent attribution for testing agent-level computation."""
-    return SpanEntity(
-        entity_type=entity_type,
-        contains_error=contains_error,
-        span_id=span_id,
-        entity_name=entity_name,
-        app_name="example_app",
-        timestamp="2024-01-01T00:00:00Z",
-        parent_span_id="parent",
-        trace_id="trace123",
-        session_id="session123",
-        start_time="1234567890.0",
-        end_time="1234567891.0",
-        raw_span_data={"SpanAttributes": {"agent_id": agent_id}} if agent_id else {},
-    )
+@pytest.fixture
+def make_agent_span(span_factory):
+    """Create spans with agent attribution for testing agent-level computation."""
+
+    def _make(entity_type, entity_name, contains_error, span_id, agent_id):
+        return span_factory(
+            span_id,
+            entity_name,
+            {"SpanAttributes": {"agent_id": agent_id}} if agent_id else None,
+            entity_type=entity_type,
+            contains_error=contains_error,
+            timestamp="2024-01-01T00:00:00Z",
+            parent_span_id="parent",
+            trace_id="trace123",
+            session_id="session123",
+            start_time="1234567890.0",
+            end_time="1234567891.0",
+        )
+
+    return _make
 
 
 def setup_session(session):
@@ -181,7 +130,7 @@ async def test_cycles_count_agent_computation_empty_session():
 
 
 @pytest.mark.asyncio
-async def test_cycles_count_agent_computation_single_agent():
+async def test_cycles_count_agent_computation_single_agent(make_agent_span):
     """Test agent computation with single agent having cycles."""
     metric = CyclesCount()
 
@@ -210,7 +159,7 @@ async def test_cycles_count_agent_computation_single_agent():
 
 
 @pytest.mark.asyncio
-async def test_cycles_count_agent_computation_multiple_agents():
+async def test_cycles_count_agent_computation_multiple_agents(make_agent_span):
     """Test agent computation with multiple agents."""
     metric = CyclesCount()
 
@@ -261,38 +210,17 @@ async def test_cycles_count_supports_agent_computation():
 
 
 @pytest.mark.asyncio
-async def test_cycles_count_backward_compatibility():
+async def test_cycles_count_backward_compatibility(span_factory):
     """Test that session-level computation still works without context parameter."""
     metric = CyclesCount()
 
     spans = [
-        SpanEntity(
-            entity_type="agent",
-            span_id="1",
-            entity_name="test_agent",
-            app_name="example_app",
-            timestamp="2025-06-20 21:37:02.832759",
-            parent_span_id=None,
-            trace_id="t1",
-            session_id="s1",
-            start_time=None,
-            end_time=None,
-            raw_span_data={},
-            contains_error=False,
-        ),
-        SpanEntity(
+        span_factory("1", "test_agent", timestamp="2025-06-20 21:37:02.832759"),
+        span_factory(
+            "2",
+            "test_tool",
             entity_type="tool",
-            span_id="2",
-            entity_name="test_tool",
-            app_name="example_app",
             timestamp="2025-06-20 21:37:02.832759",
-            parent_span_id=None,
-            trace_id="t1",
-            session_id="s1",
-            start_time=None,
-            end_time=None,
-            raw_span_data={},
-            contains_error=False,
         ),
     ]
 
@@ -309,3 +237,42 @@ async def test_cycles_count_backward_compatibility():
     assert result.success
     assert result.aggregation_level == "session"
     assert isinstance(result.value, (int, float))
+
+
+def test_count_contiguous_cycles_matches_slice_reference():
+    """Encoded early-exit comparison agrees with the slice-equality definition."""
+
+    def reference(seq, min_cycle_len=2):
+        n, count, i = len(seq), 0, 0
+        while i < n:
+            for k in range(min_cycle_len, (n - i) // 2 + 1):
+                if seq[i : i + k] == seq[i + k : i + 2 * k]:
+                    count += 1
+                    i += k
+                    break
+            else:
+                i += 1
+        return count
+
+    metric = CyclesCount()
+    sequences = [
+        [],
+        ["A"],
+        ["A", "B", "A", "B"],
+        ["A", "A", "A", "A"],
+        ["A", "B", "C", "A", "B", "C", "A", "B", "C"],
+        ["X", "A", "B", "A", "B", "Y", "C", "D", "E", "C", "D", "E"],
+        list("ABCABDABCABD"),
+    ]
+    for seq in sequences:
+        assert metric.count_contiguous_cycles(seq) == reference(seq)
+
+
+def test_count_contiguous_cycles_memoizes_repeated_sequences():
+    """Repeated event sequences reuse the earlier cycle count."""
+    metric = CyclesCount()
+    seq = ["M1", "M2", "M1", "M2", "M3"]
+    assert metric.count_contiguous_cycles(seq) == 1
+    hits = _cycle_count.cache_info().hits
+    assert metric.count_contiguous_cycles(list(seq)) == 1
+    assert _cycle_count.cache_info().hits == hits + 1
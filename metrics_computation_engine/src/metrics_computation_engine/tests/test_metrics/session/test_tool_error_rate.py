@@ -3,7 +3,6 @@
 
 import pytest
 from metrics_computation_engine.metrics.session.tool_error_rate import ToolErrorRate
-from metrics_computation_engine.entities.models.span import SpanEntity
 from metrics_computation_engine.entities.models.session import SessionEntity
 from metrics_computation_engine.entities.models.execution_tree import ExecutionTree
 from metrics_computation_engine.models.eval import MetricResult
@@ -16,25 +15,27 @@ def setup_session(session):
     return session
 
 
-def make_dummy_span(entity_type, contains_error, span_id):
-    return SpanEntity(
-        entity_type=entity_type,
-        contains_error=contains_error,
-        span_id=span_id,
-        entity_name="dummy_tool",
-        app_name="example_app",
-        timestamp="2024-01-01T00:00:00Z",
-        parent_span_id="parent",
-        trace_id="trace123",
-        session_id="session123",
-        start_time="1234567890.0",
-        end_time="1234567891.0",
-        raw_span_data={},
-    )
+@pytest.fixture
+def make_dummy_span(span_factory):
+    def _make(entity_type, contains_error, span_id):
+        return span_factory(
+            span_id,
+            "dummy_tool",
+            entity_type=entity_type,
+            contains_error=contains_error,
+            timestamp="2024-01-01T00:00:00Z",
+            parent_span_id="parent",
+            trace_id="trace123",
+            session_id="session123",
+            start_time="1234567890.0",
+            end_time="1234567891.0",
+        )
+
+    return _make
 
 
 @pytest.mark.asyncio
-async def test_tool_error_rate_all_cases():
+async def test_tool_error_rate_all_cases(make_dummy_span):
     metric = ToolErrorRate()
 
     # Case 1: No tool spans
@@ -43,6 +44,15 @@ async def test_tool_error_rate_all_cases():
     assert result.value == 0
     assert result.success
 
+    # Case 1b: Only agent spans, the column view is never built
+    spans = [make_dummy_span("agent", True, "1")]
+    session_entity = SessionEntity(session_id=spans[0].session_id, spans=spans)
+    result = await metric.compute(session_entity)
+    assert result.value == 0
+    assert result.success
+    assert session_entity.tool_span_count == 0
+    assert session_entity._span_columns is None
+
     # Case 2: All tool spans, no errors
     spans = [
         make_dummy_span("tool", False, "1"),
@@ -74,23 +84,26 @@ async def test_tool_error_rate_all_cases():
     assert result.success
 
 
-def make_agent_span(entity_type, entity_name, contains_error, span_id, agent_id):
-    """Create a span with agent attribution for testing agent-level computation."""
-    return SpanEntity(
-        entity_type=entity_type,
-        contains_error=contains_error,
-        span_id=span_id,
-        entity_name=entity_name,
-        app_name="example_app",
-        timestamp="2024-01-01T00:00:00Z",
-        parent_span_id="parent",
-        trace_id="trace123",
-        session_id="session123",
-        start_time="1234567890.0",
-        end_time="1234567891.0",
-        raw_span_data={},
-        attrs={"agent_id": agent_id} if agent_id else {},
-    )
+@pytest.fixture
+def make_agent_span(span_factory):
+    """Create spans with agent attribution for testing agent-level computation."""
+
+    def _make(entity_type, entity_name, contains_error, span_id, agent_id):
+        return span_factory(
+            span_id,
+            entity_name,
+            entity_type=entity_type,
+            contains_error=contains_error,
+            attrs={"agent_id": agent_id} if agent_id else {},
+            timestamp="2024-01-01T00:00:00Z",
+            parent_span_id="parent",
+            trace_id="trace123",
+            session_id="session123",
+            start_time="1234567890.0",
+            end_time="1234567891.0",
+        )
+
+    return _make
 
 
 @pytest.mark.asyncio
@@ -109,7 +122,7 @@ async def test_tool_error_rate_agent_computation_empty_session():
 
 
 @pytest.mark.asyncio
-async def test_tool_error_rate_agent_computation_single_agent():
+async def test_tool_error_rate_agent_computation_single_agent(make_agent_span):
     """Test agent computation with single agent."""
     metric = ToolErrorRate()
 
@@ -139,7 +152,7 @@ async def test_tool_error_rate_agent_computation_single_agent():
 
 
 @pytest.mark.asyncio
-async def test_tool_error_rate_agent_computation_multiple_agents():
+async def test_tool_error_rate_agent_computation_multiple_agents(make_agent_span):
     """Test agent computation with multiple agents."""
     metric = ToolErrorRate()
 
@@ -185,7 +198,7 @@ async def test_tool_error_rate_agent_computation_multiple_agents():
 
 
 @pytest.mark.asyncio
-async def test_tool_error_rate_agent_computation_no_tools():
+async def test_tool_error_rate_agent_computation_no_tools(make_agent_span):
     """Test agent computation with agents that have no tools."""
     metric = ToolErrorRate()
 
@@ -215,7 +228,7 @@ async def test_tool_error_rate_agent_computation_no_tools():
 
 
 @pytest.mark.asyncio
-async def test_tool_error_rate_agent_computation_all_errors():
+async def test_tool_error_rate_agent_computation_all_errors(make_agent_span):
     """Test agent computation where all tools have errors."""
     metric = ToolErrorRate()
 
@@ -244,7 +257,7 @@ async def test_tool_error_rate_agent_computation_all_errors():
 
 
 @pytest.mark.asyncio
-async def test_tool_error_rate_session_level_computation():
+async def test_tool_error_rate_session_level_computation(make_dummy_span):
     """Test session-level computation returns single MetricResult with various context scenarios."""
     metric = ToolErrorRate()
 
@@ -278,7 +291,7 @@ async def test_tool_error_rate_session_level_computation():
 
 
 @pytest.mark.asyncio
-async def test_tool_error_rate_agent_metadata_completeness():
+async def test_tool_error_rate_agent_metadata_completeness(make_agent_span):
     """Test that agent results contain complete metadata."""
     metric = ToolErrorRate()
 
@@ -314,7 +327,7 @@ async def test_tool_error_rate_agent_metadata_completeness():
 
 
 @pytest.mark.asyncio
-async def test_tool_error_rate_agent_computation_no_agents_but_tools():
+async def test_tool_error_rate_agent_computation_no_agents_but_tools(make_dummy_span):
     """Test agent computation with session that has tools but no agent spans."""
     metric = ToolErrorRate()
 
@@ -335,7 +348,7 @@ async def test_tool_error_rate_agent_computation_no_agents_but_tools():
 
 
 @pytest.mark.asyncio
-async def test_tool_error_rate_session_with_tool_errors():
+async def test_tool_error_rate_session_with_tool_errors(make_dummy_span):
     """Test session-level computation correctly handles tool errors."""
     metric = ToolErrorRate()
 
@@ -364,3 +377,25 @@ async def test_tool_error_rate_session_with_tool_errors():
     # Verify metadata includes session-level info
     assert "agent_id" not in result.metadata  # No agent_id for session-level
     assert result.session_id == ["session_with_errors"]
+
+
+def test_session_span_columns_align_with_spans(make_dummy_span):
+    """The column view is built once and stays index-aligned with the spans."""
+    spans = [
+        make_dummy_span("tool", True, "t1"),
+        make_dummy_span("agent", False, "a1"),
+        make_dummy_span("tool", False, "t2"),
+    ]
+    spans[1].raw_span_data = {"Events.Attributes": [{"agent_name": "planner"}]}
+    session = SessionEntity(session_id="session123", spans=spans)
+
+    columns = session.span_columns
+    assert session.span_columns is columns
+    assert columns.span_ids == ["t1", "a1", "t2"]
+    assert columns.indices_of("tool") == [0, 2]
+    assert columns.indices_of("tool") is columns.indices_of("tool")
+    assert columns.indices_of("llm") == []
+    assert columns.contains_error == [True, False, False]
+    assert columns.agent_names == [None, "planner", None]
+    assert columns.has_agent_name == [False, True, False]
+    assert columns.tool_names == ["dummy_tool"] * 3
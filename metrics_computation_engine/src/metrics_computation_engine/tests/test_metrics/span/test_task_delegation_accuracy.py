@@ -0,0 +1,107 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from metrics_computation_engine.metrics.span.task_delegation_accuracy import (
+    TaskDelegationAccuracy,
+)
+from metrics_computation_engine.entities.models.span import SpanEntity
+from metrics_computation_engine.llm_judge.jury import JuryEnsemble
+
+
+# Mock jury class to simulate LLM evaluation
+class MockJury:
+    judge_calls = 0
+    batch_calls = 0
+
+    def judge(self, prompt, grading_cls):
+        MockJury.judge_calls += 1
+        return 1, "Task was delegated correctly."
+
+    def judge_batch(self, prompt, grading_cls, num_items):
+        MockJury.batch_calls += 1
+        return [(1, "Task was delegated correctly.")] * num_items
+
+
+def make_span(index, entity_type="agent", output_payload=None):
+    return SpanEntity(
+        entity_type=entity_type,
+        span_id=str(index),
+        entity_name=f"Agent{index}",
+        app_name="example_app",
+        input_payload={"text": f"Input {index}"},
+        output_payload=output_payload or {"text": "Agent output"},
+        timestamp="",
+        parent_span_id=None,
+        trace_id="t1",
+        session_id="s1",
+        start_time=None,
+        end_time=None,
+        raw_span_data={},
+        contains_error=False,
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_jury():
+    MockJury.judge_calls = 0
+    MockJury.batch_calls = 0
+
+
+@pytest.mark.asyncio
+async def test_task_delegation_accuracy_invalid_span():
+    """Case 1: Span is not an agent, should fail with value -1."""
+    metric = TaskDelegationAccuracy()
+    metric.init_with_model(MockJury())
+    result = await metric.compute(make_span(1, entity_type="tool"))
+    assert result.success is False
+    assert result.value == -1
+
+
+@pytest.mark.asyncio
+async def test_task_delegation_accuracy_valid_span():
+    """Case 2: Valid agent span is graded by the jury."""
+    metric = TaskDelegationAccuracy()
+    metric.init_with_model(MockJury())
+    result = await metric.compute(make_span(1))
+    assert result.success is True
+    assert result.value == 1
+    assert result.session_id == ["s1"]
+    assert MockJury.judge_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_task_delegation_accuracy_batches_session_spans():
+    """Case 3: Valid agent spans of a session are graded with one batched judge call."""
+    metric = TaskDelegationAccuracy()
+    metric.init_with_model(MockJury())
+    spans = [make_span(0), make_span(1, entity_type="tool"), make_span(2)]
+    results = await metric.compute_batch(spans)
+    assert MockJury.batch_calls == 1
+    assert MockJury.judge_calls == 0
+    assert [result.success for result in results] == [True, False, True]
+    assert results[0].span_id == ["0"]
+    assert results[2].span_id == ["2"]
+    assert results[2].reasoning == "Task was delegated correctly."
+
+
+@pytest.mark.asyncio
+async def test_task_delegation_accuracy_single_span_not_batched():
+    """Case 4: A single valid span is graded without a batched request."""
+    metric = TaskDelegationAccuracy()
+    metric.init_with_model(MockJury())
+    results = await metric.compute_batch([make_span(0)])
+    assert MockJury.batch_calls == 0
+    assert MockJury.judge_calls == 1
+    assert results[0].success is True
+
+
+@pytest.mark.asyncio
+async def test_task_delegation_accuracy_with_jury_ensemble():
+    """Case 5: A jury ensemble is used like a single jury."""
+    metric = TaskDelegationAccuracy()
+    metric.init_with_model(JuryEnsemble([(MockJury(), 1.0) for _ in range(3)]))
+    result = await metric.compute(make_span(1))
+    assert result.success is True
+    assert result.value == 1
+    assert MockJury.judge_calls == 3
@@ -123,3 +123,19 @@ async def test_tool_error_with_status():
     result = await metric.compute(tool_span)
     assert result.success is True
     assert result.value == "error"  # The status value from Events.Attributes
+
+
+def test_find_first_returns_earliest_status_in_traversal_order():
+    """The first status in depth-first insertion order is returned."""
+    from metrics_computation_engine.metrics.span.tool_error import (
+        _MISSING,
+        _find_first,
+    )
+
+    payload = {
+        "a": [{"b": 1}, {"status": "nested-first"}],
+        "status": "top-level-later",
+    }
+    assert _find_first(payload, "status") == "nested-first"
+    assert _find_first({"status": None}, "status") is None
+    assert _find_first({"a": [1, 2, {"b": 3}]}, "status") is _MISSING
@@ -95,3 +95,86 @@ async def test_tool_utilization_accuracy_with_jury():
     assert result.success is True
     assert result.value == 1
     assert result.reasoning == "Tool was used correctly."
+
+
+@pytest.mark.asyncio
+async def test_tool_utilization_accuracy_reuses_cached_verdict():
+    """Case 4: Re-evaluating an identical span reuses the earlier judge verdict."""
+
+    class CountingJury(MockJury):
+        calls = 0
+
+        def judge(self, prompt, grading_cls):
+            CountingJury.calls += 1
+            return super().judge(prompt, grading_cls)
+
+    metric = ToolUtilizationAccuracy()
+    metric.init_with_model(CountingJury())
+    span = SpanEntity(
+        entity_type="tool",
+        span_id="4",
+        entity_name="ToolZ",
+        app_name="example_app",
+        input_payload={"text": "Input to the tool"},
+        output_payload={"text": "Tool output"},
+        tool_definition={"text": "Tool definition text"},
+        timestamp="",
+        parent_span_id=None,
+        trace_id="t4",
+        session_id="s4",
+        start_time=None,
+        end_time=None,
+        raw_span_data={},
+        contains_error=False,
+    )
+    first = await metric.compute(span)
+    second = await metric.compute(span)
+    assert CountingJury.calls == 1
+    assert first.value == second.value == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_utilization_accuracy_batches_session_spans():
+    """Case 5: Valid tool spans of a session are graded with one batched judge call."""
+
+    class BatchJury(MockJury):
+        batch_calls = 0
+
+        def judge_batch(self, prompt, grading_cls, num_items):
+            BatchJury.batch_calls += 1
+            assert "Tool Call 2:" in prompt
+            return [(index % 2, f"verdict {index}") for index in range(num_items)]
+
+    metric = ToolUtilizationAccuracy()
+    metric.init_with_model(BatchJury())
+    spans = [
+        SpanEntity(
+            entity_type=entity_type,
+            span_id=str(index),
+            entity_name=f"Tool{index}",
+            app_name="example_app",
+            input_payload={"text": f"Input {index}"},
+            output_payload={"text": "Tool output"},
+            tool_definition={"text": "Tool definition text"},
+            timestamp="",
+            parent_span_id=None,
+            trace_id="t5",
+            session_id="s5",
+            start_time=None,
+            end_time=None,
+            raw_span_data={},
+            contains_error=False,
+        )
+        for index, entity_type in enumerate(["tool", "agent", "tool"])
+    ]
+    results = await metric.compute_batch(spans)
+    assert BatchJury.batch_calls == 1
+    assert [result.span_id for result in results] == [["0"], ["1"], ["2"]]
+    assert [result.success for result in results] == [True, False, True]
+    assert results[0].reasoning == "verdict 0"
+    assert results[2].value == 1
+
+    # Re-evaluating the same session reuses the batched verdicts
+    again = await metric.compute_batch(spans)
+    assert BatchJury.batch_calls == 1
+    assert [result.value for result in again] == [result.value for result in results]
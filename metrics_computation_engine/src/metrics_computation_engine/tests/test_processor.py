@@ -11,9 +11,13 @@ Tests cover:
 4. Error handling and recovery
 """
 
+import asyncio
 import pytest
 from collections import Counter
+from unittest.mock import patch
 
+from metrics_computation_engine.metrics.base import CustomBaseMetric
+from metrics_computation_engine.models.eval import MetricResult
 from metrics_computation_engine.processor import MetricsProcessor
 from metrics_computation_engine.registry import MetricRegistry
 
@@ -245,6 +249,33 @@ class TestMetricComputation:
         # No failed metrics
         assert len(results["failed_metrics"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_population_metrics_skipped_for_empty_session_set(
+        self,
+        empty_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_population_metric_class,
+    ):
+        """Test population metrics are not initialized when there are no sessions."""
+        registry = MetricRegistry()
+        registry.register_metric(mock_population_metric_class, "MockPopulationMetric")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+        )
+
+        with patch.object(
+            processor, "_initialize_metric", wraps=processor._initialize_metric
+        ) as initialize:
+            results = await processor.compute_metrics(empty_session_set)
+
+        initialize.assert_not_called()
+        assert results["population_metrics"] == []
+        assert results["failed_metrics"] == []
+
     @pytest.mark.asyncio
     async def test_multiple_metrics_at_once(
         self,
@@ -299,6 +330,39 @@ class TestMetricComputation:
             assert pop_result.aggregation_level == "population"
             assert pop_result.success is True
 
+        # Results are not indexed by name unless requested
+        assert "by_name" not in results
+
+    @pytest.mark.asyncio
+    async def test_results_indexed_by_metric_name(
+        self,
+        multi_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_span_metric_class,
+        mock_population_metric_class,
+    ):
+        """Test results are also grouped by metric name when requested."""
+        registry = MetricRegistry()
+        registry.register_metric(mock_span_metric_class, "MockSpanMetric")
+        registry.register_metric(mock_population_metric_class, "MockPopulationMetric")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+            include_results_by_name=True,
+        )
+
+        # Execute
+        results = await processor.compute_metrics(multi_session_set)
+
+        # Assert: Same result objects as the per-level lists
+        by_name = results["by_name"]
+        assert set(by_name) == {"MockSpanMetric", "MockPopulationMetric"}
+        assert by_name["MockSpanMetric"] == results["span_metrics"]
+        assert by_name["MockPopulationMetric"] == results["population_metrics"]
+
 
 # ============================================================================
 # TEST 3: METRIC EXECUTION ORDER
@@ -429,6 +493,410 @@ class TestMetricExecutionOrder:
         # No error, just skipped
         assert len(results["failed_metrics"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_cpu_bound_metrics_run_inline_with_one_instance(
+        self,
+        multi_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_span_metric_class,
+    ):
+        """Test CPU-bound metrics reuse a single instance and still report results."""
+
+        class CpuSpanMetric(mock_span_metric_class):
+            is_cpu_bound = True
+
+        registry = MetricRegistry()
+        registry.register_metric(CpuSpanMetric, "CpuSpanMetric")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+        )
+
+        # Execute
+        results = await processor.compute_metrics(multi_session_set)
+
+        # Assert: One result per tool span, all from the same cached instance
+        assert len(results["span_metrics"]) == 3
+        instance = processor._metric_instances["CpuSpanMetric"]
+        assert instance.call_count == 3
+        assert len(results["failed_metrics"]) == 0
+
+    @pytest.mark.asyncio
+    async def test_cpu_bound_metrics_queued_when_cache_enabled(
+        self,
+        multi_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_span_metric_class,
+    ):
+        """Test CPU-bound metrics run as tasks when their cache lookup does I/O."""
+        from metrics_computation_engine.processor import _BoundedTasks
+
+        class CpuSpanMetric(mock_span_metric_class):
+            is_cpu_bound = True
+
+        registry = MetricRegistry()
+        registry.register_metric(CpuSpanMetric, "CpuSpanMetric")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+        )
+
+        # Execute
+        add_result = patch.object(
+            _BoundedTasks,
+            "add_result",
+            autospec=True,
+            side_effect=_BoundedTasks.add_result,
+        )
+        no_cached_row = patch.object(
+            CpuSpanMetric, "check_cache_metric", autospec=True, return_value=None
+        )
+        with patch.dict("os.environ", {"METRICS_CACHE_ENABLED": "true"}):
+            with no_cached_row, add_result as inline_results:
+                results = await processor.compute_metrics(multi_session_set)
+
+        # Assert: Every span computed, none of them inline
+        assert len(results["span_metrics"]) == 3
+        inline_results.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_span_metric_initialized_once_per_computation(
+        self,
+        multi_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_span_metric_class,
+    ):
+        """Test span-level metrics are initialized once and shared across spans."""
+
+        class CountingSpanMetric(mock_span_metric_class):
+            instances = 0
+
+            def __init__(self, metric_name=None):
+                super().__init__(metric_name)
+                type(self).instances += 1
+
+        registry = MetricRegistry()
+        registry.register_metric(CountingSpanMetric, "CountingSpanMetric")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+        )
+
+        # Execute
+        results = await processor.compute_metrics(multi_session_set)
+
+        # Assert: Every tool span computed by a single instance
+        assert len(results["span_metrics"]) == 3
+        assert CountingSpanMetric.instances == 1
+
+    @pytest.mark.asyncio
+    async def test_model_resolved_once_per_provider(
+        self,
+        multi_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_span_metric_class,
+    ):
+        """Test metrics sharing a provider resolve their model only once."""
+
+        class LLMSpanMetric(mock_span_metric_class):
+            def get_model_provider(self):
+                return "openai"
+
+        registry = MetricRegistry()
+        registry.register_metric(LLMSpanMetric, "FirstLLMMetric")
+        registry.register_metric(LLMSpanMetric, "SecondLLMMetric")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+        )
+
+        # Execute
+        results = await processor.compute_metrics(multi_session_set)
+
+        # Assert: Both metrics computed on every tool span, one model lookup
+        assert len(results["span_metrics"]) == 6
+        assert mock_model_handler.get_or_create_model.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_in_flight_metrics(
+        self,
+        multi_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_span_metric_class,
+    ):
+        """Test max_concurrency caps running computations and keeps result order."""
+
+        class SlowSpanMetric(mock_span_metric_class):
+            in_flight = 0
+            peak = 0
+
+            async def compute(self, data, **context):
+                cls = type(self)
+                cls.in_flight += 1
+                cls.peak = max(cls.peak, cls.in_flight)
+                await asyncio.sleep(0)
+                cls.in_flight -= 1
+                return await super().compute(data, **context)
+
+        registry = MetricRegistry()
+        registry.register_metric(SlowSpanMetric, "SlowSpanMetric")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+            max_concurrency=2,
+        )
+
+        # Execute
+        results = await processor.compute_metrics(multi_session_set)
+
+        # Assert: Never more than two computations in flight, all spans reported
+        assert SlowSpanMetric.peak == 2
+        span_ids = [
+            span.span_id
+            for session in multi_session_set.sessions
+            for span in session.spans
+            if span.entity_type == "tool"
+        ]
+        assert [r.span_id[0] for r in results["span_metrics"]] == span_ids
+
+    @pytest.mark.asyncio
+    async def test_llm_config_max_concurrency_overrides_processor_limit(
+        self,
+        multi_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_span_metric_class,
+    ):
+        """Test MAX_CONCURRENCY on the judge config takes precedence."""
+
+        class SlowSpanMetric(mock_span_metric_class):
+            in_flight = 0
+            peak = 0
+
+            async def compute(self, data, **context):
+                cls = type(self)
+                cls.in_flight += 1
+                cls.peak = max(cls.peak, cls.in_flight)
+                await asyncio.sleep(0)
+                cls.in_flight -= 1
+                return await super().compute(data, **context)
+
+        registry = MetricRegistry()
+        registry.register_metric(SlowSpanMetric, "SlowSpanMetric")
+        mock_llm_config.MAX_CONCURRENCY = 1
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+            max_concurrency=4,
+        )
+
+        # Execute
+        await processor.compute_metrics(multi_session_set)
+
+        # Assert: Computations ran one at a time
+        assert SlowSpanMetric.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_batched_span_metric_skips_cache_and_falls_back_serially(
+        self,
+        multi_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_span_metric_class,
+    ):
+        """Test span batches ignore the session cache and retry spans one by one."""
+
+        class FlakyBatchMetric(mock_span_metric_class):
+            in_flight = 0
+            peak = 0
+
+            async def compute_batch(self, spans, **context):
+                raise ValueError("malformed batch response")
+
+            async def compute(self, data, **context):
+                cls = type(self)
+                cls.in_flight += 1
+                cls.peak = max(cls.peak, cls.in_flight)
+                await asyncio.sleep(0)
+                cls.in_flight -= 1
+                return await super().compute(data, **context)
+
+        registry = MetricRegistry()
+        registry.register_metric(FlakyBatchMetric, "FlakyBatchMetric")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+            max_concurrency=1,
+        )
+
+        # Execute
+        with patch.object(
+            FlakyBatchMetric, "check_cache_metric", autospec=True, return_value=None
+        ) as check_cache:
+            results = await processor.compute_metrics(multi_session_set)
+
+        # Assert: No cache probe for the batch, one result per span, run serially
+        span_ids = [
+            span.span_id
+            for session in multi_session_set.sessions
+            for span in session.spans
+            if span.entity_type == "tool"
+        ]
+        assert [r.span_id[0] for r in results["span_metrics"]] == span_ids
+        assert len({id(r) for r in results["span_metrics"]}) == len(span_ids)
+        assert FlakyBatchMetric.peak == 1
+        assert check_cache.await_count == len(span_ids)
+
+    def test_max_concurrency_below_one_rejected(self):
+        """Test non-positive concurrency limits are rejected up front."""
+        from pydantic import ValidationError
+
+        from metrics_computation_engine.models.requests import LLMJudgeConfig
+        from metrics_computation_engine.processor import _BoundedTasks
+
+        with pytest.raises(ValidationError):
+            LLMJudgeConfig(MAX_CONCURRENCY=-1)
+        with pytest.raises(ValidationError):
+            LLMJudgeConfig(MAX_CONCURRENCY=0)
+        with pytest.raises(ValueError):
+            _BoundedTasks(0)
+
+    @pytest.mark.asyncio
+    async def test_session_set_stats_read_once_per_computation(
+        self,
+        multi_session_set,
+        mock_model_handler,
+        mock_llm_config,
+        mock_session_metric_class,
+        monkeypatch,
+    ):
+        """Test session set stats are computed once, not per session and metric."""
+        stats_property = type(multi_session_set).stats
+        reads = []
+
+        def counting_stats(session_set):
+            reads.append(1)
+            return stats_property.fget(session_set)
+
+        monkeypatch.setattr(type(multi_session_set), "stats", property(counting_stats))
+
+        registry = MetricRegistry()
+        registry.register_metric(mock_session_metric_class, "SessionMetricA")
+        registry.register_metric(mock_session_metric_class, "SessionMetricB")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+        )
+
+        # Execute
+        await processor.compute_metrics(multi_session_set)
+
+        # Assert: One read for the shared context, one for the app name mapping
+        assert len(reads) == 2
+
+    @pytest.mark.asyncio
+    async def test_instance_required_span_metric_constructed_once(
+        self, multi_session_set, mock_model_handler, mock_llm_config
+    ):
+        """Test the instance built to read requirements is the one initialized."""
+
+        class InstanceRequiredMetric(CustomBaseMetric):
+            aggregation_level = "span"
+            constructions = 0
+
+            def __init__(self, metric_name=None):
+                super().__init__(metric_name)
+                type(self).constructions += 1
+                self.required = {"entity_type": ["tool"]}
+
+            def init_with_model(self, model):
+                return True
+
+            def get_model_provider(self):
+                return None
+
+            def create_model(self, llm_config):
+                return None
+
+            async def compute(self, data, **context):
+                return MetricResult(
+                    metric_name=self.name,
+                    value=1.0,
+                    aggregation_level=self.aggregation_level,
+                    category="test",
+                    app_name=data.app_name,
+                    span_id=[data.span_id],
+                    session_id=[data.session_id],
+                    success=True,
+                )
+
+        registry = MetricRegistry()
+        registry.register_metric(InstanceRequiredMetric, "InstanceRequiredMetric")
+
+        processor = MetricsProcessor(
+            registry=registry,
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+        )
+
+        # Execute
+        results = await processor.compute_metrics(multi_session_set)
+
+        # Assert: All tool spans computed from the single grouping instance
+        assert len(results["span_metrics"]) == 3
+        assert InstanceRequiredMetric.constructions == 1
+
+    def test_span_metrics_grouped_by_entity_type_once(
+        self, mock_model_handler, mock_llm_config, mock_span_metric_class
+    ):
+        """Test span metrics are resolved to entity types once per computation."""
+
+        class MultiTypeMetric(mock_span_metric_class):
+            required = {"entity_type": ["llm", "tool", "llm"]}
+
+        processor = MetricsProcessor(
+            registry=MetricRegistry(),
+            model_handler=mock_model_handler,
+            llm_config=mock_llm_config,
+        )
+
+        grouped = processor._group_span_metrics_by_entity_type(
+            [
+                ("ToolMetric", mock_span_metric_class),
+                ("MultiTypeMetric", MultiTypeMetric),
+            ]
+        )
+
+        # Assert: Each metric is listed under every entity type it requires
+        assert grouped == {
+            "tool": [
+                ("ToolMetric", mock_span_metric_class),
+                ("MultiTypeMetric", MultiTypeMetric),
+            ],
+            "llm": [("MultiTypeMetric", MultiTypeMetric)],
+        }
+
 
 # ============================================================================
 # TEST 4: ERROR HANDLING
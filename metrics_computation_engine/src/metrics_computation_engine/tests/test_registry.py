@@ -13,6 +13,7 @@ Tests cover:
 
 import pytest
 
+from metrics_computation_engine.metrics.base import CustomBaseMetric
 from metrics_computation_engine.registry import MetricRegistry
 
 
@@ -54,6 +55,28 @@ class TestRegistryBasicOperations:
         assert retrieved is not None
         assert retrieved == mock_span_metric_class
 
+    def test_metrics_by_level_cached_until_next_registration(
+        self, mock_span_metric_class, mock_session_metric_class
+    ):
+        """Test level grouping is computed once and refreshed on registration."""
+        registry = MetricRegistry()
+        registry.register_metric(mock_span_metric_class, "SpanMetric")
+
+        # Execute: Group twice without registering anything in between
+        first = registry.metrics_by_level()
+
+        # Assert: Entries carry name, class and required params; result is reused
+        assert first["span"] == [("SpanMetric", mock_span_metric_class, [])]
+        assert registry.metrics_by_level() is first
+
+        # Execute: Register another metric
+        registry.register_metric(mock_session_metric_class, "SessionMetric")
+
+        # Assert: Grouping is rebuilt with the new metric
+        refreshed = registry.metrics_by_level()
+        assert refreshed is not first
+        assert [entry[0] for entry in refreshed["session"]] == ["SessionMetric"]
+
     def test_register_metric_with_auto_name(self, mock_span_metric_class):
         """Test registering a metric with auto-generated name."""
         registry = MetricRegistry()
@@ -91,6 +114,32 @@ class TestRegistryBasicOperations:
         # Assert: Returns None (not an error)
         assert result is None
 
+    def test_requires_llm_false_for_model_free_metrics(
+        self, mock_span_metric_class, mock_session_metric_class
+    ):
+        """Test registry reports no LLM need when no metric has a provider."""
+        registry = MetricRegistry()
+        registry.register_metric(mock_span_metric_class, "SpanMetric")
+        registry.register_metric(mock_session_metric_class, "SessionMetric")
+
+        # Assert: No metric needs a model
+        assert registry.requires_llm() is False
+
+    def test_requires_llm_true_when_any_metric_has_provider(
+        self, mock_span_metric_class
+    ):
+        """Test registry reports LLM need when one metric has a provider."""
+        from metrics_computation_engine.metrics.span.tool_utilization_accuracy import (
+            ToolUtilizationAccuracy,
+        )
+
+        registry = MetricRegistry()
+        registry.register_metric(mock_span_metric_class, "SpanMetric")
+        registry.register_metric(ToolUtilizationAccuracy, "ToolUtilizationAccuracy")
+
+        # Assert: The LLM-as-a-judge metric requires a model
+        assert registry.requires_llm() is True
+
 
 # ============================================================================
 # TEST CLASS 2: VALIDATION
@@ -127,6 +176,50 @@ class TestRegistryValidation:
         with pytest.raises((ValueError, TypeError, AttributeError)):
             registry.register_metric({"not": "a_class"}, "DictMetric")
 
+    def test_custom_metric_without_aggregation_level_rejected_at_definition(self):
+        """Test that a concrete CustomBaseMetric must declare aggregation_level."""
+        # Execute & Assert: Defining the class itself should fail
+        with pytest.raises(TypeError) as exc_info:
+
+            class NoLevelMetric(CustomBaseMetric):
+                def init_with_model(self, model):
+                    return True
+
+                def get_model_provider(self):
+                    return None
+
+                def create_model(self, llm_config):
+                    return None
+
+                async def compute(self, data, **context):
+                    return None
+
+        # Assert: Error message names the offending class
+        assert "NoLevelMetric" in str(exc_info.value)
+
+        # Assert: Abstract intermediate bases are still allowed
+        class AbstractIntermediate(CustomBaseMetric):
+            pass
+
+        assert AbstractIntermediate.aggregation_level is None
+
+    def test_context_support_resolved_at_class_definition(self):
+        """Test that compute(**context) support is recorded once per class."""
+
+        class ContextMetric(CustomBaseMetric):
+            aggregation_level = "span"
+
+            async def compute(self, data, **context):
+                return None
+
+        class PlainMetric(ContextMetric):
+            async def compute(self, data):
+                return None
+
+        # Assert: Flag reflects each class's own compute signature
+        assert ContextMetric._supports_context is True
+        assert PlainMetric._supports_context is False
+
 
 # ============================================================================
 # TEST CLASS 3: MULTIPLE METRICS
@@ -273,6 +273,26 @@ class TestProcessGroupedSessions:
 
         assert "No valid sessions found" in str(exc_info.value)
 
+    def test_iter_grouped_sessions_is_lazy(
+        self, logger, sample_llm_span_raw, sample_agent_span_raw
+    ):
+        """Test that grouped sessions are yielded enriched, one at a time."""
+        processor = TraceProcessor(logger=logger)
+
+        grouped = {
+            "session-1": [sample_llm_span_raw],
+            "session-2": [sample_agent_span_raw],
+        }
+
+        # Execute: Pull only the first session
+        sessions = processor.iter_grouped_sessions(grouped)
+        first = next(sessions)
+
+        # Assert: First session is enriched and the rest is still pending
+        assert len(first.spans) > 0
+        assert first.execution_tree is not None
+        assert len(list(sessions)) == 1
+
 
 # ============================================================================
 # TEST CLASS 4: SESSION FILTERING
@@ -24,10 +24,14 @@ from metrics_computation_engine.entities.transformers.session_enrichers import (
     ConversationDataTransformer,
     WorkflowDataTransformer,
     EndToEndAttributesTransformer,
+    _count_transitions_numpy,
 )
 from metrics_computation_engine.entities.transformers.execution_tree_transformer import (
     ExecutionTreeTransformer,
 )
+from metrics_computation_engine.entities.models.execution_tree import (
+    build_execution_tree,
+)
 
 
 # ============================================================================
@@ -199,6 +203,72 @@ class TestAgentTransitionTransformer:
         assert result["agent_transitions"] == []
         assert result["agent_transition_counts"] == Counter()
 
+    def test_extract_keeps_explicit_none_agent_name(self, create_session, create_span):
+        """Test that an agent_name key set to None still counts as an agent event."""
+        transformer = AgentTransitionTransformer()
+
+        spans = [
+            create_span(
+                span_id="s1",
+                raw_span_data={"Events.Attributes": [{"agent_name": "AgentA"}]},
+            ),
+            create_span(
+                span_id="s2",
+                raw_span_data={"Events.Attributes": [{"agent_name": None}]},
+            ),
+            create_span(span_id="s3", raw_span_data={"Events.Attributes": [{}]}),
+        ]
+
+        session = create_session(session_id="test", spans=spans)
+
+        # Execute
+        result = transformer.extract(session)
+
+        # Assert: The None-named event is kept, the key-less one is skipped
+        assert result["agent_transitions"] == ["AgentA -> None"]
+        assert result["agent_transition_counts"] == Counter({"AgentA -> None": 1})
+
+    def test_numpy_path_matches_counter_path(self):
+        """Test the numpy counting path for long sessions matches the Counter path."""
+        pytest.importorskip("numpy")
+        names = ["AgentA", "AgentB", "AgentB", "AgentC", "AgentA", "AgentB"] * 100
+        expected = [f"{a} -> {b}" for a, b in zip(names, names[1:]) if a != b]
+
+        # Execute
+        transitions, counts = _count_transitions_numpy(names)
+
+        # Assert: Same transitions, counts and first-seen key order
+        assert transitions == expected
+        assert list(counts.items()) == list(Counter(expected).items())
+
+    def test_long_session_without_numpy_uses_counter_path(
+        self, create_session, create_span, monkeypatch
+    ):
+        """Test long sessions still get transitions when numpy is unavailable."""
+        from metrics_computation_engine.entities.transformers import (
+            session_enrichers,
+        )
+
+        monkeypatch.setattr(session_enrichers, "np", None)
+        transformer = AgentTransitionTransformer()
+        names = ["AgentA", "AgentB"] * 300
+        spans = [
+            create_span(
+                span_id=f"s{i}",
+                raw_span_data={"Events.Attributes": [{"agent_name": name}]},
+            )
+            for i, name in enumerate(names)
+        ]
+
+        session = create_session(session_id="test", spans=spans)
+
+        # Execute
+        result = transformer.extract(session)
+
+        # Assert: Every alternation is a transition
+        assert len(result["agent_transitions"]) == len(names) - 1
+        assert result["agent_transition_counts"]["AgentA -> AgentB"] == 300
+
 
 # ============================================================================
 # TEST CLASS 3: CONVERSATION DATA TRANSFORMER
@@ -526,6 +596,24 @@ class TestExecutionTreeTransformer:
         # Should have hierarchy summary
         assert "hierarchy_summary" in result
 
+    def test_build_with_parent_cycle(self, create_span):
+        """Test spans whose parent links form a loop stay in the tree once."""
+        spans = [
+            create_span(span_id="root", parent_span_id=None),
+            create_span(span_id="a", parent_span_id="b"),
+            create_span(span_id="b", parent_span_id="a"),
+            create_span(span_id="c", parent_span_id="c"),
+            create_span(span_id="leaf", parent_span_id="a"),
+        ]
+
+        tree = build_execution_tree(spans)
+
+        # Assert: Every span reached exactly once from the roots
+        assert tree.get_total_flows() == len(spans)
+        root_ids = {root.span.span_id for root in tree.traces["trace-1"]}
+        assert {"root", "a", "c"} == root_ids
+        assert tree.all_nodes["c"].children == []
+
     def test_build_with_empty_session(self, create_session):
         """Test building tree with no spans."""
         transformer = ExecutionTreeTransformer()
@@ -653,6 +741,9 @@ class TestTransformerIntegration:
         # Should have conversation data
         assert hasattr(enriched, "conversation_data")
 
+        # Spans are shared with the original session, not copied
+        assert all(a is b for a, b in zip(enriched.spans, spans))
+
     def test_chained_transformers_preserve_data(self, create_session, create_span):
         """Test that chained transformers preserve all data."""
         # Create simple pipeline
@@ -66,6 +66,13 @@ class TestMetricLoading:
         assert metric_name == "AgentToAgentInteractions"
         assert metric_class == NATIVE_METRICS["AgentToAgentInteractions"]
 
+    def test_native_metrics_resolve_to_classes(self):
+        """Test that lazily imported native metrics map names to their classes."""
+        from metrics_computation_engine.metrics.session import CyclesCount
+
+        assert NATIVE_METRICS["Cycles"] is CyclesCount
+        assert get_metric_class("Cycles") == (CyclesCount, "Cycles")
+
     def test_get_all_available_metrics(self):
         """Test getting all available metrics with metadata."""
         # Execute
@@ -315,6 +322,19 @@ class TestCacheManagement:
         # (The function sets globals to None, hard to assert directly)
         assert True  # If we got here, no exception was raised
 
+    def test_get_metric_class_memoized_until_cleared(self):
+        """Test resolved metric classes are reused until the cache is cleared."""
+        clear_metrics_cache()
+
+        first = get_metric_class("AgentToAgentInteractions")
+        second = get_metric_class("AgentToAgentInteractions")
+
+        assert first == second
+        assert get_metric_class.cache_info().hits == 1
+
+        clear_metrics_cache()
+        assert get_metric_class.cache_info().currsize == 0
+
     def test_cache_invalidation_workflow(self):
         """Test that cache can be cleared and reloaded."""
         # Get metrics (populates cache)
@@ -436,6 +456,91 @@ class TestUtilEdgeCases:
         assert "1" in result[0]
         assert "name" in result[0]
 
+    def test_format_return_stringifies_nested_keys(self):
+        """Test format_return converts non-string keys inside results."""
+        result_obj = MetricResult(
+            metric_name="Test",
+            value={1: "first"},
+            aggregation_level="session",
+            category="test",
+            app_name="test-app",
+            success=True,
+            metadata={"counts": {2: 3}},
+        )
+
+        formatted = format_return({"session_metrics": [result_obj]})
+
+        session_result = formatted["session_metrics"][0]
+        assert session_result["value"] == {"1": "first"}
+        assert session_result["metadata"] == {"counts": {"2": 3}}
+
+    def test_format_return_does_not_share_containers(self):
+        """Test formatted results do not alias the results' containers."""
+        result_obj = MetricResult(
+            metric_name="Test",
+            value=1,
+            aggregation_level="session",
+            category="test",
+            app_name="test-app",
+            span_id=["span-1"],
+            metadata={"nested": {"key": "value"}},
+        )
+
+        formatted = format_return({"session_metrics": [result_obj]})
+
+        session_result = formatted["session_metrics"][0]
+        assert session_result["span_id"] == ["span-1"]
+        assert session_result["span_id"] is not result_obj.span_id
+        assert session_result["metadata"]["nested"] is not result_obj.metadata["nested"]
+
+    def test_format_return_keeps_values_and_python_key_names(self):
+        """Test format_return only stringifies keys, leaving values untouched."""
+        from datetime import datetime
+
+        stamp = datetime(2024, 1, 1)
+        result_obj = MetricResult(
+            metric_name="Test",
+            value=float("nan"),
+            aggregation_level="session",
+            category="test",
+            app_name="test-app",
+            success=True,
+            metadata={True: stamp, None: float("inf")},
+        )
+
+        formatted = format_return({"session_metrics": [result_obj]})
+
+        session_result = formatted["session_metrics"][0]
+        assert session_result["value"] != session_result["value"]  # NaN
+        assert session_result["metadata"] == {"True": stamp, "None": float("inf")}
+
+    def test_format_return_converts_nested_dataclasses(self):
+        """Test dataclasses nested in result fields become plain dicts."""
+        from dataclasses import dataclass
+
+        @dataclass
+        class Stage:
+            name: str
+            scores: dict
+
+        result_obj = MetricResult(
+            metric_name="Test",
+            value=1.0,
+            aggregation_level="session",
+            category="test",
+            app_name="test-app",
+            success=True,
+            metadata={"stages": [Stage("plan", {1: 0.5})], "last": Stage("act", {})},
+        )
+
+        formatted = format_return({"session_metrics": [result_obj]})
+
+        metadata = formatted["session_metrics"][0]["metadata"]
+        assert metadata == {
+            "stages": [{"name": "plan", "scores": {"1": 0.5}}],
+            "last": {"name": "act", "scores": {}},
+        }
+
     def test_format_return_with_dataclass_results(self):
         """Test format_return handles dataclass objects."""
         # MetricResult is a dataclass
@@ -1,36 +1,20 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import importlib
 import json
 from functools import lru_cache
 from importlib.metadata import entry_points
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from typing import Any, Dict, List, Tuple, Optional
 from fastapi import HTTPException
 
 from metrics_computation_engine.dal.api_client import (
     get_all_session_ids,
-    get_traces_by_session,
     get_traces_by_session_ids,
 )
 
-from metrics_computation_engine.metrics.population import (
-    GraphDeterminismScore,
-)
-
-from metrics_computation_engine.metrics.span import (
-    ToolUtilizationAccuracy,
-)
-
-from metrics_computation_engine.metrics.session import (
-    AgentToAgentInteractions,
-    AgentToToolInteractions,
-    CyclesCount,
-    ToolErrorRate,
-    PassiveEvalApp,
-    PassiveEvalAgents,
-)
-
 from metrics_computation_engine.processor import MetricsProcessor
 from metrics_computation_engine.registry import MetricRegistry
 from metrics_computation_engine.models.requests import (
@@ -42,17 +26,57 @@ from metrics_computation_engine.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-NATIVE_METRICS = {
-    "AgentToAgentInteractions": AgentToAgentInteractions,
-    "AgentToToolInteractions": AgentToToolInteractions,
-    "Cycles": CyclesCount,
-    "ToolErrorRate": ToolErrorRate,
-    "ToolUtilizationAccuracy": ToolUtilizationAccuracy,
-    "GraphDeterminismScore": GraphDeterminismScore,
-    "PassiveEvalApp": PassiveEvalApp,
-    "PassiveEvalAgents": PassiveEvalAgents,
+# Native metric name -> (module, class name); the modules are only imported
+# once a metric is looked up, see _native_metrics()
+_NATIVE_METRIC_PATHS = {
+    "AgentToAgentInteractions": (
+        "metrics_computation_engine.metrics.session.agent_to_agent_interactions",
+        "AgentToAgentInteractions",
+    ),
+    "AgentToToolInteractions": (
+        "metrics_computation_engine.metrics.session.agent_to_tool_interactions",
+        "AgentToToolInteractions",
+    ),
+    "Cycles": ("metrics_computation_engine.metrics.session.cycles", "CyclesCount"),
+    "ToolErrorRate": (
+        "metrics_computation_engine.metrics.session.tool_error_rate",
+        "ToolErrorRate",
+    ),
+    "ToolUtilizationAccuracy": (
+        "metrics_computation_engine.metrics.span.tool_utilization_accuracy",
+        "ToolUtilizationAccuracy",
+    ),
+    "GraphDeterminismScore": (
+        "metrics_computation_engine.metrics.population.graph_determinism_score",
+        "GraphDeterminismScore",
+    ),
+    "PassiveEvalApp": (
+        "metrics_computation_engine.metrics.session.passive_eval_app",
+        "PassiveEvalApp",
+    ),
+    "PassiveEvalAgents": (
+        "metrics_computation_engine.metrics.session.passive_eval_agents",
+        "PassiveEvalAgents",
+    ),
 }
 
+
+@lru_cache(maxsize=1)
+def _native_metrics() -> Dict[str, Any]:
+    """Import the native metric modules and map metric names to their classes."""
+    return {
+        name: getattr(importlib.import_module(module), class_name)
+        for name, (module, class_name) in _NATIVE_METRIC_PATHS.items()
+    }
+
+
+def __getattr__(name: str) -> Any:
+    # NATIVE_METRICS is resolved on first access so importing this module does
+    # not pull in every metric (and networkx/numba with them)
+    if name == "NATIVE_METRICS":
+        return _native_metrics()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Cache for all available metrics (native + plugins)
 _ALL_METRICS_CACHE = None
 
@@ -99,7 +123,7 @@ def get_all_metric_classes():
 
     if _ALL_METRICS_CACHE is None:
         # Start with native metrics
-        _ALL_METRICS_CACHE = NATIVE_METRICS.copy()
+        _ALL_METRICS_CACHE = _native_metrics().copy()
 
         # Get entry points for our plugin group
         try:
@@ -119,10 +143,12 @@ def get_all_metric_classes():
     return _ALL_METRICS_CACHE
 
 
+@lru_cache(maxsize=256)
 def get_metric_class(metric_name: str) -> Tuple[Any, str]:
     """
     Dynamically import a class from a string.
     Include both native and plugin metrics, as well as adapter-based metrics.
+    Resolved names are memoized until clear_metrics_cache() is called.
 
     Args:
         metric_name: Either a simple name or a dotted path like 'deepeval.metrics.AnswerRelevancyMetric'
@@ -132,7 +158,7 @@ def get_metric_class(metric_name: str) -> Tuple[Any, str]:
     """
     # First, try to get from direct plugin/native metrics
     all_metrics = get_all_metric_classes()
-    metric_key = metric_name.split(".")[-1]
+    metric_key = metric_name.rsplit(".", 1)[-1]
 
     # Check if it's a direct match in our registered metrics
     if metric_key in all_metrics:
@@ -269,16 +295,30 @@ def stringify_keys(obj):
         return {str(k): stringify_keys(v) for k, v in obj.items()}
     elif isinstance(obj, list):
         return [stringify_keys(i) for i in obj]
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        return stringify_keys(_shallow_asdict(obj))
     else:
         return obj
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _shallow_asdict(obj) -> Dict[str, Any]:
+    # Field values are shared, not deep-copied as asdict() does; format_return
+    # rebuilds every nested container, and converts nested dataclasses, when
+    # stringifying keys anyway
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+
 def format_return(results):
     formatted_results = {}
 
     for metric_category, metric_results in results.items():
         formatted_results[metric_category] = [
-            asdict(r) if is_dataclass(r) else r for r in metric_results
+            _shallow_asdict(r) if is_dataclass(r) else r for r in metric_results
         ]
 
     return stringify_keys(formatted_results)
@@ -292,6 +332,9 @@ def clear_metrics_cache():
     global _ALL_METRICS_CACHE, _METRIC_ADAPTERS_CACHE
     _ALL_METRICS_CACHE = None
     _METRIC_ADAPTERS_CACHE = None
+    get_all_metric_classes.cache_clear()
+    get_metric_adapters.cache_clear()
+    get_metric_class.cache_clear()
 
 
 def get_all_available_metrics():
@@ -301,7 +344,7 @@ def get_all_available_metrics():
     metrics = {}
 
     # Add native metrics
-    for name, metric_class in NATIVE_METRICS.items():
+    for name, metric_class in _native_metrics().items():
         try:
             # Create instance to get metadata
             instance = metric_class()
@@ -515,9 +558,13 @@ async def compute(
             logger.warning("No sessions found matching the batch configuration")
             return {"metrics": [], "results": {}}
 
-        # Load traces for each session individually
-        for session_id in session_ids:
-            traces_by_session[session_id] = get_traces_by_session(session_id)
+        # Load traces for all selected sessions through the batched endpoint
+        traces_by_session, notfound_session_ids = await asyncio.to_thread(
+            get_traces_by_session_ids, session_ids
+        )
+
+        if notfound_session_ids:
+            logger.warning(f"Sessions not found: {notfound_session_ids}")
     else:
         # Use specific session IDs
         session_ids = data_fetching_config.get_session_ids()